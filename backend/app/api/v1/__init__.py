@@ -0,0 +1,13 @@
+"""
+API v1 routers.
+"""
+from fastapi import APIRouter
+
+from app.api.v1.endpoints import races, profiles, streams
+
+api_router = APIRouter()
+api_router.include_router(races.router)
+api_router.include_router(profiles.router)
+api_router.include_router(streams.router)
+
+__all__ = ["api_router"]
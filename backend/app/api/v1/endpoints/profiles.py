@@ -0,0 +1,211 @@
+"""
+Horse / jockey / trainer profile endpoints.
+말 / 기수 / 조교사 프로필 조회 API
+"""
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.pagination import decode_cursor, encode_cursor, page, page_limit
+from app.core.cache import PROFILE_TAG, cached_json
+from app.db.session import get_db
+from app.models import Race, RaceEntry, Horse, Jockey, Trainer
+
+router = APIRouter(tags=["profiles"])
+
+HORSE_COLUMNS = (
+    Horse.id,
+    Horse.registration_number,
+    Horse.name_ko,
+    Horse.name_en,
+    Horse.birth_date,
+    Horse.gender,
+    Horse.origin_country,
+    Horse.father_name,
+    Horse.mother_name,
+    Horse.owner_name,
+    Horse.rating,
+    Horse.total_races,
+    Horse.total_wins,
+    Horse.total_places,
+    Horse.total_shows,
+    Horse.total_earnings,
+)
+
+JOCKEY_COLUMNS = (
+    Jockey.id,
+    Jockey.license_number,
+    Jockey.name_ko,
+    Jockey.name_en,
+    Jockey.birth_date,
+    Jockey.debut_date,
+    Jockey.weight_kg,
+    Jockey.total_races,
+    Jockey.total_wins,
+    Jockey.win_rate,
+    Jockey.place_rate,
+)
+
+TRAINER_COLUMNS = (
+    Trainer.id,
+    Trainer.license_number,
+    Trainer.name_ko,
+    Trainer.name_en,
+    Trainer.stable_name,
+    Trainer.total_horses,
+    Trainer.total_wins,
+    Trainer.win_rate,
+)
+
+HISTORY_COLUMNS = (
+    RaceEntry.id,
+    RaceEntry.race_id,
+    Race.race_date,
+    Race.race_number,
+    Race.race_track_id,
+    Race.distance,
+    Race.track_condition,
+    RaceEntry.gate_number,
+    RaceEntry.horse_id,
+    RaceEntry.jockey_id,
+    RaceEntry.trainer_id,
+    RaceEntry.final_odds,
+    RaceEntry.finish_position,
+    RaceEntry.finish_time,
+    RaceEntry.scratched,
+)
+
+
+async def _get_profile(db: AsyncSession, model, columns, entity_id: int) -> Optional[dict]:
+    stmt = select(*columns).where(model.id == entity_id)
+    row = (await db.execute(stmt)).mappings().one_or_none()
+    return dict(row) if row is not None else None
+
+
+async def _entry_history(
+    db: AsyncSession,
+    column,
+    entity_id: int,
+    cursor: Optional[str],
+    size: int
+) -> dict:
+    """Race entries for a horse/jockey/trainer, newest first, keyset paginated."""
+    stmt = (
+        select(*HISTORY_COLUMNS)
+        .join(Race, (Race.id == RaceEntry.race_id) & (Race.race_date == RaceEntry.race_date))
+        .where(column == entity_id)
+    )
+    # Entry id breaks ties: a jockey/trainer can have several runners in a race
+    if cursor:
+        last_date, last_race_id, last_entry_id = decode_cursor(cursor, date, int, int)
+        stmt = stmt.where(
+            tuple_(RaceEntry.race_date, RaceEntry.race_id, RaceEntry.id)
+            < tuple_(last_date, last_race_id, last_entry_id)
+        )
+    stmt = stmt.order_by(
+        RaceEntry.race_date.desc(), RaceEntry.race_id.desc(), RaceEntry.id.desc()
+    ).limit(size + 1)
+
+    rows = [dict(row) for row in (await db.execute(stmt)).mappings()]
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        last = rows[-1]
+        next_cursor = encode_cursor(last["race_date"], last["race_id"], last["id"])
+    return page(rows, size, next_cursor)
+
+
+@router.get("/horses/{horse_id}")
+async def get_horse(
+    request: Request,
+    horse_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Get a horse profile."""
+    return await cached_json(
+        request,
+        lambda: _get_profile(db, Horse, HORSE_COLUMNS, horse_id),
+        tags=[f"horse:{horse_id}", PROFILE_TAG],
+    )
+
+
+@router.get("/horses/{horse_id}/entries")
+async def list_horse_entries(
+    request: Request,
+    horse_id: int,
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """List a horse's race entries, newest first."""
+    size = page_limit(limit)
+    return await cached_json(
+        request,
+        lambda: _entry_history(db, RaceEntry.horse_id, horse_id, cursor, size),
+        tags=[f"horse:{horse_id}", PROFILE_TAG],
+    )
+
+
+@router.get("/jockeys/{jockey_id}")
+async def get_jockey(
+    request: Request,
+    jockey_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Get a jockey profile."""
+    return await cached_json(
+        request,
+        lambda: _get_profile(db, Jockey, JOCKEY_COLUMNS, jockey_id),
+        tags=[f"jockey:{jockey_id}", PROFILE_TAG],
+    )
+
+
+@router.get("/jockeys/{jockey_id}/entries")
+async def list_jockey_entries(
+    request: Request,
+    jockey_id: int,
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """List a jockey's rides, newest first."""
+    size = page_limit(limit)
+    return await cached_json(
+        request,
+        lambda: _entry_history(db, RaceEntry.jockey_id, jockey_id, cursor, size),
+        tags=[f"jockey:{jockey_id}", PROFILE_TAG],
+    )
+
+
+@router.get("/trainers/{trainer_id}")
+async def get_trainer(
+    request: Request,
+    trainer_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Get a trainer profile."""
+    return await cached_json(
+        request,
+        lambda: _get_profile(db, Trainer, TRAINER_COLUMNS, trainer_id),
+        tags=[f"trainer:{trainer_id}", PROFILE_TAG],
+    )
+
+
+@router.get("/trainers/{trainer_id}/entries")
+async def list_trainer_entries(
+    request: Request,
+    trainer_id: int,
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """List a trainer's race entries, newest first."""
+    size = page_limit(limit)
+    return await cached_json(
+        request,
+        lambda: _entry_history(db, RaceEntry.trainer_id, trainer_id, cursor, size),
+        tags=[f"trainer:{trainer_id}", PROFILE_TAG],
+    )
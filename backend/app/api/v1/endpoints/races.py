@@ -0,0 +1,147 @@
+"""
+Race read endpoints.
+경주 조회 API
+"""
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.pagination import decode_cursor, encode_cursor, page, page_limit
+from app.core.cache import cached_json
+from app.db.session import get_db
+from app.models import Race, RaceTrack, RaceEntry, Horse, Jockey, Trainer
+from app.services.baseline_service import get_baseline
+
+router = APIRouter(prefix="/races", tags=["races"])
+
+RACE_COLUMNS = (
+    Race.id,
+    Race.race_track_id,
+    RaceTrack.name_ko.label("track_name"),
+    Race.race_date,
+    Race.race_number,
+    Race.race_name,
+    Race.race_class,
+    Race.distance,
+    Race.surface_type,
+    Race.weather,
+    Race.track_condition,
+    Race.race_status,
+    Race.start_time,
+)
+
+ENTRY_COLUMNS = (
+    RaceEntry.id,
+    RaceEntry.gate_number,
+    RaceEntry.horse_id,
+    Horse.name_ko.label("horse_name"),
+    RaceEntry.jockey_id,
+    Jockey.name_ko.label("jockey_name"),
+    RaceEntry.trainer_id,
+    Trainer.name_ko.label("trainer_name"),
+    RaceEntry.horse_weight_kg,
+    RaceEntry.handicap_weight_kg,
+    RaceEntry.morning_odds,
+    RaceEntry.final_odds,
+    RaceEntry.popularity_rank,
+    RaceEntry.finish_position,
+    RaceEntry.finish_time,
+    RaceEntry.scratched,
+)
+
+
+@router.get("")
+async def list_races(
+    request: Request,
+    race_date: date = Query(..., description="경주 날짜 (YYYY-MM-DD)"),
+    track_id: Optional[int] = Query(None, description="경마장 ID"),
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """List races for a date, ordered by track and race number."""
+    size = page_limit(limit)
+
+    async def build():
+        stmt = (
+            select(*RACE_COLUMNS)
+            .join(RaceTrack, RaceTrack.id == Race.race_track_id)
+            .where(Race.race_date == race_date)
+        )
+        if track_id is not None:
+            stmt = stmt.where(Race.race_track_id == track_id)
+        if cursor:
+            last_track_id, last_race_number = decode_cursor(cursor, int, int)
+            stmt = stmt.where(
+                tuple_(Race.race_track_id, Race.race_number)
+                > tuple_(last_track_id, last_race_number)
+            )
+        stmt = stmt.order_by(Race.race_track_id, Race.race_number).limit(size + 1)
+
+        rows = [dict(row) for row in (await db.execute(stmt)).mappings()]
+        next_cursor = None
+        if len(rows) > size:
+            rows = rows[:size]
+            next_cursor = encode_cursor(rows[-1]["race_track_id"], rows[-1]["race_number"])
+        return page(rows, size, next_cursor)
+
+    return await cached_json(request, build, tags=[f"date:{race_date}"])
+
+
+@router.get("/{race_id}")
+async def get_race(
+    request: Request,
+    race_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Get a race with its entries (horse/jockey/trainer names included)."""
+
+    async def build():
+        race_stmt = (
+            select(*RACE_COLUMNS)
+            .join(RaceTrack, RaceTrack.id == Race.race_track_id)
+            .where(Race.id == race_id)
+        )
+        race = (await db.execute(race_stmt)).mappings().one_or_none()
+        if race is None:
+            return None
+
+        entry_stmt = (
+            select(*ENTRY_COLUMNS)
+            .join(Horse, Horse.id == RaceEntry.horse_id)
+            .join(Jockey, Jockey.id == RaceEntry.jockey_id)
+            .join(Trainer, Trainer.id == RaceEntry.trainer_id)
+            .where(RaceEntry.race_id == race_id, RaceEntry.race_date == race["race_date"])
+            .order_by(RaceEntry.gate_number)
+        )
+        entries = [dict(row) for row in (await db.execute(entry_stmt)).mappings()]
+        return {**race, "entries": entries}
+
+    return await cached_json(
+        request,
+        build,
+        tags=lambda data: [f"race:{race_id}", f"date:{data['race_date']}"],
+    )
+
+
+@router.get("/{race_id}/baseline")
+async def get_race_baseline(
+    request: Request,
+    race_id: int,
+    top: int = Query(20, ge=1, le=3360, description="Combinations per exotic book"),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Odds-implied win probabilities and Harville exotic books for a race."""
+
+    async def build():
+        book = await get_baseline(db, race_id)
+        return book.to_dict(top=top) if book is not None else None
+
+    return await cached_json(
+        request,
+        build,
+        tags=lambda data: [f"race:{race_id}", f"date:{data['race_date']}"],
+    )
@@ -0,0 +1,68 @@
+"""
+Race event streams (SSE / WebSocket).
+경주 이벤트 실시간 스트림
+"""
+import asyncio
+import logging
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.pubsub import race_events
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/races", tags=["streams"])
+
+KEEPALIVE_FRAME = b": keep-alive\n\n"
+
+
+@router.get("/{race_id}/events")
+async def stream_race_events(request: Request, race_id: int) -> StreamingResponse:
+    """Server-sent events for odds, scratch and prediction changes of a race."""
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        async with race_events.subscribe(race_id) as queue:
+            yield b"retry: 3000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(),
+                        timeout=settings.EVENT_STREAM_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield KEEPALIVE_FRAME
+                    continue
+                yield event.sse_frame
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/{race_id}/ws")
+async def race_events_websocket(websocket: WebSocket, race_id: int) -> None:
+    """WebSocket feed of a race's events (JSON envelopes)."""
+    await websocket.accept()
+    async with race_events.subscribe(race_id) as queue:
+
+        async def forward() -> None:
+            while True:
+                event = await queue.get()
+                await websocket.send_text(event.envelope.decode())
+
+        forwarder = asyncio.create_task(forward())
+        try:
+            # Clients do not send anything; reading only detects disconnects
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+        except WebSocketDisconnect:
+            pass
+        finally:
+            forwarder.cancel()
@@ -0,0 +1,69 @@
+"""
+Keyset (cursor) pagination helpers.
+키셋 페이지네이션 유틸리티
+"""
+import base64
+from datetime import date
+from typing import Any, List, Optional
+
+import orjson
+from fastapi import HTTPException
+
+from app.core.config import settings
+
+
+def page_limit(limit: Optional[int]) -> int:
+    """Clamp a requested page size to DEFAULT_PAGE_SIZE / MAX_PAGE_SIZE."""
+    if limit is None:
+        return settings.DEFAULT_PAGE_SIZE
+    return max(1, min(limit, settings.MAX_PAGE_SIZE))
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last returned row as an opaque cursor."""
+    payload = [v.isoformat() if isinstance(v, date) else v for v in values]
+    return base64.urlsafe_b64encode(orjson.dumps(payload)).decode().rstrip("=")
+
+
+def _cursor_value(value: Any, kind: type) -> Any:
+    if kind is date:
+        return date.fromisoformat(value) if isinstance(value, str) else None
+    if kind is int and isinstance(value, bool):
+        return None
+    return value if isinstance(value, kind) else None
+
+
+def decode_cursor(cursor: str, *kinds: type) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string
+        kinds: Expected type of each key value (``int``, ``str`` or ``date``)
+
+    Returns:
+        List of key values, converted to the expected types
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or a value has the wrong type
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = orjson.loads(base64.urlsafe_b64decode(padded))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != len(kinds):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    try:
+        decoded = [_cursor_value(value, kind) for value, kind in zip(values, kinds)]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if any(value is None for value in decoded):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return decoded
+
+
+def page(items: List[Any], limit: Optional[int], next_cursor: Optional[str]) -> dict:
+    """Build the standard page envelope."""
+    return {"items": items, "limit": limit, "next_cursor": next_cursor}
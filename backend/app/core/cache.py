@@ -0,0 +1,268 @@
+"""
+Redis-backed response cache with ETag support.
+Redis 응답 캐시 (ETag / 304 지원)
+"""
+import hashlib
+import logging
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Iterable, Optional, Tuple, Union
+
+import orjson
+import redis.asyncio as aioredis
+from fastapi import HTTPException, Request, Response
+from redis.exceptions import RedisError, WatchError
+
+from app.core.config import settings
+from app.db.session import replica_lag_seconds
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "resp:"
+TAG_PREFIX = "tag:"
+
+# Invalidation counter; each invalidated tag records the value and the Redis
+# time it was dropped at, so a response built across an invalidation, or read
+# from a replica that may not have replayed it yet, is never stored
+EPOCH_KEY = "resp:epoch"
+TAG_VERSION_PREFIX = "tagver:"
+TAG_VERSION_TTL_SECONDS = 3600  # outlives any response build
+
+# Horse/jockey/trainer profiles aggregate results; dropped on every results sync
+PROFILE_TAG = "profiles"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Serialized response body and its ETag."""
+    etag: str
+    body: bytes
+
+
+def make_etag(body: bytes) -> str:
+    """Build a strong ETag from the response body."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+class ResponseCache:
+    """
+    Response cache stored as Redis hashes, grouped by invalidation tags.
+
+    Every cached key is also added to one Redis set per tag (e.g. ``date:2026-01-03``,
+    ``race:12``) so sync events can drop all affected responses at once.
+    """
+
+    def __init__(self, redis_url: str):
+        self.redis_url = redis_url
+        self._redis: Optional[aioredis.Redis] = None
+
+    @property
+    def redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = aioredis.from_url(self.redis_url)
+        return self._redis
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        try:
+            data = await self.redis.hgetall(KEY_PREFIX + key)
+        except RedisError as e:
+            logger.warning(f"Response cache read failed: {str(e)}")
+            return None
+        if not data:
+            return None
+        return CachedResponse(etag=data[b"etag"].decode(), body=data[b"body"])
+
+    async def snapshot(self) -> Optional[Tuple[int, float]]:
+        """Current invalidation epoch and Redis time (None if Redis is unavailable)."""
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.get(EPOCH_KEY)
+                pipe.time()
+                epoch, (seconds, micros) = await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Response cache read failed: {str(e)}")
+            return None
+        return int(epoch or 0), seconds + micros / 1_000_000
+
+    async def set(
+        self,
+        key: str,
+        cached: CachedResponse,
+        tags: Iterable[str],
+        ttl: int,
+        since_epoch: Optional[int] = None,
+        settled_before: Optional[float] = None
+    ) -> bool:
+        """
+        Store a response under its tags.
+
+        Args:
+            key: Cache key
+            cached: Response to store
+            tags: Invalidation tags
+            ttl: Lifetime in seconds
+            since_epoch: Epoch read before the response was built; the write is
+                skipped if any of its tags was invalidated after that
+            settled_before: Redis time before which every change is known to be
+                visible to ``build``; the write is also skipped if any of its tags
+                was invalidated after that (e.g. within the replica's lag)
+
+        Returns:
+            True if stored
+        """
+        tags = list(tags)
+        redis_key = KEY_PREFIX + key
+        version_keys = [TAG_VERSION_PREFIX + tag for tag in tags]
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                if since_epoch is not None and version_keys:
+                    # WATCH makes an invalidation racing this write abort it
+                    await pipe.watch(*version_keys)
+                    versions = await pipe.mget(*version_keys)
+                    for version in filter(None, versions):
+                        epoch, _, invalidated_at = version.partition(b":")
+                        if int(epoch) > since_epoch or (
+                            settled_before is not None and float(invalidated_at or 0) > settled_before
+                        ):
+                            logger.debug(f"Response {key} may predate an invalidation, not caching")
+                            return False
+                    pipe.multi()
+                pipe.hset(redis_key, mapping={"etag": cached.etag, "body": cached.body})
+                pipe.expire(redis_key, ttl)
+                for tag in tags:
+                    pipe.sadd(TAG_PREFIX + tag, redis_key)
+                    pipe.expire(TAG_PREFIX + tag, ttl)
+                await pipe.execute()
+            return True
+        except WatchError:
+            logger.debug(f"Response {key} invalidated while storing, not caching")
+            return False
+        except RedisError as e:
+            logger.warning(f"Response cache write failed: {str(e)}")
+            return False
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """
+        Drop every cached response carrying any of the given tags.
+
+        Args:
+            tags: Invalidation tags (e.g. ``date:2026-01-03``, ``race:12``)
+        """
+        if not tags:
+            return
+        try:
+            tag_keys = [TAG_PREFIX + tag for tag in tags]
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.incr(EPOCH_KEY)
+                pipe.time()
+                epoch, (seconds, micros) = await pipe.execute()
+            version = f"{epoch}:{seconds}.{micros:06d}"
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for tag in tags:
+                    pipe.set(TAG_VERSION_PREFIX + tag, version, ex=TAG_VERSION_TTL_SECONDS)
+                for tag_key in tag_keys:
+                    pipe.smembers(tag_key)
+                members = (await pipe.execute())[len(tags):]
+
+            keys = set(tag_keys)
+            for member_set in members:
+                keys.update(member_set)
+            await self.redis.delete(*keys)
+            logger.info(f"Response cache invalidated: {', '.join(tags)}")
+        except RedisError as e:
+            logger.warning(f"Response cache invalidation failed: {str(e)}")
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+# Singleton instance
+response_cache = ResponseCache(settings.REDIS_URL)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize response data with orjson (Decimal-aware)."""
+    return orjson.dumps(data, default=_json_default)
+
+
+def _cache_key(request: Request) -> str:
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    return f"{request.url.path}?{query}"
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in [tag.strip() for tag in header.split(",")]
+
+
+def _build_response(request: Request, cached: CachedResponse, hit: bool) -> Response:
+    # Syncs invalidate Redis, not shared caches: clients and proxies must
+    # revalidate every time (a matching ETag costs a 304)
+    headers = {
+        "ETag": cached.etag,
+        "Cache-Control": "no-cache",
+        "X-Cache": "HIT" if hit else "MISS",
+    }
+    if _etag_matches(request, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+async def cached_json(
+    request: Request,
+    build: Callable[[], Awaitable[Optional[Any]]],
+    tags: Union[Iterable[str], Callable[[Any], Iterable[str]]],
+    ttl: int = settings.RESPONSE_CACHE_TTL_SECONDS
+) -> Response:
+    """
+    Serve a JSON response from the cache, building and storing it on a miss.
+    캐시된 JSON 응답 반환 (미스 시 생성 후 저장)
+
+    ``build`` may read from the replica. A response is served but not stored
+    when its tags were invalidated while it was being built or within the
+    replica's lag before that, or when the replica lags more than
+    REPLICA_MAX_CACHE_LAG_SECONDS, so it cannot outlive the change that
+    invalidated it.
+
+    Args:
+        request: Incoming request (path and query form the cache key)
+        build: Coroutine function producing the response data; None means 404
+        tags: Invalidation tags, or a function deriving them from the built data
+        ttl: Cache lifetime in seconds
+
+    Returns:
+        200 response with ETag, or 304 if the client copy is current
+    """
+    key = _cache_key(request)
+    cached = await response_cache.get(key)
+    if cached is not None:
+        return _build_response(request, cached, hit=True)
+
+    snapshot = await response_cache.snapshot()
+    lag = await replica_lag_seconds()
+    data = await build()
+    if data is None:
+        raise HTTPException(status_code=404, detail="Not found")
+
+    body = dumps(data)
+    cached = CachedResponse(etag=make_etag(body), body=body)
+    if callable(tags):
+        tags = tags(data)
+    if lag is None or lag > settings.REPLICA_MAX_CACHE_LAG_SECONDS:
+        logger.debug(f"Replica lag {lag}s over the cache bound, not caching {key}")
+    elif snapshot is not None:
+        epoch, started_at = snapshot
+        await response_cache.set(
+            key, cached, tags, ttl, since_epoch=epoch, settled_before=started_at - lag
+        )
+    return _build_response(request, cached, hit=False)
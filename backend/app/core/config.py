@@ -1,7 +1,8 @@
 """
 Application configuration settings using Pydantic Settings.
 """
-from typing import List
+from datetime import time
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -19,12 +20,49 @@ class Settings(BaseSettings):
         ...,
         description="PostgreSQL database URL with asyncpg driver"
     )
+    DATABASE_REPLICA_URL: Optional[str] = Field(
+        default=None,
+        description="Read replica URL for get_db reads (primary if unset)"
+    )
+    DB_PRIMARY_POOL_SIZE: int = Field(default=10, description="Primary pool size")
+    DB_PRIMARY_MAX_OVERFLOW: int = Field(default=10, description="Primary pool overflow")
+    DB_REPLICA_POOL_SIZE: int = Field(default=20, description="Replica pool size")
+    DB_REPLICA_MAX_OVERFLOW: int = Field(default=20, description="Replica pool overflow")
+    DB_POOL_TIMEOUT: int = Field(default=30, description="Pool checkout timeout in seconds")
+    REPLICA_MAX_CACHE_LAG_SECONDS: float = Field(
+        default=5.0,
+        description="Responses read from a replica lagging more than this are not cached"
+    )
+
+    # TimescaleDB (race_entries / predictions hypertables)
+    HISTORY_CHUNK_INTERVAL_DAYS: int = Field(
+        default=28,
+        description="Hypertable chunk interval in days"
+    )
+    HISTORY_COMPRESS_AFTER_DAYS: int = Field(
+        default=365,
+        description="Compress chunks older than this many days"
+    )
 
     # Redis
     REDIS_URL: str = Field(
         default="redis://localhost:6379/0",
         description="Redis connection URL"
     )
+    RESPONSE_CACHE_TTL_SECONDS: int = Field(
+        default=300,
+        description="Default lifetime of cached API responses"
+    )
+
+    # Race event streaming (SSE / WebSocket)
+    EVENT_QUEUE_SIZE: int = Field(
+        default=100,
+        description="Buffered events per subscriber before the oldest is dropped"
+    )
+    EVENT_STREAM_KEEPALIVE_SECONDS: int = Field(
+        default=15,
+        description="SSE keep-alive comment interval"
+    )
 
     # KRA API (한국마사회 공공데이터)
     KRA_API_KEY: str = Field(..., description="KRA API key from data.go.kr")
@@ -34,12 +72,76 @@ class Settings(BaseSettings):
     )
     KRA_API_TIMEOUT: int = Field(default=30, description="API timeout in seconds")
     KRA_API_MAX_RETRIES: int = Field(default=3, description="Max retry attempts")
+    KRA_API_RECORD_DIR: Optional[str] = Field(
+        default=None,
+        description="Record every KRA response here for the replay server"
+    )
 
     # Prediction Service
     PREDICTION_SERVICE_URL: str = Field(
         default="http://localhost:8001",
         description="LLM Prediction Service URL"
     )
+    PREDICTION_SERVICE_TIMEOUT: int = Field(
+        default=60,
+        description="Prediction request timeout in seconds"
+    )
+
+    # Job Queue (Postgres SKIP LOCKED workers)
+    JOB_LEASE_SECONDS: int = Field(default=60, description="Claim lease duration")
+    JOB_HEARTBEAT_SECONDS: int = Field(default=20, description="Lease renewal interval")
+    JOB_POLL_INTERVAL_SECONDS: float = Field(default=2.0, description="Idle poll interval")
+    JOB_MAX_ATTEMPTS: int = Field(default=5, description="Attempts before a job fails")
+    JOB_BACKOFF_BASE_SECONDS: int = Field(default=30, description="First retry delay")
+    JOB_BACKOFF_MAX_SECONDS: int = Field(default=1800, description="Retry delay cap")
+    RACE_TIMEZONE: str = Field(default="Asia/Seoul", description="Timezone of race start times")
+    PREDICT_LEAD_MINUTES: int = Field(default=30, description="Predict this long before start")
+    RESULTS_RESYNC_DELAY_MINUTES: int = Field(
+        default=10,
+        description="Resync results this long after start"
+    )
+
+    # Re-prediction (significance thresholds for changes since a prediction)
+    REPREDICT_ODDS_CHANGE_RATIO: float = Field(
+        default=0.25,
+        description="Relative odds move that makes a prediction stale"
+    )
+    REPREDICT_HORSE_WEIGHT_CHANGE_KG: float = Field(
+        default=6.0,
+        description="Horse body weight change that makes a prediction stale"
+    )
+    REPREDICT_HANDICAP_CHANGE_KG: float = Field(
+        default=1.0,
+        description="Handicap weight change that makes a prediction stale"
+    )
+    REPREDICT_DEBOUNCE_SECONDS: int = Field(
+        default=60,
+        description="Delay before re-predicting so bursts of changes coalesce"
+    )
+
+    # Warm-up (today's contexts and baseline books before serving traffic)
+    WARMUP_ENABLED: bool = Field(default=True, description="Warm caches at startup and daily")
+    WARMUP_CONCURRENCY: int = Field(default=8, description="Races warmed in parallel")
+    WARMUP_LOCAL_TIME: time = Field(
+        default=time(6, 30),
+        description="Daily re-warm time (race timezone), after the schedule sync"
+    )
+    WARMUP_RETRY_SECONDS: int = Field(default=60, description="Retry delay after a failed warm-up")
+
+    # Tracing (OpenTelemetry)
+    TRACING_ENABLED: bool = Field(default=True, description="Record request traces")
+    OTEL_EXPORTER_OTLP_ENDPOINT: Optional[str] = Field(
+        default=None,
+        description="OTLP/HTTP collector URL (e.g. http://localhost:4318); file export if unset"
+    )
+    TRACE_EXPORT_FILE: str = Field(
+        default="traces.jsonl",
+        description="Span export file when no collector is configured"
+    )
+    SLOW_REQUEST_THRESHOLD_MS: float = Field(
+        default=1000,
+        description="Log the span breakdown of requests slower than this"
+    )
 
     # Security
     SECRET_KEY: str = Field(..., description="Secret key for JWT encoding")
@@ -0,0 +1,222 @@
+"""
+Per-race event fan-out over Redis pub/sub.
+경주별 이벤트 (배당/예측 변경) Redis pub/sub 브로드캐스트
+
+Producers publish each change once to ``race:{race_id}``. Every API worker holds a
+single pattern subscription and fans messages out to its local SSE/WebSocket
+subscribers through in-memory queues, so subscribers never touch the database
+and Redis connections do not grow with the number of clients.
+"""
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
+
+import orjson
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.cache import dumps
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "race:"
+
+# Notices between processes; seen by listeners, not by clients
+INVALIDATE_EVENT = "invalidate"
+WARMUP_EVENT = "warmup"
+PROCESS_EVENTS = (INVALIDATE_EVENT, WARMUP_EVENT)
+
+# race_id of notices addressed to every process rather than about one race
+BROADCAST_RACE_ID = 0
+RECONNECT_DELAY_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class RaceEvent:
+    """Pre-serialized race event, shared by all subscribers."""
+    race_id: int
+    event: str
+    data: bytes
+    envelope: bytes
+
+    @property
+    def sse_frame(self) -> bytes:
+        return b"event: " + self.event.encode() + b"\ndata: " + self.data + b"\n\n"
+
+
+def _channel(race_id: int) -> str:
+    return f"{CHANNEL_PREFIX}{race_id}"
+
+
+async def publish_race_event(
+    redis: aioredis.Redis,
+    race_id: int,
+    event: str,
+    data: Any
+) -> int:
+    """
+    Publish a race event (e.g. ``odds``, ``scratch``, ``prediction``).
+
+    Args:
+        redis: Redis client
+        race_id: Race ID
+        event: Event name
+        data: JSON-serializable payload
+
+    Returns:
+        Number of subscribed processes that received it (0 if publishing failed)
+    """
+    message = dumps({"race_id": race_id, "event": event, "data": data})
+    try:
+        return await redis.publish(_channel(race_id), message)
+    except RedisError as e:
+        logger.warning(f"Failed to publish {event} for race {race_id}: {str(e)}")
+        return 0
+
+
+class RaceEventBroadcaster:
+    """
+    Single Redis subscription per process, fanned out to local queues.
+    프로세스당 Redis 구독 1개를 로컬 구독자에게 분배
+    """
+
+    def __init__(self, redis_url: str, queue_size: int = settings.EVENT_QUEUE_SIZE):
+        self.redis_url = redis_url
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = {}
+        self._listeners: List[Callable[[int, str, Any], None]] = []
+        self._reconnect_listeners: List[Callable[[], None]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._redis: Optional[aioredis.Redis] = None
+
+    @property
+    def redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = aioredis.from_url(self.redis_url)
+        return self._redis
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    async def publish(self, race_id: int, event: str, data: Any) -> int:
+        """Publish a race event through this broadcaster's Redis client."""
+        return await publish_race_event(self.redis, race_id, event, data)
+
+    def add_listener(self, listener: Callable[[int, str, Any], None]) -> None:
+        """
+        Call ``listener(race_id, event, data)`` for every race event seen by this
+        process (e.g. to drop in-process caches when another process changes a race).
+        """
+        self._listeners.append(listener)
+
+    def add_reconnect_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Call ``listener()`` after the subscription is re-established; events
+        published while it was down are lost, so caches kept in step by events
+        should be dropped.
+        """
+        self._reconnect_listeners.append(listener)
+
+    def start(self) -> None:
+        """Start the Redis subscription without waiting for the first subscriber."""
+        self._ensure_listener()
+
+    @asynccontextmanager
+    async def subscribe(self, race_id: int) -> AsyncIterator[asyncio.Queue]:
+        """
+        Subscribe to a race's events.
+
+        Yields:
+            Queue receiving RaceEvent items (oldest dropped when the client lags)
+        """
+        self._ensure_listener()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(race_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(race_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[race_id]
+
+    def _ensure_listener(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        reconnecting = False
+        while True:
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(f"{CHANNEL_PREFIX}*")
+                if reconnecting:
+                    self._notify_reconnect()
+                reconnecting = True
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        self._dispatch(message["data"])
+            except asyncio.CancelledError:
+                await pubsub.aclose()
+                raise
+            except RedisError as e:
+                logger.warning(f"Race event subscription lost: {str(e)}, reconnecting")
+                await pubsub.aclose()
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    def _notify_reconnect(self) -> None:
+        for listener in self._reconnect_listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.warning(f"Race event reconnect listener failed: {str(e)}")
+
+    def _dispatch(self, raw: bytes) -> None:
+        try:
+            message = orjson.loads(raw)
+            race_id = message["race_id"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Dropping malformed race event")
+            return
+
+        for listener in self._listeners:
+            try:
+                listener(race_id, message["event"], message.get("data"))
+            except Exception as e:
+                logger.warning(f"Race event listener failed: {str(e)}")
+
+        queues = self._subscribers.get(race_id)
+        if not queues or message["event"] in PROCESS_EVENTS:
+            return
+
+        event = RaceEvent(
+            race_id=race_id,
+            event=message["event"],
+            data=orjson.dumps(message["data"]),
+            envelope=raw,
+        )
+        for queue in queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+# Singleton instance
+race_events = RaceEventBroadcaster(settings.REDIS_URL)
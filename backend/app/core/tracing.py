@@ -0,0 +1,188 @@
+"""
+Request tracing (OpenTelemetry).
+요청 추적 - API / DB / KRA / LLM 구간별 소요 시간
+
+Spans are exported to an OTLP collector when OTEL_EXPORTER_OTLP_ENDPOINT is set,
+otherwise appended as JSON lines to TRACE_EXPORT_FILE. Requests slower than
+SLOW_REQUEST_THRESHOLD_MS are logged with a per-span breakdown.
+"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from opentelemetry import propagate, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+tracer = trace.get_tracer("horserace.backend")
+
+# Traces kept in memory while waiting for their root span to end
+MAX_PENDING_TRACES = 2048
+
+# Span name prefix -> breakdown category
+SPAN_CATEGORIES = (
+    ("db.", "db"),
+    ("kra.", "kra"),
+    ("prediction_service.", "llm"),
+)
+
+
+def _category(span: ReadableSpan) -> str:
+    for prefix, category in SPAN_CATEGORIES:
+        if span.name.startswith(prefix):
+            return category
+    return "app"
+
+
+def _duration_ms(span: ReadableSpan) -> float:
+    return (span.end_time - span.start_time) / 1_000_000
+
+
+class SlowRequestLogProcessor(SpanProcessor):
+    """Buffers spans per trace and logs a breakdown when a slow root span ends."""
+
+    def __init__(self, threshold_ms: float):
+        self.threshold_ms = threshold_ms
+        self._pending: "OrderedDict[int, List[ReadableSpan]]" = OrderedDict()
+
+    def on_end(self, span: ReadableSpan) -> None:
+        trace_id = span.context.trace_id
+        is_local_root = span.parent is None or span.parent.is_remote
+        if not is_local_root:
+            self._pending.setdefault(trace_id, []).append(span)
+            if len(self._pending) > MAX_PENDING_TRACES:
+                self._pending.popitem(last=False)
+            return
+
+        children = self._pending.pop(trace_id, [])
+        total_ms = _duration_ms(span)
+        if total_ms < self.threshold_ms:
+            return
+
+        by_category: Dict[str, float] = {}
+        for child in children:
+            category = _category(child)
+            by_category[category] = by_category.get(category, 0.0) + _duration_ms(child)
+        summary = ", ".join(f"{name}={ms:.1f}ms" for name, ms in sorted(by_category.items()))
+        lines = [
+            f"  {_duration_ms(child):8.1f}ms  {child.name}"
+            for child in sorted(children, key=lambda s: s.start_time)
+        ]
+        logger.warning(
+            f"Slow request {span.name}: {total_ms:.1f}ms "
+            f"(trace {trace_id:032x}; {summary or 'no child spans'})\n" + "\n".join(lines)
+        )
+
+    def shutdown(self) -> None:
+        self._pending.clear()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+
+def setup_tracing(service_name: str = "horserace-backend") -> Optional[TracerProvider]:
+    """
+    Configure the global tracer provider (no-op when TRACING_ENABLED is false).
+
+    Args:
+        service_name: service.name resource attribute
+
+    Returns:
+        Configured provider, or None if tracing is disabled
+    """
+    if not settings.TRACING_ENABLED:
+        return None
+
+    provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+    if settings.OTEL_EXPORTER_OTLP_ENDPOINT:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        exporter = OTLPSpanExporter(endpoint=f"{settings.OTEL_EXPORTER_OTLP_ENDPOINT}/v1/traces")
+    else:
+        exporter = ConsoleSpanExporter(
+            out=open(settings.TRACE_EXPORT_FILE, "a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + "\n",
+        )
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    provider.add_span_processor(SlowRequestLogProcessor(settings.SLOW_REQUEST_THRESHOLD_MS))
+    trace.set_tracer_provider(provider)
+    logger.info(f"Tracing enabled for {service_name}")
+    return provider
+
+
+def inject_trace_headers(headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Add W3C traceparent headers for the current span (for outgoing requests)."""
+    headers = dict(headers or {})
+    propagate.inject(headers)
+    return headers
+
+
+def instrument_engine(db_engine: AsyncEngine, role: str) -> None:
+    """
+    Record a ``db.query`` span around every cursor execution on the engine.
+
+    Args:
+        db_engine: Async engine to instrument
+        role: Pool role (primary/replica) recorded on the span
+    """
+    sync_engine = db_engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        operation = statement.lstrip().split(" ", 1)[0].upper()
+        span = tracer.start_span(
+            f"db.{operation.lower()}",
+            kind=SpanKind.CLIENT,
+            attributes={
+                "db.system": "postgresql",
+                "db.statement": statement[:1000],
+                "db.operation": operation,
+                "db.role": role,
+                "db.executemany": executemany,
+            },
+        )
+        conn.info.setdefault("trace_spans", []).append(span)
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        spans = conn.info.get("trace_spans")
+        if spans:
+            spans.pop().end()
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(exception_context):
+        spans = exception_context.connection.info.get("trace_spans") \
+            if exception_context.connection is not None else None
+        if spans:
+            span = spans.pop()
+            span.set_status(Status(StatusCode.ERROR, str(exception_context.original_exception)))
+            span.end()
+
+
+async def trace_requests(request, call_next):
+    """HTTP middleware: one server span per request, continuing incoming trace context."""
+    started = time.perf_counter()
+    with tracer.start_as_current_span(
+        f"{request.method} {request.url.path}",
+        context=propagate.extract(request.headers),
+        kind=SpanKind.SERVER,
+        attributes={"http.method": request.method, "http.target": request.url.path},
+    ) as span:
+        response = await call_next(request)
+        route = request.scope.get("route")
+        if route is not None:
+            span.update_name(f"{request.method} {route.path}")
+            span.set_attribute("http.route", route.path)
+        span.set_attribute("http.status_code", response.status_code)
+        if response.status_code >= 500:
+            span.set_status(Status(StatusCode.ERROR))
+        response.headers["Server-Timing"] = f"app;dur={(time.perf_counter() - started) * 1000:.1f}"
+        return response
@@ -1,21 +1,145 @@
 """
 Database session management.
+
+Two engines are configured: the primary (all writes) and an optional read
+replica with its own pool. ``get_db`` sessions send plain SELECTs to the
+replica until the session writes anything, after which every statement in
+that session (request) stays on the primary so it reads its own writes.
 """
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from prometheus_client import Gauge, Histogram
+from sqlalchemy import Delete, Insert, Select, Update, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
+)
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
+from app.core.tracing import instrument_engine
+
+logger = logging.getLogger(__name__)
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled database connection",
+    ["role"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Database connections currently checked out",
+    ["role"],
+)
+POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured database pool size (excluding overflow)",
+    ["role"],
+)
+REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "Replication replay lag last measured on the read replica",
+)
+
+# Replay lag of the replica; 0 once it has replayed everything it received
+REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+REPLICA_LAG_CACHE_SECONDS = 1.0
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records checkout wait time per role (primary/replica)."""
+
+    role = "primary"
 
-# Create async engine
-engine = create_async_engine(
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_CHECKOUT_WAIT.labels(self.role).observe(time.perf_counter() - started)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.role = self.role
+        return pool
+
+
+def _create_engine(url: str, role: str, pool_size: int, max_overflow: int) -> AsyncEngine:
+    db_engine = create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        future=True,
+        poolclass=TimedQueuePool,
+        pool_pre_ping=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+    db_engine.pool.role = role
+    POOL_CHECKED_OUT.labels(role).set_function(lambda: db_engine.pool.checkedout())
+    POOL_SIZE.labels(role).set(pool_size)
+    return db_engine
+
+
+# Create async engines (primary for writes, replica for reads)
+engine = _create_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    "primary",
+    settings.DB_PRIMARY_POOL_SIZE,
+    settings.DB_PRIMARY_MAX_OVERFLOW,
 )
+replica_engine = (
+    _create_engine(
+        settings.DATABASE_REPLICA_URL,
+        "replica",
+        settings.DB_REPLICA_POOL_SIZE,
+        settings.DB_REPLICA_MAX_OVERFLOW,
+    )
+    if settings.DATABASE_REPLICA_URL
+    else engine
+)
+
+# db.* spans per statement (tagged with the pool role)
+instrument_engine(engine, "primary")
+if replica_engine is not engine:
+    instrument_engine(replica_engine, "replica")
+
+
+class RoutingSession(Session):
+    """
+    Session routing plain SELECTs to the replica.
+
+    Writes, locking reads (FOR UPDATE), raw SQL and everything after the
+    session's first write go to the primary.
+    """
+
+    _use_primary = False
 
-# Create async session maker
+    def use_primary(self) -> None:
+        """Pin the rest of this session to the primary."""
+        self._use_primary = True
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._use_primary or self._flushing:
+            self._use_primary = True
+            return engine.sync_engine
+        if isinstance(clause, (Insert, Update, Delete)):
+            self._use_primary = True
+            return engine.sync_engine
+        if isinstance(clause, Select) and clause._for_update_arg is None:
+            return replica_engine.sync_engine
+        return engine.sync_engine
+
+
+# Create async session makers
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -24,12 +148,79 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+AsyncRoutingSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 # Base class for models
 Base = declarative_base()
 
 
+class _ReplicaLagProbe:
+    """Replica lag, measured at most once per REPLICA_LAG_CACHE_SECONDS."""
+
+    def __init__(self):
+        self._lag: Optional[float] = None
+        self._measured_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def _measure(self) -> Optional[float]:
+        try:
+            async with replica_engine.connect() as conn:
+                lag = (await conn.execute(REPLICA_LAG_SQL)).scalar()
+        except SQLAlchemyError as e:
+            logger.warning(f"Replica lag check failed: {str(e)}")
+            return None
+        if lag is None:
+            return None
+        REPLICA_LAG.set(float(lag))
+        return float(lag)
+
+    async def __call__(self) -> Optional[float]:
+        """
+        Seconds the replica may be behind the primary.
+
+        Returns:
+            Upper bound on the lag (0 without a replica), or None if unknown
+        """
+        if replica_engine is engine:
+            return 0.0
+        async with self._lock:
+            now = time.monotonic()
+            if now - self._measured_at >= REPLICA_LAG_CACHE_SECONDS:
+                self._lag = await self._measure()
+                self._measured_at = now
+            if self._lag is None:
+                return None
+            # Lag grows at most as fast as the clock while the reading ages
+            return self._lag + (now - self._measured_at)
+
+
+replica_lag_seconds = _ReplicaLagProbe()
+
+
+def use_primary(session: AsyncSession) -> None:
+    """Pin a get_db session to the primary (e.g. before read-your-writes queries)."""
+    sync_session: Optional[Session] = session.sync_session
+    if isinstance(sync_session, RoutingSession):
+        sync_session.use_primary()
+
+
 async def get_db() -> AsyncSession:
-    """Dependency for getting async database sessions."""
+    """Dependency for getting async database sessions (reads go to the replica)."""
+    async with AsyncRoutingSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+async def get_primary_db() -> AsyncSession:
+    """Dependency for getting async database sessions bound to the primary."""
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -0,0 +1,161 @@
+"""
+TimescaleDB hypertable setup for date-keyed fact tables.
+race_entries / predictions 하이퍼테이블 및 압축 설정
+
+Run once after the schema is created (idempotent)::
+
+    python -m app.db.timescale
+"""
+import asyncio
+import logging
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+# table -> (compress_segmentby, compress_orderby)
+HYPERTABLES = {
+    "race_entries": ("race_id", "gate_number"),
+    "predictions": ("race_id", "prediction_type, id"),
+}
+
+# Constraints and indexes the application relies on, checked after conversion
+EXPECTED_INDEXES = {
+    "race_entries": (
+        "race_entries_pkey",
+        "uq_race_gate",
+        "idx_race_entry_race",
+        "idx_race_entry_horse",
+        "idx_race_entry_jockey",
+    ),
+    "predictions": (
+        "predictions_pkey",
+        "idx_prediction_race_type",
+        "idx_prediction_live",
+        "uq_prediction_current",
+    ),
+}
+
+# Composite (race_id, race_date) -> races foreign keys (need TimescaleDB >= 2.16
+# for keys referencing hypertables)
+EXPECTED_FOREIGN_KEYS = {
+    "race_entries": ("fk_race_entry_race",),
+    "predictions": ("fk_prediction_race",),
+}
+
+
+def _hypertable_statements(table: str, segment_by: str, order_by: str) -> List[str]:
+    chunk_days = settings.HISTORY_CHUNK_INTERVAL_DAYS
+    compress_days = settings.HISTORY_COMPRESS_AFTER_DAYS
+    return [
+        f"SELECT create_hypertable('{table}', 'race_date', "
+        f"chunk_time_interval => INTERVAL '{chunk_days} days', "
+        f"migrate_data => true, if_not_exists => true)",
+        f"ALTER TABLE {table} SET ("
+        f"timescaledb.compress, "
+        f"timescaledb.compress_segmentby = '{segment_by}', "
+        f"timescaledb.compress_orderby = '{order_by}')",
+        f"SELECT add_compression_policy('{table}', INTERVAL '{compress_days} days', "
+        f"if_not_exists => true)",
+    ]
+
+
+async def setup_hypertables(db_engine: AsyncEngine = engine) -> None:
+    """
+    Convert race_entries / predictions to hypertables with compression policies.
+
+    Args:
+        db_engine: Engine connected as a role allowed to alter the tables
+    """
+    async with db_engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS timescaledb"))
+        for table, (segment_by, order_by) in HYPERTABLES.items():
+            for statement in _hypertable_statements(table, segment_by, order_by):
+                await conn.execute(text(statement))
+            logger.info(f"Hypertable ready: {table}")
+
+
+async def verify_hypertables(db_engine: AsyncEngine = engine) -> List[str]:
+    """
+    Check that the tables are hypertables partitioned on race_date, with
+    compression, the expected indexes and the race foreign keys in place.
+
+    Returns:
+        List of problems (empty if everything is in place)
+    """
+    problems: List[str] = []
+    async with db_engine.connect() as conn:
+        extension = (await conn.execute(
+            text("SELECT extversion FROM pg_extension WHERE extname = 'timescaledb'")
+        )).scalar()
+        if extension is None:
+            return ["timescaledb extension is not installed"]
+
+        hypertables = {
+            row.hypertable_name: row.compression_enabled
+            for row in await conn.execute(text(
+                "SELECT hypertable_name, compression_enabled "
+                "FROM timescaledb_information.hypertables"
+            ))
+        }
+        time_columns = {
+            row.hypertable_name: row.column_name
+            for row in await conn.execute(text(
+                "SELECT hypertable_name, column_name "
+                "FROM timescaledb_information.dimensions WHERE dimension_type = 'Time'"
+            ))
+        }
+        for table, expected in EXPECTED_INDEXES.items():
+            if table not in hypertables:
+                problems.append(f"{table} is not a hypertable")
+                continue
+            if time_columns.get(table) != "race_date":
+                problems.append(f"{table} is not partitioned on race_date")
+            if not hypertables[table]:
+                problems.append(f"{table} has compression disabled")
+
+            existing = {
+                row.indexname
+                for row in await conn.execute(
+                    text("SELECT indexname FROM pg_indexes WHERE tablename = :table"),
+                    {"table": table},
+                )
+            }
+            for index_name in expected:
+                if index_name not in existing:
+                    problems.append(f"{table} is missing index {index_name}")
+
+            foreign_keys = {
+                row.conname
+                for row in await conn.execute(
+                    text(
+                        "SELECT conname FROM pg_constraint "
+                        "WHERE conrelid = CAST(:table AS regclass) AND contype = 'f'"
+                    ),
+                    {"table": table},
+                )
+            }
+            for fk_name in EXPECTED_FOREIGN_KEYS.get(table, ()):
+                if fk_name not in foreign_keys:
+                    problems.append(f"{table} is missing foreign key {fk_name}")
+    return problems
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    await setup_hypertables()
+    problems = await verify_hypertables()
+    for problem in problems:
+        logger.error(problem)
+    if problems:
+        raise SystemExit(1)
+    logger.info("Hypertables verified")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
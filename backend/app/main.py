@@ -2,14 +2,43 @@
 FastAPI main application.
 경마 예측 백엔드 메인 애플리케이션
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from prometheus_client import make_asgi_app
 from app.core.config import settings
+from app.core.cache import response_cache
+from app.core.pubsub import race_events
+from app.core.tracing import setup_tracing, trace_requests
+from app.services.warmup_service import warmup_service
+from app.api.v1 import api_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup / shutdown."""
+    # Pub/sub keeps in-process caches in step with sync workers
+    race_events.start()
+    warmup_service.start()
+    yield
+    await warmup_service.close()
+    await race_events.close()
+    await response_cache.close()
+    if tracer_provider is not None:
+        tracer_provider.shutdown()
+
+
+# Request tracing (exporter + slow-request log)
+tracer_provider = setup_tracing()
 
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
@@ -24,6 +53,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# One server span per request (continues incoming traceparent)
+app.middleware("http")(trace_requests)
+
+# Prometheus metrics (incl. db_pool_checkout_wait_seconds per pool role)
+app.mount("/metrics", make_asgi_app())
+
 
 @app.get("/")
 async def root():
@@ -41,9 +76,14 @@ async def health_check():
     return {"status": "healthy"}
 
 
-# TODO: Add API routers
-# from app.api.v1 import api_router
-# app.include_router(api_router, prefix="/api/v1")
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 503 until today's races have been warmed."""
+    body = {"ready": warmup_service.ready, "warmup": warmup_service.progress.to_dict()}
+    return ORJSONResponse(body, status_code=200 if warmup_service.ready else 503)
+
+
+app.include_router(api_router, prefix="/api/v1")
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ from app.models.race import Race, RaceTrack, RaceEntry
 from app.models.horse import Horse
 from app.models.jockey import Jockey
 from app.models.trainer import Trainer
+from app.models.job import Job
 from app.models.prediction import (
     Prediction,
     PredictionDetailSingle,
@@ -18,6 +19,7 @@ __all__ = [
     "Horse",
     "Jockey",
     "Trainer",
+    "Job",
     "Prediction",
     "PredictionDetailSingle",
     "PredictionDetailCombination",
@@ -0,0 +1,54 @@
+"""
+Background job database model.
+백그라운드 작업 큐 데이터베이스 모델
+"""
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from app.db.session import Base
+
+# Jobs matching this predicate still hold their dedupe key
+ACTIVE_JOB_WHERE = "status IN ('queued', 'running')"
+
+
+class Job(Base):
+    """작업 (Jobs) - claimed by workers with FOR UPDATE SKIP LOCKED"""
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_type = Column(String(50), nullable=False, comment="작업 종류 (sync_schedule/sync_results/predict)")
+    dedupe_key = Column(String(200), nullable=False, comment="중복 방지 키")
+    payload = Column(JSONB, nullable=False, default=dict, comment="작업 파라미터")
+    status = Column(
+        String(20),
+        nullable=False,
+        default="queued",
+        comment="상태 (queued/running/succeeded/failed)"
+    )
+    attempts = Column(Integer, nullable=False, default=0, comment="시도 횟수")
+    max_attempts = Column(Integer, nullable=False, comment="최대 시도 횟수")
+    run_at = Column(DateTime, nullable=False, default=datetime.utcnow, comment="실행 예정 시각 (UTC)")
+    locked_by = Column(String(100), comment="점유 워커 ID")
+    lease_expires_at = Column(DateTime, comment="점유 만료 시각 (UTC)")
+    last_error = Column(Text, comment="마지막 오류")
+    finished_at = Column(DateTime, comment="완료 시각")
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Indexes
+    __table_args__ = (
+        # Only one queued/running job per dedupe key
+        Index(
+            'uq_job_active_dedupe_key',
+            'dedupe_key',
+            unique=True,
+            postgresql_where=text(ACTIVE_JOB_WHERE)
+        ),
+        Index('idx_job_status_run_at', 'status', 'run_at'),
+        Index(
+            'idx_job_lease',
+            'lease_expires_at',
+            postgresql_where=text("status = 'running'")
+        ),
+    )
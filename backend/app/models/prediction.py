@@ -4,23 +4,26 @@ Prediction database models.
 """
 from datetime import datetime
 from sqlalchemy import (
-    Column, Integer, String, DateTime, Numeric, ForeignKey, Text, JSON, Index
+    Column, Integer, String, Date, DateTime, Numeric, Text, Index,
+    ForeignKeyConstraint, text
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import relationship
 from app.db.session import Base
 
 
 class Prediction(Base):
-    """예측 결과 (Predictions)"""
+    """예측 결과 (Predictions) - TimescaleDB hypertable partitioned by race_date"""
     __tablename__ = "predictions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    race_id = Column(
-        Integer,
-        ForeignKey("races.id", ondelete="CASCADE"),
-        nullable=False
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    race_date = Column(
+        Date,
+        primary_key=True,
+        nullable=False,
+        comment="경주 날짜 (파티션 키, races.race_date 복제)"
     )
+    race_id = Column(Integer, nullable=False)
     prediction_type = Column(
         String(50),
         nullable=False,
@@ -32,14 +35,52 @@ class Prediction(Base):
     feature_importance = Column(JSONB, comment="주요 특징 중요도")
     llm_reasoning = Column(Text, comment="LLM 분석 근거")
 
+    # Versioning / staleness (older versions are kept for audit)
+    version = Column(Integer, nullable=False, default=1, comment="(race, type)별 예측 버전")
+    status = Column(
+        String(20),
+        nullable=False,
+        default="current",
+        comment="상태 (current/stale/superseded)"
+    )
+    context_snapshot = Column(JSONB, comment="예측에 사용된 컨텍스트 필드 값 (의존성)")
+    stale_reason = Column(JSONB, comment="stale 전환 사유 (변경 필드 목록)")
+    superseded_by = Column(Integer, comment="대체한 예측 ID")
+    stale_at = Column(DateTime, comment="stale 전환 시각")
+
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
-    race = relationship("Race", back_populates="predictions")
+    race = relationship(
+        "Race",
+        back_populates="predictions",
+        primaryjoin="and_(Race.id == foreign(Prediction.race_id), "
+                    "Race.race_date == foreign(Prediction.race_date))",
+    )
 
     # Indexes
     __table_args__ = (
-        Index('idx_prediction_race_type', 'race_id', 'prediction_type'),
+        # Keeps race_date in step with races.race_date when a race is rescheduled
+        ForeignKeyConstraint(
+            ['race_id', 'race_date'],
+            ['races.id', 'races.race_date'],
+            name='fk_prediction_race',
+            ondelete="CASCADE",
+            onupdate="CASCADE"
+        ),
+        Index('idx_prediction_race_type', 'race_id', 'prediction_type', 'race_date'),
+        Index(
+            'idx_prediction_live',
+            'race_id', 'race_date',
+            postgresql_where=text("status IN ('current', 'stale')")
+        ),
+        # One current version per (race, type)
+        Index(
+            'uq_prediction_current',
+            'race_id', 'prediction_type', 'race_date',
+            unique=True,
+            postgresql_where=text("status = 'current'")
+        ),
     )
 
 
@@ -48,12 +89,9 @@ class PredictionDetailSingle(Base):
     __tablename__ = "prediction_details_single"
 
     id = Column(Integer, primary_key=True, index=True)
-    prediction_id = Column(
-        Integer,
-        ForeignKey("predictions.id", ondelete="CASCADE"),
-        nullable=False
-    )
-    race_entry_id = Column(Integer, ForeignKey("race_entries.id"), nullable=False)
+    prediction_id = Column(Integer, nullable=False)
+    race_entry_id = Column(Integer, nullable=False)
+    race_date = Column(Date, nullable=False, comment="경주 날짜 (복합 외래키용)")
     predicted_probability = Column(
         Numeric(7, 6),
         nullable=False,
@@ -67,24 +105,52 @@ class PredictionDetailSingle(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # Foreign keys into hypertables must cover their (id, race_date) keys
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ['prediction_id', 'race_date'],
+            ['predictions.id', 'predictions.race_date'],
+            ondelete="CASCADE",
+            onupdate="CASCADE"
+        ),
+        ForeignKeyConstraint(
+            ['race_entry_id', 'race_date'],
+            ['race_entries.id', 'race_entries.race_date'],
+            onupdate="CASCADE"
+        ),
+    )
+
 
 class PredictionDetailCombination(Base):
     """조합 예측 - 복승/복연승/삼복승용 (Combination Predictions)"""
     __tablename__ = "prediction_details_combination"
 
     id = Column(Integer, primary_key=True, index=True)
-    prediction_id = Column(
-        Integer,
-        ForeignKey("predictions.id", ondelete="CASCADE"),
-        nullable=False
-    )
+    prediction_id = Column(Integer, nullable=False)
+    race_date = Column(Date, nullable=False, comment="경주 날짜 (복합 외래키용)")
     combination_entries = Column(
-        JSON,
+        ARRAY(Integer),
         nullable=False,
-        comment="race_entry_id 배열"
+        comment="race_entry_id 배열 (순서 있는 조합은 착순)"
     )
     predicted_probability = Column(Numeric(7, 6), comment="예측 확률")
     confidence_level = Column(String(20), comment="신뢰도 레벨")
     expected_return = Column(Numeric(8, 2), comment="예상 배당")
 
     created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Indexes
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ['prediction_id', 'race_date'],
+            ['predictions.id', 'predictions.race_date'],
+            ondelete="CASCADE",
+            onupdate="CASCADE"
+        ),
+        Index('idx_prediction_combination_prediction', 'prediction_id'),
+        Index(
+            'idx_prediction_combination_entries',
+            'combination_entries',
+            postgresql_using='gin'
+        ),
+    )
@@ -6,7 +6,7 @@ from datetime import date, time, datetime
 from typing import Optional
 from sqlalchemy import (
     Column, Integer, String, Date, Time, DateTime, BigInteger,
-    ForeignKey, Boolean, Numeric, Text, Index, UniqueConstraint
+    ForeignKey, Boolean, Numeric, Text, Index, UniqueConstraint, ForeignKeyConstraint
 )
 from sqlalchemy.orm import relationship
 from app.db.session import Base
@@ -56,23 +56,45 @@ class Race(Base):
 
     # Relationships
     track = relationship("RaceTrack", back_populates="races")
-    entries = relationship("RaceEntry", back_populates="race", cascade="all, delete-orphan")
-    predictions = relationship("Prediction", back_populates="race", cascade="all, delete-orphan")
+    # race_date is part of the join so queries on the date-partitioned
+    # race_entries / predictions hypertables only touch the matching chunk.
+    entries = relationship(
+        "RaceEntry",
+        back_populates="race",
+        cascade="all, delete-orphan",
+        primaryjoin="and_(Race.id == foreign(RaceEntry.race_id), "
+                    "Race.race_date == foreign(RaceEntry.race_date))",
+    )
+    predictions = relationship(
+        "Prediction",
+        back_populates="race",
+        cascade="all, delete-orphan",
+        primaryjoin="and_(Race.id == foreign(Prediction.race_id), "
+                    "Race.race_date == foreign(Prediction.race_date))",
+    )
 
     # Indexes and Constraints
     __table_args__ = (
         UniqueConstraint('race_track_id', 'race_date', 'race_number', name='uq_race_track_date_number'),
+        # Target of the (race_id, race_date) foreign keys from the hypertables
+        UniqueConstraint('id', 'race_date', name='uq_race_id_date'),
         Index('idx_race_date_track', 'race_date', 'race_track_id'),
         Index('idx_race_status', 'race_status'),
     )
 
 
 class RaceEntry(Base):
-    """출전 정보 (Race Entries)"""
+    """출전 정보 (Race Entries) - TimescaleDB hypertable partitioned by race_date"""
     __tablename__ = "race_entries"
 
-    id = Column(Integer, primary_key=True, index=True)
-    race_id = Column(Integer, ForeignKey("races.id", ondelete="CASCADE"), nullable=False)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    race_date = Column(
+        Date,
+        primary_key=True,
+        nullable=False,
+        comment="경주 날짜 (파티션 키, races.race_date 복제)"
+    )
+    race_id = Column(Integer, nullable=False)
     horse_id = Column(Integer, ForeignKey("horses.id"), nullable=False)
     jockey_id = Column(Integer, ForeignKey("jockeys.id"), nullable=False)
     trainer_id = Column(Integer, ForeignKey("trainers.id"), nullable=False)
@@ -95,15 +117,29 @@ class RaceEntry(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    race = relationship("Race", back_populates="entries")
+    race = relationship(
+        "Race",
+        back_populates="entries",
+        primaryjoin="and_(Race.id == foreign(RaceEntry.race_id), "
+                    "Race.race_date == foreign(RaceEntry.race_date))",
+    )
     horse = relationship("Horse", back_populates="race_entries")
     jockey = relationship("Jockey", back_populates="race_entries")
     trainer = relationship("Trainer", back_populates="race_entries")
 
     # Indexes and Constraints
     __table_args__ = (
-        UniqueConstraint('race_id', 'gate_number', name='uq_race_gate'),
-        Index('idx_race_entry_race', 'race_id'),
+        # Unique constraints on a hypertable must include the partition column
+        UniqueConstraint('race_id', 'gate_number', 'race_date', name='uq_race_gate'),
+        # Keeps race_date in step with races.race_date when a race is rescheduled
+        ForeignKeyConstraint(
+            ['race_id', 'race_date'],
+            ['races.id', 'races.race_date'],
+            name='fk_race_entry_race',
+            ondelete="CASCADE",
+            onupdate="CASCADE"
+        ),
+        Index('idx_race_entry_race', 'race_id', 'race_date'),
         Index('idx_race_entry_horse', 'horse_id'),
         Index('idx_race_entry_jockey', 'jockey_id'),
     )
@@ -0,0 +1,178 @@
+"""
+Baseline (market) probabilities and exotic books.
+배당 기반 기준 확률 및 조합(복승/쌍승/삼쌍승) 확률표
+
+Win probabilities are implied from the current odds (final odds if known,
+otherwise morning odds) with the bookmaker margin removed. Exotic books are
+derived from them with the Harville model. Results are cached alongside the
+race context and recomputed whenever the context is invalidated.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.combination_service import (
+    COMBINATION_TYPES, CombinationRow, enumerate_combinations
+)
+from app.services.race_context_service import RaceContext, get_race_context, race_context_cache
+
+logger = logging.getLogger(__name__)
+
+DERIVED_KEY = "baseline"
+
+
+@dataclass(frozen=True)
+class BaselineBook:
+    """경주별 기준 확률표 (Odds-implied win probabilities and exotic books)"""
+    race_id: int
+    race_date: date
+    source: str
+    win: Dict[int, float]
+    gates: Dict[int, int]
+    books: Dict[str, Tuple[CombinationRow, ...]]
+
+    def to_dict(self, top: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Convert to a JSON-serializable dictionary.
+
+        Args:
+            top: Keep only the most likely combinations per book
+
+        Returns:
+            Baseline dictionary
+        """
+        return {
+            "race_id": self.race_id,
+            "race_date": self.race_date.isoformat(),
+            "source": self.source,
+            "win": [
+                {"entry_id": entry_id, "gate_number": self.gates[entry_id], "probability": p}
+                for entry_id, p in sorted(self.win.items(), key=lambda item: -item[1])
+            ],
+            "books": {
+                prediction_type: [
+                    {"entries": list(row.entries), "probability": row.probability}
+                    for row in rows[:top]
+                ]
+                for prediction_type, rows in self.books.items()
+            },
+        }
+
+
+def implied_win_probabilities(context: RaceContext) -> Tuple[Dict[int, float], str]:
+    """
+    Odds-implied win probabilities of the active runners.
+
+    Runners without odds get the average implied probability of the priced
+    runners; with no odds at all the field is treated as uniform.
+
+    Args:
+        context: Race context
+
+    Returns:
+        (entry_id -> probability summing to 1, source ``odds``/``uniform``)
+    """
+    runners = context.active_entries
+    if not runners:
+        return {}, "uniform"
+
+    raw: Dict[int, Optional[float]] = {}
+    for entry in runners:
+        odds = entry.final_odds or entry.morning_odds
+        raw[entry.entry_id] = 1.0 / odds if odds and odds > 0 else None
+
+    priced = [p for p in raw.values() if p is not None]
+    if not priced:
+        return {entry_id: 1.0 / len(raw) for entry_id in raw}, "uniform"
+
+    fill = sum(priced) / len(priced)
+    total = sum(p if p is not None else fill for p in raw.values())
+    return (
+        {entry_id: (p if p is not None else fill) / total for entry_id, p in raw.items()},
+        "odds",
+    )
+
+
+def _harville(win: Dict[int, float], order: Tuple[int, ...]) -> float:
+    probability = 1.0
+    remaining = 1.0
+    for entry_id in order:
+        if remaining <= 0:
+            return 0.0
+        probability *= win[entry_id] / remaining
+        remaining -= win[entry_id]
+    return probability
+
+
+def harville_book(win: Dict[int, float], prediction_type: str) -> Tuple[CombinationRow, ...]:
+    """
+    Probability of every combination of a bet type under the Harville model.
+
+    Args:
+        win: entry_id -> win probability
+        prediction_type: quinella / exacta / trifecta
+
+    Returns:
+        Combinations sorted from most to least likely
+    """
+    _, ordered = COMBINATION_TYPES[prediction_type]
+    rows = []
+    for combo in enumerate_combinations(list(win), prediction_type):
+        if ordered:
+            probability = _harville(win, combo)
+        else:
+            probability = _harville(win, combo) + _harville(win, combo[::-1])
+        rows.append(CombinationRow(entries=combo, probability=round(probability, 6)))
+    rows.sort(key=lambda row: -row.probability)
+    return tuple(rows)
+
+
+def build_baseline(context: RaceContext) -> BaselineBook:
+    """
+    Compute the baseline win probabilities and exotic books for a race.
+
+    Args:
+        context: Race context
+
+    Returns:
+        Baseline book
+    """
+    win, source = implied_win_probabilities(context)
+    return BaselineBook(
+        race_id=context.race_id,
+        race_date=context.race_date,
+        source=source,
+        win={entry_id: round(p, 6) for entry_id, p in win.items()},
+        gates={e.entry_id: e.gate_number for e in context.active_entries},
+        books={
+            prediction_type: harville_book(win, prediction_type)
+            for prediction_type in COMBINATION_TYPES
+        },
+    )
+
+
+async def get_baseline(db: AsyncSession, race_id: int) -> Optional[BaselineBook]:
+    """
+    Get a race's baseline book, cached with its race context.
+    기준 확률표 조회 (컨텍스트 캐시와 함께 무효화)
+
+    Args:
+        db: Database session
+        race_id: Race ID
+
+    Returns:
+        Baseline book, or None if the race does not exist
+    """
+    book = race_context_cache.get_derived(race_id, DERIVED_KEY)
+    if book is not None:
+        return book
+
+    context = await get_race_context(db, race_id)
+    if context is None:
+        return None
+    book = build_baseline(context)
+    race_context_cache.set_derived(race_id, DERIVED_KEY, book)
+    return book
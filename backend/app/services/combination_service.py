@@ -0,0 +1,208 @@
+"""
+Combination prediction service.
+조합 예측 (복승/쌍승/삼쌍승) 생성 및 저장 서비스
+"""
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from itertools import combinations, permutations
+from typing import Any, Dict, Optional, List, Tuple, Iterable, Sequence
+
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.prediction import Prediction, PredictionDetailCombination
+from app.services.race_context_service import RaceContext
+
+logger = logging.getLogger(__name__)
+
+# prediction_type -> (number of runners, order matters)
+COMBINATION_TYPES = {
+    "quinella": (2, False),
+    "exacta": (2, True),
+    "trifecta": (3, True),
+}
+
+# Rows per multi-row INSERT when COPY is not available
+INSERT_CHUNK_SIZE = 1000
+
+COPY_COLUMNS = (
+    "prediction_id",
+    "race_date",
+    "combination_entries",
+    "predicted_probability",
+    "confidence_level",
+    "expected_return",
+    "created_at",
+)
+
+
+@dataclass(frozen=True)
+class CombinationRow:
+    """조합 예측 한 건 (One combination of a prediction book)"""
+    entries: Tuple[int, ...]
+    probability: Optional[float] = None
+    confidence_level: Optional[str] = None
+    expected_return: Optional[float] = None
+
+
+def enumerate_combinations(
+    entry_ids: Sequence[int],
+    prediction_type: str
+) -> List[Tuple[int, ...]]:
+    """
+    Enumerate every combination of a bet type for the given runners.
+
+    Args:
+        entry_ids: race_entry IDs of the active (non-scratched) runners
+        prediction_type: quinella / exacta / trifecta
+
+    Returns:
+        List of race_entry_id tuples (finish order for ordered types)
+    """
+    if prediction_type not in COMBINATION_TYPES:
+        raise ValueError(f"Unsupported combination type: {prediction_type}")
+
+    size, ordered = COMBINATION_TYPES[prediction_type]
+    if ordered:
+        return list(permutations(entry_ids, size))
+    return list(combinations(sorted(entry_ids), size))
+
+
+def combination_rows(
+    context: RaceContext,
+    prediction_type: str,
+    prediction: Dict[str, Any]
+) -> List[CombinationRow]:
+    """
+    Extract the combination book from an LLM prediction.
+    LLM 조합 예측 결과를 저장용 행으로 변환
+
+    The LLM names runners by the ``horse_id`` of the context (gate numbers
+    are accepted too). Combinations of the wrong size, with unknown,
+    scratched or repeated runners are dropped.
+
+    Args:
+        context: Context the prediction was generated from
+        prediction_type: quinella / exacta / trifecta
+        prediction: Parsed prediction with a ``combinations`` list
+
+    Returns:
+        Rows with race_entry IDs (finish order for ordered types)
+    """
+    size, ordered = COMBINATION_TYPES[prediction_type]
+    by_horse = {entry.horse_id: entry.entry_id for entry in context.active_entries}
+    by_gate = {entry.gate_number: entry.entry_id for entry in context.active_entries}
+
+    rows: List[CombinationRow] = []
+    for combination in prediction.get("combinations") or []:
+        try:
+            runners = [int(runner) for runner in combination.get("horses") or []]
+        except (TypeError, ValueError):
+            continue
+        entry_ids = [by_horse.get(runner, by_gate.get(runner)) for runner in runners]
+        if len(entry_ids) != size or None in entry_ids or len(set(entry_ids)) != size:
+            logger.warning(f"Skipping {prediction_type} combination {runners} for race {context.race_id}")
+            continue
+        rows.append(CombinationRow(
+            entries=tuple(entry_ids if ordered else sorted(entry_ids)),
+            probability=combination.get("probability"),
+            expected_return=combination.get("expected_return"),
+        ))
+    return rows
+
+
+def _to_decimal(value: Optional[float], places: int) -> Optional[Decimal]:
+    return round(Decimal(str(value)), places) if value is not None else None
+
+
+def _records(prediction: Prediction, rows: Iterable[CombinationRow]) -> List[tuple]:
+    created_at = datetime.utcnow()
+    return [
+        (
+            prediction.id,
+            prediction.race_date,
+            list(row.entries),
+            _to_decimal(row.probability, 6),
+            row.confidence_level,
+            _to_decimal(row.expected_return, 2),
+            created_at,
+        )
+        for row in rows
+    ]
+
+
+async def bulk_insert_combinations(
+    db: AsyncSession,
+    prediction: Prediction,
+    rows: Iterable[CombinationRow]
+) -> int:
+    """
+    Persist a whole combination book for a prediction in one round trip.
+    조합 예측 전체를 한 번에 저장
+
+    Uses COPY on asyncpg connections and falls back to chunked multi-row
+    INSERT otherwise. The caller owns the transaction.
+
+    Args:
+        db: Database session
+        prediction: Parent prediction (already flushed)
+        rows: Combinations to store
+
+    Returns:
+        Number of rows written
+    """
+    records = _records(prediction, rows)
+    if not records:
+        return 0
+
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    driver_connection = raw.driver_connection
+
+    if hasattr(driver_connection, "copy_records_to_table"):
+        await driver_connection.copy_records_to_table(
+            PredictionDetailCombination.__tablename__,
+            records=records,
+            columns=COPY_COLUMNS,
+        )
+    else:
+        values = [dict(zip(COPY_COLUMNS, record)) for record in records]
+        for start in range(0, len(values), INSERT_CHUNK_SIZE):
+            await db.execute(
+                insert(PredictionDetailCombination),
+                values[start:start + INSERT_CHUNK_SIZE],
+            )
+
+    logger.info(f"Stored {len(records)} combinations for prediction {prediction.id}")
+    return len(records)
+
+
+async def find_predictions_with_entry(
+    db: AsyncSession,
+    race_entry_id: int,
+    prediction_type: Optional[str] = None
+) -> List[Prediction]:
+    """
+    Find predictions whose combination book includes a race entry.
+    특정 출전마를 포함하는 조합 예측 조회 (GIN 인덱스 사용)
+
+    Args:
+        db: Database session
+        race_entry_id: Race entry ID to look for
+        prediction_type: Optional prediction type filter
+
+    Returns:
+        Matching predictions
+    """
+    matching = (
+        select(PredictionDetailCombination.prediction_id)
+        .where(PredictionDetailCombination.combination_entries.contains([race_entry_id]))
+    )
+    stmt = select(Prediction).where(Prediction.id.in_(matching))
+    if prediction_type is not None:
+        stmt = stmt.where(Prediction.prediction_type == prediction_type)
+
+    result = await db.execute(stmt.order_by(Prediction.id))
+    return list(result.scalars())
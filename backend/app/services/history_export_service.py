@@ -0,0 +1,249 @@
+"""
+Race history export service.
+학습/백테스트용 경주 이력 Parquet 내보내기
+
+Streams race_entries x races x horses through a server-side cursor in fixed-size
+batches and writes Parquet files partitioned by race date and track::
+
+    <output_dir>/race_date=2026-01-03/track_id=1/part-0.parquet
+
+Rows are streamed in (race_date, track) order so only one partition writer is
+open at a time; memory use is bounded by the batch size, not the history size.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date
+from itertools import groupby
+from pathlib import Path
+from typing import Optional, List, Tuple, Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import select, cast, Float
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.session import engine
+from app.models import Race, RaceEntry, Horse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50_000
+MANIFEST_NAME = "_manifest.json"
+
+EXPORT_COLUMNS = (
+    Race.race_date,
+    Race.race_track_id.label("track_id"),
+    Race.id.label("race_id"),
+    Race.race_number,
+    Race.race_class,
+    Race.distance,
+    Race.surface_type,
+    Race.weather,
+    Race.track_condition,
+    RaceEntry.id.label("entry_id"),
+    RaceEntry.gate_number,
+    RaceEntry.horse_id,
+    RaceEntry.jockey_id,
+    RaceEntry.trainer_id,
+    cast(RaceEntry.horse_weight_kg, Float).label("horse_weight_kg"),
+    cast(RaceEntry.handicap_weight_kg, Float).label("handicap_weight_kg"),
+    cast(RaceEntry.morning_odds, Float).label("morning_odds"),
+    cast(RaceEntry.final_odds, Float).label("final_odds"),
+    RaceEntry.popularity_rank,
+    RaceEntry.finish_position,
+    cast(RaceEntry.finish_time, Float).label("finish_time"),
+    cast(RaceEntry.margin, Float).label("margin"),
+    RaceEntry.scratched,
+    Horse.birth_date.label("horse_birth_date"),
+    Horse.gender.label("horse_gender"),
+    Horse.rating.label("horse_rating"),
+)
+
+# Partition keys are encoded in the directory names and not repeated in the files
+PARTITION_COLUMNS = ("race_date", "track_id")
+
+EXPORT_SCHEMA = pa.schema([
+    ("race_id", pa.int32()),
+    ("race_number", pa.int16()),
+    ("race_class", pa.string()),
+    ("distance", pa.int32()),
+    ("surface_type", pa.string()),
+    ("weather", pa.string()),
+    ("track_condition", pa.string()),
+    ("entry_id", pa.int32()),
+    ("gate_number", pa.int16()),
+    ("horse_id", pa.int32()),
+    ("jockey_id", pa.int32()),
+    ("trainer_id", pa.int32()),
+    ("horse_weight_kg", pa.float64()),
+    ("handicap_weight_kg", pa.float64()),
+    ("morning_odds", pa.float64()),
+    ("final_odds", pa.float64()),
+    ("popularity_rank", pa.int16()),
+    ("finish_position", pa.int16()),
+    ("finish_time", pa.float64()),
+    ("margin", pa.float64()),
+    ("scratched", pa.bool_()),
+    ("horse_birth_date", pa.date32()),
+    ("horse_gender", pa.string()),
+    ("horse_rating", pa.int32()),
+])
+
+
+@dataclass
+class ExportResult:
+    """내보내기 결과 (Export result)"""
+    rows: int = 0
+    partitions: int = 0
+    first_date: Optional[date] = None
+    last_date: Optional[date] = None
+
+
+def _read_manifest(output_dir: Path) -> Optional[date]:
+    """Return the last fully exported race date, if any."""
+    manifest = output_dir / MANIFEST_NAME
+    if not manifest.exists():
+        return None
+    data = json.loads(manifest.read_text())
+    return date.fromisoformat(data["last_exported_date"])
+
+
+def _write_manifest(output_dir: Path, last_date: date) -> None:
+    manifest = output_dir / MANIFEST_NAME
+    tmp = manifest.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"last_exported_date": last_date.isoformat()}))
+    os.replace(tmp, manifest)
+
+
+class _PartitionWriter:
+    """Writes one (race_date, track) partition, committing it by atomic rename."""
+
+    def __init__(self, output_dir: Path, race_date: date, track_id: int):
+        directory = output_dir / f"race_date={race_date.isoformat()}" / f"track_id={track_id}"
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / "part-0.parquet"
+        self.tmp_path = directory / "part-0.parquet.tmp"
+        self.writer = pq.ParquetWriter(self.tmp_path, EXPORT_SCHEMA, compression="zstd")
+
+    def write(self, rows: List[Tuple[Any, ...]]) -> None:
+        columns = list(zip(*rows))[len(PARTITION_COLUMNS):]
+        arrays = [
+            pa.array(values, type=field.type)
+            for values, field in zip(columns, EXPORT_SCHEMA)
+        ]
+        self.writer.write_table(pa.Table.from_arrays(arrays, schema=EXPORT_SCHEMA))
+
+    def close(self) -> None:
+        self.writer.close()
+        os.replace(self.tmp_path, self.path)
+
+
+async def export_race_history(
+    output_dir: Path,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    incremental: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    db_engine: AsyncEngine = engine,
+) -> ExportResult:
+    """
+    Export joined race history to partitioned Parquet files.
+    경주 이력을 날짜/경마장 파티션 Parquet 파일로 내보내기
+
+    Args:
+        output_dir: Dataset root directory
+        since: First race date to export (inclusive)
+        until: Last race date to export (exclusive, defaults to today)
+        incremental: Skip dates up to the last date recorded in the manifest
+        batch_size: Rows fetched per server-side cursor batch
+        db_engine: Engine to stream from
+
+    Returns:
+        Export summary
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    until = until or date.today()
+
+    if incremental:
+        last_exported = _read_manifest(output_dir)
+        if last_exported is not None and (since is None or since <= last_exported):
+            since = date.fromordinal(last_exported.toordinal() + 1)
+
+    stmt = (
+        select(*EXPORT_COLUMNS)
+        .join(Race, (Race.id == RaceEntry.race_id) & (Race.race_date == RaceEntry.race_date))
+        .join(Horse, Horse.id == RaceEntry.horse_id)
+        # Bounds on the partition column let TimescaleDB skip whole chunks
+        .where(RaceEntry.race_date < until)
+        .order_by(Race.race_date, Race.race_track_id, Race.id, RaceEntry.gate_number)
+    )
+    if since is not None:
+        stmt = stmt.where(RaceEntry.race_date >= since)
+
+    logger.info(f"Exporting race history [{since or 'start'}, {until}) to {output_dir}")
+
+    result = ExportResult()
+    writer: Optional[_PartitionWriter] = None
+    current_key: Optional[Tuple[date, int]] = None
+
+    try:
+        async with db_engine.connect() as conn:
+            stream = await conn.stream(stmt.execution_options(yield_per=batch_size))
+            async for batch in stream.partitions(batch_size):
+                for key, group in groupby(batch, key=lambda row: (row[0], row[1])):
+                    if key != current_key:
+                        if writer is not None:
+                            writer.close()
+                        writer = _PartitionWriter(output_dir, *key)
+                        current_key = key
+                        result.partitions += 1
+                        result.first_date = result.first_date or key[0]
+                        result.last_date = key[0]
+                    rows = list(group)
+                    writer.write(rows)
+                    result.rows += len(rows)
+        if writer is not None:
+            writer.close()
+            writer = None
+    finally:
+        # Leave an interrupted partition as a .tmp file; it is rewritten next run
+        if writer is not None:
+            writer.writer.close()
+
+    if result.last_date is not None:
+        _write_manifest(output_dir, result.last_date)
+
+    logger.info(
+        f"Exported {result.rows} rows in {result.partitions} partitions "
+        f"({result.first_date} ~ {result.last_date})"
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export race history to Parquet")
+    parser.add_argument("output_dir", type=Path)
+    parser.add_argument("--since", type=date.fromisoformat)
+    parser.add_argument("--until", type=date.fromisoformat)
+    parser.add_argument("--full", action="store_true", help="Ignore the manifest")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(
+        export_race_history(
+            args.output_dir,
+            since=args.since,
+            until=args.until,
+            incremental=not args.full,
+            batch_size=args.batch_size,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
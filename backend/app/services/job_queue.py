@@ -0,0 +1,272 @@
+"""
+Durable Postgres job queue.
+Postgres 기반 작업 큐 (FOR UPDATE SKIP LOCKED)
+
+Workers claim due jobs with ``FOR UPDATE SKIP LOCKED`` so any number of worker
+processes can poll the same table without blocking each other or running a job
+twice. A claim is a lease: the worker must heartbeat before ``lease_expires_at``
+or the job becomes claimable again.
+"""
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any
+
+from sqlalchemy import select, update, func, or_, and_, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.job import Job, ACTIVE_JOB_WHERE
+
+logger = logging.getLogger(__name__)
+
+
+def _db_now():
+    """Current UTC time from the database clock (shared by all workers)."""
+    return func.timezone("UTC", func.now())
+
+
+def _lease_until():
+    return _db_now() + timedelta(seconds=settings.JOB_LEASE_SECONDS)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """
+    Exponential backoff with jitter for the next attempt.
+
+    Args:
+        attempts: Attempts made so far (>= 1)
+
+    Returns:
+        Delay before the job becomes claimable again
+    """
+    delay = settings.JOB_BACKOFF_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    delay = min(delay, settings.JOB_BACKOFF_MAX_SECONDS)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+async def enqueue(
+    db: AsyncSession,
+    job_type: str,
+    dedupe_key: str,
+    payload: Optional[Dict[str, Any]] = None,
+    run_at: Optional[datetime] = None,
+    max_attempts: Optional[int] = None,
+    once: bool = False
+) -> Optional[int]:
+    """
+    Enqueue a job unless one with the same dedupe key is already queued/running.
+    작업 등록 (동일 키의 대기/실행 중 작업이 있으면 무시)
+
+    Args:
+        db: Database session (caller commits)
+        job_type: Handler name
+        dedupe_key: Key identifying the unit of work, e.g. ``predict:12:win``
+        payload: Handler parameters
+        run_at: Earliest execution time (naive UTC), defaults to now
+        max_attempts: Attempts before the job is marked failed
+        once: Also skip if a job with this key has already succeeded
+            (scheduled per-day / per-race work re-queued on worker restarts)
+
+    Returns:
+        New job ID, or None if deduplicated
+    """
+    if once:
+        done = await db.execute(
+            select(Job.id)
+            .where(Job.dedupe_key == dedupe_key, Job.status == "succeeded")
+            .limit(1)
+        )
+        if done.scalar_one_or_none() is not None:
+            logger.debug(f"Job already succeeded: {dedupe_key}")
+            return None
+
+    stmt = (
+        insert(Job)
+        .values(
+            job_type=job_type,
+            dedupe_key=dedupe_key,
+            payload=payload or {},
+            status="queued",
+            attempts=0,
+            max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+            run_at=run_at or datetime.utcnow(),
+        )
+        .on_conflict_do_nothing(
+            index_elements=[Job.dedupe_key],
+            index_where=text(ACTIVE_JOB_WHERE),
+        )
+        .returning(Job.id)
+    )
+    job_id = (await db.execute(stmt)).scalar_one_or_none()
+    if job_id is None:
+        logger.debug(f"Job deduplicated: {dedupe_key}")
+    return job_id
+
+
+async def reschedule(db: AsyncSession, dedupe_key: str, run_at: datetime) -> bool:
+    """
+    Move a queued (not yet claimed) job to a new run time.
+
+    Args:
+        db: Database session (caller commits)
+        dedupe_key: Key of the job
+        run_at: New earliest execution time (naive UTC)
+
+    Returns:
+        True if a queued job was moved
+    """
+    stmt = (
+        update(Job)
+        .where(Job.dedupe_key == dedupe_key, Job.status == "queued", Job.run_at != run_at)
+        .values(run_at=run_at, updated_at=_db_now())
+        .execution_options(synchronize_session=False)
+    )
+    return (await db.execute(stmt)).rowcount > 0
+
+
+async def claim(db: AsyncSession, worker_id: str, limit: int = 1) -> List[Job]:
+    """
+    Claim up to ``limit`` due jobs (queued, or running with an expired lease).
+
+    A job whose lease expired on its last attempt (the worker died or hung)
+    is marked failed instead of being run again.
+
+    Args:
+        db: Database session; committed here so the lease is visible at once
+        worker_id: Claiming worker
+        limit: Maximum number of jobs
+
+    Returns:
+        Claimed jobs
+    """
+    abandoned = (
+        update(Job)
+        .where(
+            Job.status == "running",
+            Job.lease_expires_at < _db_now(),
+            Job.attempts >= Job.max_attempts,
+        )
+        .values(
+            status="failed",
+            locked_by=None,
+            lease_expires_at=None,
+            last_error="Lease expired on the last attempt",
+            finished_at=_db_now(),
+        )
+        .returning(Job.id, Job.dedupe_key, Job.attempts)
+        .execution_options(synchronize_session=False)
+    )
+    for job_id, dedupe_key, attempts in await db.execute(abandoned):
+        logger.error(f"Job {job_id} ({dedupe_key}) failed after {attempts} attempts: lease expired")
+
+    due = (
+        select(Job.id)
+        .where(
+            or_(
+                and_(Job.status == "queued", Job.run_at <= _db_now()),
+                and_(
+                    Job.status == "running",
+                    Job.lease_expires_at < _db_now(),
+                    Job.attempts < Job.max_attempts,
+                ),
+            )
+        )
+        .order_by(Job.run_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(Job)
+        .where(Job.id.in_(due))
+        .values(
+            status="running",
+            locked_by=worker_id,
+            lease_expires_at=_lease_until(),
+            attempts=Job.attempts + 1,
+            updated_at=_db_now(),
+        )
+        .returning(Job)
+        .execution_options(synchronize_session=False)
+    )
+    jobs = list((await db.execute(stmt)).scalars())
+    await db.commit()
+    return jobs
+
+
+async def heartbeat(db: AsyncSession, job_id: int, worker_id: str) -> bool:
+    """
+    Extend the lease of a running job.
+
+    Returns:
+        False if the lease was lost (expired and claimed by another worker)
+    """
+    stmt = (
+        update(Job)
+        .where(Job.id == job_id, Job.locked_by == worker_id, Job.status == "running")
+        .values(lease_expires_at=_lease_until())
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(stmt)
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def complete(db: AsyncSession, job_id: int, worker_id: str) -> None:
+    """Mark a job succeeded (no-op if the lease was lost)."""
+    stmt = (
+        update(Job)
+        .where(Job.id == job_id, Job.locked_by == worker_id, Job.status == "running")
+        .values(
+            status="succeeded",
+            locked_by=None,
+            lease_expires_at=None,
+            finished_at=_db_now(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+
+async def fail(
+    db: AsyncSession,
+    job: Job,
+    worker_id: str,
+    error: str
+) -> None:
+    """
+    Record a failed attempt: requeue with backoff, or mark failed when exhausted.
+
+    Args:
+        db: Database session
+        job: Claimed job (``attempts`` already includes this attempt)
+        worker_id: Worker holding the lease
+        error: Error description
+    """
+    exhausted = job.attempts >= job.max_attempts
+    values: Dict[str, Any] = {
+        "locked_by": None,
+        "lease_expires_at": None,
+        "last_error": error[:4000],
+    }
+    if exhausted:
+        values.update(status="failed", finished_at=_db_now())
+    else:
+        values.update(status="queued", run_at=_db_now() + retry_delay(job.attempts))
+
+    stmt = (
+        update(Job)
+        .where(Job.id == job.id, Job.locked_by == worker_id, Job.status == "running")
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+    if exhausted:
+        logger.error(f"Job {job.id} ({job.dedupe_key}) failed after {job.attempts} attempts: {error}")
+    else:
+        logger.warning(f"Job {job.id} ({job.dedupe_key}) attempt {job.attempts} failed: {error}")
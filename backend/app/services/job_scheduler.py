@@ -0,0 +1,220 @@
+"""
+Race-day job scheduling.
+경주 일정 기반 작업 예약 (캐시 예열, 출전 정보 동기화, 예측 T-30분, 결과 재동기화 T+10분)
+"""
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, List, NamedTuple, Optional
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.race import Race
+from app.services import job_queue
+from app.services.prediction_service import PREDICTION_TYPES
+
+logger = logging.getLogger(__name__)
+
+# KRA track codes (1=서울, 2=제주, 3=부산경남); race_tracks.id uses the same values
+KRA_TRACK_CODES = (1, 2, 3)
+
+# Local time at which the next day's schedule sync is queued
+DAILY_SCHEDULE_TIME = time(6, 0)
+
+# Entries (weights, odds) are refreshed this long before the predict jobs run
+ENTRY_SYNC_BEFORE_PREDICT = timedelta(minutes=5)
+
+# Races that need no further prediction or results jobs
+FINISHED_RACE_STATUSES = ("completed", "cancelled")
+
+# Results sync retries until the race is official (backoff reaches ~1h in total)
+RESULTS_SYNC_MAX_ATTEMPTS = 8
+
+
+class RaceJob(NamedTuple):
+    """A job timed from a race's start_time."""
+    job_type: str
+    dedupe_key: str
+    payload: Dict[str, Any]
+    run_at: datetime
+    max_attempts: Optional[int] = None
+
+
+def race_today() -> date:
+    """Today's date in the race timezone."""
+    return datetime.now(ZoneInfo(settings.RACE_TIMEZONE)).date()
+
+
+def to_utc(race_date: date, local_time: time) -> datetime:
+    """Convert a race-local date/time to naive UTC (the jobs.run_at convention)."""
+    local = datetime.combine(race_date, local_time, tzinfo=ZoneInfo(settings.RACE_TIMEZONE))
+    return local.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+async def schedule_day(db: AsyncSession, race_date: date) -> None:
+    """
+    Queue schedule syncs for every track, and the next day's schedule_day job.
+
+    Args:
+        db: Database session (committed here)
+        race_date: Race date to prepare
+    """
+    for track_code in KRA_TRACK_CODES:
+        await job_queue.enqueue(
+            db,
+            "sync_schedule",
+            f"sync_schedule:{race_date}:{track_code}",
+            {"race_date": race_date.isoformat(), "track_code": track_code},
+            once=True,
+        )
+
+    next_day = race_date + timedelta(days=1)
+    await job_queue.enqueue(
+        db,
+        "schedule_day",
+        f"schedule_day:{next_day}",
+        {"race_date": next_day.isoformat()},
+        run_at=to_utc(next_day, DAILY_SCHEDULE_TIME),
+        once=True,
+    )
+    await db.commit()
+
+
+def race_jobs(race: Race) -> List[RaceJob]:
+    """
+    Entry sync, predict and results jobs of a race, timed from its start_time.
+
+    Args:
+        race: Race with a start_time
+
+    Returns:
+        Jobs in run order
+    """
+    start = to_utc(race.race_date, race.start_time)
+    lead = timedelta(minutes=settings.PREDICT_LEAD_MINUTES)
+    delay = timedelta(minutes=settings.RESULTS_RESYNC_DELAY_MINUTES)
+    race_key = f"{race.race_date}:{race.race_track_id}:{race.race_number}"
+    sync_payload = {
+        "race_date": race.race_date.isoformat(),
+        "track_code": race.race_track_id,
+        "race_number": race.race_number,
+    }
+
+    jobs = [
+        RaceJob(
+            "sync_entries",
+            f"sync_entries:{race_key}",
+            sync_payload,
+            start - lead - ENTRY_SYNC_BEFORE_PREDICT,
+        )
+    ]
+    jobs += [
+        RaceJob(
+            "predict",
+            f"predict:{race.id}:{prediction_type}",
+            {"race_id": race.id, "prediction_type": prediction_type},
+            start - lead,
+        )
+        for prediction_type in PREDICTION_TYPES
+    ]
+    jobs.append(
+        RaceJob(
+            "sync_results",
+            f"sync_results:{race_key}",
+            sync_payload,
+            start + delay,
+            max_attempts=RESULTS_SYNC_MAX_ATTEMPTS,
+        )
+    )
+    return jobs
+
+
+async def schedule_race_jobs(
+    db: AsyncSession,
+    race_date: date,
+    track_id: Optional[int] = None
+) -> int:
+    """
+    Queue entry sync and prediction (T-PREDICT_LEAD_MINUTES) and results resync
+    (T+RESULTS_RESYNC_DELAY_MINUTES) jobs from each race's start_time, plus
+    a warm-up of the synced card.
+
+    Args:
+        db: Database session (committed here)
+        race_date: Race date
+        track_id: Limit to one track
+
+    Returns:
+        Number of jobs newly queued
+    """
+    stmt = select(Race).where(Race.race_date == race_date, Race.start_time.is_not(None))
+    if track_id is not None:
+        stmt = stmt.where(Race.race_track_id == track_id)
+    races = (await db.execute(stmt)).scalars().all()
+
+    now = datetime.utcnow()
+    queued = 0
+    for race in races:
+        if race.race_status in FINISHED_RACE_STATUSES:
+            continue
+        # Re-runs of this function (worker restarts, resyncs) must not predict
+        # races that are already off or predicted
+        pre_race = (
+            to_utc(race.race_date, race.start_time) > now
+            and race.race_status in (None, "scheduled")
+        )
+        for job in race_jobs(race):
+            if job.job_type != "sync_results" and not pre_race:
+                continue
+            job_id = await job_queue.enqueue(
+                db,
+                job.job_type,
+                job.dedupe_key,
+                job.payload,
+                run_at=job.run_at,
+                max_attempts=job.max_attempts,
+                once=True,
+            )
+            queued += job_id is not None
+
+    # Warm contexts/baseline books of the freshly synced card ahead of the predict jobs
+    if races:
+        warmup_key = f"warmup:{race_date}" + (f":{track_id}" if track_id is not None else "")
+        job_id = await job_queue.enqueue(
+            db,
+            "warmup",
+            warmup_key,
+            {"race_date": race_date.isoformat(), "track_code": track_id},
+        )
+        queued += job_id is not None
+
+    await db.commit()
+    logger.info(f"Scheduled {queued} jobs for {len(races)} races on {race_date}")
+    return queued
+
+
+async def retime_race_jobs(db: AsyncSession, race: Race) -> int:
+    """
+    Move a race's still-queued jobs to its (changed) start_time.
+    출발 시각 변경 시 대기 중인 작업 시각 조정
+
+    Jobs already claimed or finished are left alone.
+
+    Args:
+        db: Database session (committed here)
+        race: Race whose start_time changed
+
+    Returns:
+        Number of jobs moved
+    """
+    if race.start_time is None or race.race_status in FINISHED_RACE_STATUSES:
+        return 0
+    moved = 0
+    for job in race_jobs(race):
+        moved += await job_queue.reschedule(db, job.dedupe_key, job.run_at)
+    await db.commit()
+    if moved:
+        logger.info(f"Race {race.id}: moved {moved} queued jobs to start time {race.start_time}")
+    return moved
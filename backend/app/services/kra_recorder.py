@@ -0,0 +1,122 @@
+"""
+KRA API response recorder.
+KRA API 응답 녹화 (재생 서버용)
+
+When KRA_API_RECORD_DIR is set, every successful response received by
+``KRAAPIClient`` (HTTP 2xx with an OK resultCode) is stored as
+``<dir>/<endpoint>/<key>.json`` where the key is derived from the request
+parameters (the service key is never written). ``benchmarks/kra_replay.py``
+serves these recordings back for load and retry testing; errors are injected
+there rather than recorded.
+"""
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Added by the client on every request; not part of the recording key
+TRANSPORT_PARAMS = ("serviceKey", "_type")
+
+
+def endpoint_dir_name(endpoint: str) -> str:
+    """``API187/raceSchedule`` -> ``API187__raceSchedule`` (same as the fixtures)."""
+    return endpoint.strip("/").replace("/", "__")
+
+
+def recording_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """
+    Stable key for an endpoint + parameter set (parameter order and types ignored).
+
+    Args:
+        endpoint: API endpoint path
+        params: Query parameters
+
+    Returns:
+        ``<endpoint dir>/<hash>``
+    """
+    relevant = sorted((k, str(v)) for k, v in params.items() if k not in TRANSPORT_PARAMS)
+    digest = hashlib.sha1(json.dumps(relevant).encode()).hexdigest()[:16]
+    return f"{endpoint_dir_name(endpoint)}/{digest}"
+
+
+@dataclass(frozen=True)
+class Recording:
+    """녹화된 응답 한 건 (One recorded response)"""
+    endpoint: str
+    params: Dict[str, str]
+    status_code: int
+    content_type: str
+    body: str
+    recorded_at: str
+
+    @property
+    def key(self) -> str:
+        return recording_key(self.endpoint, self.params)
+
+    @classmethod
+    def load(cls, path: Path) -> "Recording":
+        return cls(**json.loads(path.read_text(encoding="utf-8")))
+
+
+class KRAResponseRecorder:
+    """Writes KRA responses to a recordings directory."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+
+    def record(self, endpoint: str, params: Dict[str, Any], response: httpx.Response) -> Path:
+        """
+        Store a response (a later recording of the same request replaces it).
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters sent
+            response: Response received
+
+        Returns:
+            Path of the recording file
+        """
+        recording = Recording(
+            endpoint=endpoint,
+            params={k: str(v) for k, v in params.items() if k not in TRANSPORT_PARAMS},
+            status_code=response.status_code,
+            content_type=response.headers.get("content-type", "application/json"),
+            body=response.text,
+            recorded_at=datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        )
+        path = self.directory / f"{recording.key}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(asdict(recording), ensure_ascii=False, indent=2),
+            encoding="utf-8"
+        )
+        os.replace(tmp_path, path)
+        logger.debug(f"Recorded KRA response {recording.key}")
+        return path
+
+
+def load_recordings(directory: Path) -> Dict[str, Recording]:
+    """
+    Load every recording under a directory.
+
+    Args:
+        directory: Recordings directory (KRA_API_RECORD_DIR)
+
+    Returns:
+        recording_key -> Recording
+    """
+    recordings = {}
+    for path in sorted(Path(directory).glob("*/*.json")):
+        recording = Recording.load(path)
+        recordings[recording.key] = recording
+    return recordings
+
@@ -4,13 +4,182 @@ Korea Racing Authority API sync service for fetching race data from data.go.kr
 """
 import httpx
 import logging
-from typing import Optional, Dict, List, Any
-from datetime import date, datetime
+import re
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional, Dict, List, Any, Tuple
+from datetime import date, datetime, time
+from sqlalchemy import select, Numeric
+from sqlalchemy.ext.asyncio import AsyncSession
+from opentelemetry.trace import SpanKind
 from tenacity import retry, stop_after_attempt, wait_exponential
 from app.core.config import settings
+from app.core.cache import PROFILE_TAG, response_cache
+from app.core.pubsub import race_events
+from app.core.tracing import tracer
+from app.db.session import AsyncSessionLocal
+from app.models.race import Race, RaceEntry
+from app.services import job_scheduler
+from app.services.kra_recorder import KRAResponseRecorder
+from app.services.prediction_dependency_service import mark_stale_predictions
 
 logger = logging.getLogger(__name__)
 
+# Entry fields refreshed from KRA; changes are published to race subscribers
+ENTRY_SYNC_FIELDS = (
+    "horse_weight_kg",
+    "handicap_weight_kg",
+    "morning_odds",
+    "final_odds",
+    "popularity_rank",
+    "scratched",
+    "finish_position",
+    "finish_time",
+    "margin",
+)
+
+# Race fields refreshed from KRA (late start-time / distance changes, day-of conditions)
+RACE_SYNC_FIELDS = (
+    "distance",
+    "start_time",
+    "weather",
+    "track_condition",
+    "race_status",
+)
+
+
+# Rows requested per page when syncing a whole day
+SYNC_PAGE_SIZE = 100
+
+# resultCode values meaning the request succeeded (03 = no data for the query)
+KRA_OK_RESULT_CODES = ("00", "03")
+
+# data.go.kr gateway errors arrive as HTTP 200 with an XML body
+_GATEWAY_REASON = re.compile(r"<returnReasonCode>(\w+)</returnReasonCode>")
+_GATEWAY_MESSAGE = re.compile(r"<returnAuthMsg>([^<]*)</returnAuthMsg>")
+
+
+class KRAAPIError(Exception):
+    """KRA API error reported in the response body (HTTP 200)."""
+
+    def __init__(self, result_code: str, message: str):
+        super().__init__(f"KRA API error {result_code}: {message}")
+        self.result_code = result_code
+        self.message = message
+
+
+class KRAResultsPendingError(Exception):
+    """Results of a race requested before KRA published them (retried by the job queue)."""
+
+    def __init__(self, race_date: date, track_code: int, race_number: int):
+        super().__init__(
+            f"No results yet for {race_date} track {track_code} race {race_number}"
+        )
+        self.race_date = race_date
+        self.track_code = track_code
+        self.race_number = race_number
+
+
+def _check_result(response: httpx.Response) -> Dict[str, Any]:
+    """Parse a KRA response, raising KRAAPIError for error bodies."""
+    try:
+        data = response.json()
+    except ValueError:
+        text = response.text
+        reason = _GATEWAY_REASON.search(text)
+        message = _GATEWAY_MESSAGE.search(text)
+        raise KRAAPIError(
+            reason.group(1) if reason else "invalid",
+            message.group(1) if message else text[:200],
+        )
+
+    header = data.get("response", {}).get("header", {}) if isinstance(data, dict) else {}
+    result_code = header.get("resultCode")
+    if result_code is not None and result_code not in KRA_OK_RESULT_CODES:
+        raise KRAAPIError(result_code, header.get("resultMsg", ""))
+    return data
+
+
+@dataclass(frozen=True)
+class EntryChange:
+    """출전 정보 변경 (Changed fields of one entry: field -> (old, new))"""
+    entry_id: int
+    gate_number: int
+    changes: Dict[str, Tuple[Any, Any]]
+
+
+def _normalize(field: str, value: Any, model=RaceEntry) -> Any:
+    """Coerce KRA values to the column type so unchanged values compare equal."""
+    if value is None:
+        return None
+    if isinstance(model.__table__.c[field].type, Numeric):
+        return Decimal(str(value))
+    return value
+
+
+def _items(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Rows of a KRA envelope (``items.item`` is a dict for one row, "" for none)."""
+    body = data.get("response", {}).get("body") or {}
+    items = body.get("items") or {}
+    rows = items.get("item") if isinstance(items, dict) else None
+    if rows is None:
+        return []
+    return rows if isinstance(rows, list) else [rows]
+
+
+def _parse_weight(value: Any) -> Optional[Decimal]:
+    """``"495(+8)"`` -> 495 (body weight with the change since last start)."""
+    if value in (None, ""):
+        return None
+    match = re.match(r"\s*(\d+(?:\.\d+)?)", str(value))
+    return Decimal(match.group(1)) if match else None
+
+
+def _parse_start_time(value: Any) -> Optional[time]:
+    """``"1030"`` / ``"10:30"`` -> 10:30."""
+    digits = re.sub(r"\D", "", str(value or ""))
+    if len(digits) not in (3, 4):
+        return None
+    return time(int(digits[:-2]), int(digits[-2:]))
+
+
+def _present(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop fields KRA left blank so they never overwrite stored values."""
+    return {field: value for field, value in row.items() if value is not None}
+
+
+def _schedule_row(item: Dict[str, Any]) -> Dict[str, Any]:
+    """KRA schedule row -> Race column values."""
+    return _present({
+        "race_number": int(item["rcNo"]),
+        "race_name": item.get("rcName"),
+        "race_class": item.get("divSn"),
+        "distance": int(item["rcDist"]) if item.get("rcDist") else None,
+        "start_time": _parse_start_time(item.get("rcTime")),
+        "prize_money": int(item["prize1"]) if item.get("prize1") else None,
+        "weather": item.get("weather") or None,
+        "track_condition": item.get("trackStat") or None,
+    })
+
+
+def _entry_row(item: Dict[str, Any]) -> Dict[str, Any]:
+    """KRA entry row -> ENTRY_SYNC_FIELDS values keyed by gate number."""
+    return _present({
+        "gate_number": int(item["chulNo"]),
+        "horse_weight_kg": _parse_weight(item.get("wgHr")),
+        "handicap_weight_kg": item.get("wgBudam") or None,
+        "final_odds": item.get("winOdds") or None,
+    })
+
+
+def _result_row(item: Dict[str, Any]) -> Dict[str, Any]:
+    """KRA result row -> ENTRY_SYNC_FIELDS values keyed by gate number."""
+    return _present({
+        **_entry_row(item),
+        "finish_position": int(item["ord"]) if item.get("ord") else None,
+        "finish_time": item.get("rcTime") or None,
+    })
+
 
 class KRAAPIClient:
     """한국마사회 공공데이터 API 클라이언트"""
@@ -19,6 +188,10 @@ class KRAAPIClient:
         self.base_url = settings.KRA_API_BASE_URL
         self.api_key = settings.KRA_API_KEY
         self.timeout = settings.KRA_API_TIMEOUT
+        self.recorder = (
+            KRAResponseRecorder(settings.KRA_API_RECORD_DIR)
+            if settings.KRA_API_RECORD_DIR else None
+        )
 
     @retry(
         stop=stop_after_attempt(settings.KRA_API_MAX_RETRIES),
@@ -47,24 +220,35 @@ class KRAAPIClient:
         params["serviceKey"] = self.api_key
         params["_type"] = "json"  # Request JSON response
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-                logger.info(f"KRA API request successful: {endpoint}")
-                return data
-
-            except httpx.HTTPStatusError as e:
-                logger.error(f"KRA API HTTP error: {e.response.status_code} - {e.response.text}")
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"KRA API request error: {str(e)}")
-                raise
-            except Exception as e:
-                logger.error(f"KRA API unexpected error: {str(e)}")
-                raise
+        with tracer.start_as_current_span(
+            "kra.request", kind=SpanKind.CLIENT, attributes={"kra.endpoint": endpoint}
+        ) as span:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                try:
+                    response = await client.get(url, params=params)
+                    span.set_attribute("http.status_code", response.status_code)
+                    response.raise_for_status()
+                    data = _check_result(response)
+                    # Only good responses are recorded: a later throttle or
+                    # 5xx must not overwrite the recording of a request
+                    if self.recorder is not None:
+                        self.recorder.record(endpoint, params, response)
+
+                    logger.info(f"KRA API request successful: {endpoint}")
+                    return data
+
+                except httpx.HTTPStatusError as e:
+                    logger.error(f"KRA API HTTP error: {e.response.status_code} - {e.response.text}")
+                    raise
+                except httpx.RequestError as e:
+                    logger.error(f"KRA API request error: {str(e)}")
+                    raise
+                except KRAAPIError as e:
+                    logger.error(f"KRA API {endpoint}: {str(e)}")
+                    raise
+                except Exception as e:
+                    logger.error(f"KRA API unexpected error: {str(e)}")
+                    raise
 
     async def get_race_schedule(
         self,
@@ -188,56 +372,294 @@ class KRASyncService:
     def __init__(self):
         self.client = KRAAPIClient()
 
-    async def sync_race_schedule(self, race_date: date) -> List[Dict[str, Any]]:
+    async def _fetch_all(self, fetch, race_date: date, **params) -> List[Dict[str, Any]]:
+        """Collect every page of a day-level KRA listing."""
+        rows: List[Dict[str, Any]] = []
+        page_no = 1
+        while True:
+            data = await fetch(race_date, page_no=page_no, num_of_rows=SYNC_PAGE_SIZE, **params)
+            page = _items(data)
+            rows.extend(page)
+            total = (data.get("response", {}).get("body") or {}).get("totalCount") or 0
+            if not page or len(rows) >= int(total):
+                return rows
+            page_no += 1
+
+    async def _load_races(
+        self,
+        db: AsyncSession,
+        race_date: date,
+        track_code: int
+    ) -> Dict[int, Race]:
+        stmt = select(Race).where(Race.race_date == race_date, Race.race_track_id == track_code)
+        return {race.race_number: race for race in (await db.execute(stmt)).scalars()}
+
+    async def sync_race_schedule(
+        self,
+        race_date: date,
+        track_code: int = 1
+    ) -> List[Dict[str, Any]]:
         """
         Sync race schedule for a specific date.
         특정 날짜의 경주 일정 동기화
 
+        New races are inserted; start time, distance and day-of conditions of
+        existing races go through apply_race_updates so subscribers and stale
+        predictions see the change.
+
         Args:
             race_date: Date to sync
+            track_code: Track code (1=서울, 2=제주, 3=부산경남)
 
         Returns:
             List of synchronized races
         """
-        logger.info(f"Syncing race schedule for {race_date}")
-
-        # TODO: Implement actual sync logic
-        # 1. Fetch data from KRA API
-        # 2. Parse and validate data
-        # 3. Save to database
-        # 4. Return synced races
+        logger.info(f"Syncing race schedule for {race_date} (track {track_code})")
 
         try:
-            data = await self.client.get_race_schedule(race_date)
-            # Process and save data
-            logger.info(f"Successfully synced {len(data)} races")
-            return data
+            rows = [
+                _schedule_row(item)
+                for item in await self._fetch_all(
+                    self.client.get_race_schedule, race_date, track_code=track_code
+                )
+            ]
+            async with AsyncSessionLocal() as db:
+                races = await self._load_races(db, race_date, track_code)
+                created = [
+                    Race(race_track_id=track_code, race_date=race_date, **row)
+                    for row in rows if row["race_number"] not in races
+                ]
+                if created:
+                    db.add_all(created)
+                    await db.commit()
+                for row in rows:
+                    race = races.get(row["race_number"])
+                    if race is not None:
+                        await self.apply_race_updates(db, race, row)
+
+            await response_cache.invalidate_tags(f"date:{race_date}")
+            logger.info(f"Successfully synced {len(rows)} races ({len(created)} new)")
+            return rows
         except Exception as e:
             logger.error(f"Failed to sync race schedule: {str(e)}")
             raise
 
-    async def sync_race_results(self, race_date: date) -> List[Dict[str, Any]]:
+    async def sync_race_entries(
+        self,
+        race_date: date,
+        track_code: int,
+        race_number: int
+    ) -> List[EntryChange]:
+        """
+        Sync weights and odds of a race's existing entries.
+        출전 정보 (마체중 / 부담중량 / 배당률) 동기화
+
+        Args:
+            race_date: Race date
+            track_code: Track code
+            race_number: Race number
+
+        Returns:
+            Changes per entry
+        """
+        logger.info(f"Syncing entries for {race_date} track {track_code} race {race_number}")
+
+        try:
+            data = await self.client.get_race_entries(race_date, track_code, race_number)
+            rows = [_entry_row(item) for item in _items(data)]
+            async with AsyncSessionLocal() as db:
+                race = (await self._load_races(db, race_date, track_code)).get(race_number)
+                if race is None:
+                    logger.warning(f"No race {race_number} on {race_date} (track {track_code})")
+                    return []
+                return await self.apply_entry_updates(db, race, rows)
+        except Exception as e:
+            logger.error(f"Failed to sync race entries: {str(e)}")
+            raise
+
+    async def sync_race_results(
+        self,
+        race_date: date,
+        track_code: int = 1,
+        race_number: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Sync race results for a specific date.
         특정 날짜의 경주 결과 동기화
 
+        Races with results are marked completed before their entries are
+        updated, so finishing odds do not make their predictions stale. Until
+        a race is official KRA returns no rows (resultCode 03) or rows without
+        finishing positions; such races are left untouched.
+
         Args:
             race_date: Date to sync
+            track_code: Track code (1=서울, 2=제주, 3=부산경남)
+            race_number: Specific race number (optional)
 
         Returns:
             List of synchronized results
+
+        Raises:
+            KRAResultsPendingError: ``race_number`` has no results yet (and was
+                not cancelled)
         """
-        logger.info(f"Syncing race results for {race_date}")
+        logger.info(f"Syncing race results for {race_date} (track {track_code})")
 
         try:
-            data = await self.client.get_race_results(race_date)
-            # Process and save data
-            logger.info(f"Successfully synced race results")
-            return data
+            params = {"track_code": track_code}
+            if race_number is not None:
+                params["race_number"] = race_number
+            items = await self._fetch_all(self.client.get_race_results, race_date, **params)
+
+            by_race: Dict[int, List[Dict[str, Any]]] = {}
+            for item in items:
+                by_race.setdefault(int(item["rcNo"]), []).append(_result_row(item))
+            by_race = {
+                number: rows for number, rows in by_race.items()
+                if any(row.get("finish_position") for row in rows)
+            }
+
+            async with AsyncSessionLocal() as db:
+                races = await self._load_races(db, race_date, track_code)
+                requested = races.get(race_number) if race_number is not None else None
+                if (
+                    requested is not None
+                    and race_number not in by_race
+                    and requested.race_status != "cancelled"
+                ):
+                    raise KRAResultsPendingError(race_date, track_code, race_number)
+                for number, rows in by_race.items():
+                    race = races.get(number)
+                    if race is None:
+                        logger.warning(f"Results for unknown race {number} on {race_date}")
+                        continue
+                    await self.apply_race_updates(db, race, {"race_status": "completed"})
+                    await self.apply_entry_updates(db, race, rows)
+
+            await response_cache.invalidate_tags(f"date:{race_date}", PROFILE_TAG)
+            logger.info(f"Successfully synced results of {len(by_race)} races")
+            return items
+        except KRAResultsPendingError as e:
+            logger.info(str(e))
+            raise
         except Exception as e:
             logger.error(f"Failed to sync race results: {str(e)}")
             raise
 
+    async def apply_entry_updates(
+        self,
+        db: AsyncSession,
+        race: Race,
+        updates: List[Dict[str, Any]]
+    ) -> List[EntryChange]:
+        """
+        Apply parsed KRA entry rows to a race and publish what changed.
+        출전 정보 변경분 반영 및 구독자에게 전파
+
+        Only fields whose value actually changed are written; subscribers get a
+        single ``entries`` event per race carrying just those fields.
+
+        Args:
+            db: Database session (committed here)
+            race: Race the rows belong to
+            updates: Rows keyed by ``gate_number`` with ENTRY_SYNC_FIELDS values
+
+        Returns:
+            Changes per entry (empty if nothing changed)
+        """
+        stmt = select(RaceEntry).where(
+            RaceEntry.race_id == race.id,
+            RaceEntry.race_date == race.race_date
+        )
+        entries = {e.gate_number: e for e in (await db.execute(stmt)).scalars()}
+
+        changes: List[EntryChange] = []
+        for update in updates:
+            entry = entries.get(update.get("gate_number"))
+            if entry is None:
+                logger.warning(f"Race {race.id}: no entry for gate {update.get('gate_number')}")
+                continue
+
+            changed: Dict[str, Tuple[Any, Any]] = {}
+            for field in ENTRY_SYNC_FIELDS:
+                if field not in update:
+                    continue
+                new = _normalize(field, update[field])
+                old = getattr(entry, field)
+                if old != new:
+                    changed[field] = (old, new)
+                    setattr(entry, field, new)
+            if changed:
+                changes.append(EntryChange(entry.id, entry.gate_number, changed))
+
+        if not changes:
+            return changes
+
+        await db.commit()
+        await response_cache.invalidate_tags(f"race:{race.id}")
+        await race_events.publish(
+            race.id,
+            "entries",
+            [
+                {
+                    "entry_id": change.entry_id,
+                    "gate_number": change.gate_number,
+                    **{field: new for field, (_, new) in change.changes.items()},
+                }
+                for change in changes
+            ],
+        )
+        logger.info(f"Race {race.id}: {len(changes)} entries changed")
+        await mark_stale_predictions(db, race, entry_changes=changes)
+        return changes
+
+    async def apply_race_updates(
+        self,
+        db: AsyncSession,
+        race: Race,
+        update: Dict[str, Any]
+    ) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Apply parsed KRA race conditions (weather, track condition, status).
+        경주 정보 (날씨/주로 상태) 변경분 반영
+
+        A start_time change also moves the race's queued jobs.
+
+        Args:
+            db: Database session (committed here)
+            race: Race to update
+            update: Values keyed by RACE_SYNC_FIELDS
+
+        Returns:
+            Changed fields: field -> (old, new)
+        """
+        changed: Dict[str, Tuple[Any, Any]] = {}
+        for field in RACE_SYNC_FIELDS:
+            if field not in update:
+                continue
+            new = _normalize(field, update[field], model=Race)
+            old = getattr(race, field)
+            if old != new:
+                changed[field] = (old, new)
+                setattr(race, field, new)
+
+        if not changed:
+            return changed
+
+        await db.commit()
+        await response_cache.invalidate_tags(f"race:{race.id}", f"date:{race.race_date}")
+        await race_events.publish(
+            race.id,
+            "race",
+            {field: new for field, (_, new) in changed.items()},
+        )
+        logger.info(f"Race {race.id}: {', '.join(changed)} changed")
+        await mark_stale_predictions(db, race, race_changes=changed)
+        if "start_time" in changed:
+            await job_scheduler.retime_race_jobs(db, race)
+        return changed
+
 
 # Singleton instance
 kra_sync_service = KRASyncService()
@@ -0,0 +1,80 @@
+"""
+Prediction service HTTP client.
+LLM 예측 서비스 클라이언트
+"""
+import logging
+from typing import Dict, Any
+
+import httpx
+from opentelemetry.trace import SpanKind
+
+from app.core.config import settings
+from app.core.tracing import inject_trace_headers, tracer
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionServiceError(Exception):
+    """The prediction service answered without a usable prediction (e.g. unparsable LLM output)."""
+
+
+class PredictionServiceClient:
+    """예측 서비스 (prediction-service) 클라이언트"""
+
+    def __init__(self):
+        self.base_url = settings.PREDICTION_SERVICE_URL
+        self.timeout = settings.PREDICTION_SERVICE_TIMEOUT
+
+    async def predict(
+        self,
+        race_context: Dict[str, Any],
+        prediction_type: str
+    ) -> Dict[str, Any]:
+        """
+        Request a prediction for a race context.
+
+        Args:
+            race_context: Race context (RaceContext.to_prompt_dict())
+            prediction_type: Type of prediction (win, place, quinella, etc.)
+
+        Returns:
+            Response with ``model_version`` and ``prediction``
+
+        Raises:
+            PredictionServiceError: The prediction is the service's error fallback
+        """
+        url = f"{self.base_url}/predict"
+        payload = {"race_context": race_context, "prediction_type": prediction_type}
+
+        with tracer.start_as_current_span(
+            "prediction_service.predict",
+            kind=SpanKind.CLIENT,
+            attributes={"prediction.type": prediction_type},
+        ):
+            # traceparent lets the prediction service continue this trace
+            headers = inject_trace_headers()
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                try:
+                    response = await client.post(url, json=payload, headers=headers)
+                    response.raise_for_status()
+                    data = response.json()
+                except httpx.HTTPStatusError as e:
+                    logger.error(f"Prediction service HTTP error: {e.response.status_code} - {e.response.text}")
+                    raise
+                except httpx.RequestError as e:
+                    logger.error(f"Prediction service request error: {str(e)}")
+                    raise
+
+        # The service answers 200 with an ``error`` body when the LLM output
+        # cannot be parsed; failing here lets the predict job retry
+        prediction = data["prediction"]
+        if "error" in prediction:
+            logger.error(
+                f"Prediction service returned no {prediction_type} prediction: {prediction['error']}"
+            )
+            raise PredictionServiceError(str(prediction["error"]))
+        return data
+
+
+# Singleton instance
+prediction_client = PredictionServiceClient()
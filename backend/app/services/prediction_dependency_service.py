@@ -0,0 +1,367 @@
+"""
+Prediction dependency tracking.
+예측 의존성 추적 및 재예측 판단
+
+Each prediction stores a snapshot of the context fields it was generated from
+(race conditions plus per-entry scratch/odds/weights). When a sync writes new
+values, the changed fields are compared against every live prediction's
+snapshot with per-field significance thresholds; only predictions that moved
+past a threshold are marked ``stale`` and re-queued. The old rows stay in the
+table (``superseded`` once the new version is stored) for audit.
+
+Storing a prediction and marking predictions stale both run under a per-race
+advisory lock, and a new prediction is compared with the values committed at
+store time, so a sync that lands while the LLM call runs is never lost.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import use_primary
+from app.models.prediction import Prediction
+from app.models.race import Race, RaceEntry
+from app.services import job_queue
+from app.services.race_context_service import RaceContext
+
+logger = logging.getLogger(__name__)
+
+# Predictions are frozen once the race is off
+FROZEN_RACE_STATUSES = ("in_progress", "completed", "cancelled")
+
+# Two-key advisory lock (namespace, race_id) serializing prediction writes per race
+PREDICTION_LOCK_SQL = text("SELECT pg_advisory_xact_lock(hashtext('predictions'), :race_id)")
+
+
+@dataclass(frozen=True)
+class FieldRule:
+    """
+    Significance rule for one dependency field.
+
+    With no threshold any change is significant; otherwise a numeric change
+    counts once it reaches the absolute or relative threshold.
+    """
+    absolute: Optional[float] = None
+    relative: Optional[float] = None
+
+    def is_significant(self, used: Any, current: Any) -> bool:
+        if used == current:
+            return False
+        if used is None or current is None or (self.absolute is None and self.relative is None):
+            return True
+        delta = abs(float(current) - float(used))
+        if self.absolute is not None and delta >= self.absolute:
+            return True
+        if self.relative is not None and float(used) != 0:
+            return delta / abs(float(used)) >= self.relative
+        return False
+
+
+RACE_FIELD_RULES: Dict[str, FieldRule] = {
+    "track_condition": FieldRule(),
+    "weather": FieldRule(),
+    "distance": FieldRule(),
+    "surface_type": FieldRule(),
+}
+
+ENTRY_FIELD_RULES: Dict[str, FieldRule] = {
+    "scratched": FieldRule(),
+    "morning_odds": FieldRule(relative=settings.REPREDICT_ODDS_CHANGE_RATIO),
+    "final_odds": FieldRule(relative=settings.REPREDICT_ODDS_CHANGE_RATIO),
+    "horse_weight_kg": FieldRule(absolute=settings.REPREDICT_HORSE_WEIGHT_CHANGE_KG),
+    "handicap_weight_kg": FieldRule(absolute=settings.REPREDICT_HANDICAP_CHANGE_KG),
+}
+
+
+# Contexts use final odds once known, otherwise morning odds (see baseline_service),
+# so odds moves are judged on that effective price rather than per field
+ODDS_FIELDS = ("final_odds", "morning_odds")
+ODDS_RULE = FieldRule(relative=settings.REPREDICT_ODDS_CHANGE_RATIO)
+
+
+def effective_odds(values: Dict[str, Any]) -> Optional[float]:
+    """Odds a context prices the runner at: final odds, else morning odds."""
+    odds = values.get("final_odds") or values.get("morning_odds")
+    return float(odds) if odds is not None else None
+
+
+def capture_dependencies(context: RaceContext) -> Dict[str, Any]:
+    """
+    Snapshot the context fields a prediction depends on.
+
+    Args:
+        context: Context the prediction is generated from
+
+    Returns:
+        JSON-serializable snapshot for ``Prediction.context_snapshot``
+    """
+    return {
+        "race": {field: getattr(context, field) for field in RACE_FIELD_RULES},
+        "entries": {
+            str(entry.entry_id): {field: getattr(entry, field) for field in ENTRY_FIELD_RULES}
+            for entry in context.entries
+        },
+    }
+
+
+def _json_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    return float(value)
+
+
+def _race_reasons(used_race: Dict[str, Any], values: Dict[str, Any]) -> List[Dict[str, Any]]:
+    reasons: List[Dict[str, Any]] = []
+    for field, new in values.items():
+        rule = RACE_FIELD_RULES.get(field)
+        if rule is None:
+            continue
+        used = used_race.get(field)
+        if rule.is_significant(used, new):
+            reasons.append({"field": field, "used": used, "now": _json_value(new)})
+    return reasons
+
+
+def _entry_reasons(
+    used_entry: Optional[Dict[str, Any]],
+    entry_id: int,
+    gate_number: Optional[int],
+    values: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    reasons: List[Dict[str, Any]] = []
+    for field, new in values.items():
+        rule = ENTRY_FIELD_RULES.get(field)
+        if rule is None or (field in ODDS_FIELDS and used_entry is not None):
+            continue
+        used = used_entry.get(field) if used_entry is not None else None
+        if used_entry is None or rule.is_significant(used, new):
+            reasons.append({
+                "field": field,
+                "entry_id": entry_id,
+                "gate_number": gate_number,
+                "used": used,
+                "now": _json_value(new),
+            })
+
+    # Final odds first appearing near the off are usually close to the
+    # morning odds the prediction used; only a real price move counts
+    odds_values = {field: new for field, new in values.items() if field in ODDS_FIELDS}
+    if odds_values and used_entry is not None:
+        used = effective_odds(used_entry)
+        now = effective_odds({**used_entry, **odds_values})
+        if ODDS_RULE.is_significant(used, now):
+            reasons.append({
+                "field": "odds",
+                "entry_id": entry_id,
+                "gate_number": gate_number,
+                "used": used,
+                "now": now,
+            })
+    return reasons
+
+
+def significant_changes(
+    snapshot: Optional[Dict[str, Any]],
+    race_changes: Optional[Dict[str, Tuple[Any, Any]]] = None,
+    entry_changes: Iterable[Any] = ()
+) -> List[Dict[str, Any]]:
+    """
+    Compare incoming changes against the values a prediction used.
+
+    New values are compared with the snapshot rather than the previous DB
+    value, so a series of small odds moves still trips the threshold once the
+    cumulative drift is large enough. Morning and final odds are compared as
+    one effective price (see ``effective_odds``).
+
+    Args:
+        snapshot: Prediction.context_snapshot (None for legacy rows)
+        race_changes: Race field -> (old, new)
+        entry_changes: EntryChange items from a sync
+
+    Returns:
+        Significant changes (empty if the prediction is still valid)
+    """
+    if snapshot is None:
+        # Predicted before dependency tracking; any tracked change invalidates it
+        snapshot = {"race": {}, "entries": {}}
+
+    reasons = _race_reasons(
+        snapshot["race"], {field: new for field, (_, new) in (race_changes or {}).items()}
+    )
+    for change in entry_changes:
+        reasons.extend(_entry_reasons(
+            snapshot["entries"].get(str(change.entry_id)),
+            change.entry_id,
+            change.gate_number,
+            {field: new for field, (_, new) in change.changes.items()},
+        ))
+    return reasons
+
+
+def snapshot_changes(
+    snapshot: Dict[str, Any],
+    current: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    Significant differences between a prediction's snapshot and current values.
+
+    Used when a prediction is stored: a sync that committed while the LLM
+    call ran found no current row of this prediction to mark stale, so the
+    snapshot is compared with the committed values directly.
+
+    Args:
+        snapshot: capture_dependencies() of the prediction's context
+        current: current_dependencies() read at store time
+
+    Returns:
+        Significant changes (empty if the snapshot is up to date)
+    """
+    reasons = _race_reasons(snapshot["race"], current["race"])
+    for entry_id, values in current["entries"].items():
+        reasons.extend(_entry_reasons(
+            snapshot["entries"].get(entry_id),
+            int(entry_id),
+            values["gate_number"],
+            {field: values[field] for field in ENTRY_FIELD_RULES},
+        ))
+    return reasons
+
+
+async def current_dependencies(
+    db: AsyncSession,
+    race_id: int,
+    race_date: date
+) -> Optional[Dict[str, Any]]:
+    """
+    Read the dependency fields as committed now, in capture_dependencies() form.
+
+    Entries also carry their ``gate_number`` for the reasons.
+
+    Args:
+        db: Database session (pinned to the primary)
+        race_id: Race ID
+        race_date: Race date
+
+    Returns:
+        Current values, or None if the race no longer exists
+    """
+    use_primary(db)
+    race = (
+        await db.execute(
+            select(*(getattr(Race, field) for field in RACE_FIELD_RULES))
+            .where(Race.id == race_id, Race.race_date == race_date)
+        )
+    ).mappings().one_or_none()
+    if race is None:
+        return None
+
+    entry_columns = [getattr(RaceEntry, field) for field in ENTRY_FIELD_RULES]
+    entries = (
+        await db.execute(
+            select(RaceEntry.id, RaceEntry.gate_number, *entry_columns)
+            .where(RaceEntry.race_id == race_id, RaceEntry.race_date == race_date)
+        )
+    ).mappings()
+    return {
+        "race": dict(race),
+        "entries": {
+            str(entry["id"]): {
+                "gate_number": entry["gate_number"],
+                **{field: entry[field] for field in ENTRY_FIELD_RULES},
+            }
+            for entry in entries
+        },
+    }
+
+
+async def lock_race_predictions(db: AsyncSession, race_id: int) -> None:
+    """
+    Serialize prediction writes for a race until the transaction ends.
+
+    Held while a new version is numbered and stored, and while a sync marks
+    predictions stale, so neither misses the other's commit.
+
+    Args:
+        db: Database session (pinned to the primary)
+        race_id: Race ID
+    """
+    use_primary(db)
+    await db.execute(PREDICTION_LOCK_SQL, {"race_id": race_id})
+
+
+async def queue_repredict(db: AsyncSession, prediction: Prediction) -> None:
+    """
+    Queue re-prediction of a stale prediction (caller commits).
+
+    Keyed by the stale row, so a predict job for this type that is already
+    running (on the old context) does not swallow the re-predict.
+
+    Args:
+        db: Database session
+        prediction: Stale prediction (flushed, so it has an ID)
+    """
+    await job_queue.enqueue(
+        db,
+        "predict",
+        f"predict:{prediction.race_id}:{prediction.prediction_type}:{prediction.id}",
+        {
+            "race_id": prediction.race_id,
+            "prediction_type": prediction.prediction_type,
+            "supersedes": prediction.id,
+        },
+        run_at=datetime.utcnow() + timedelta(seconds=settings.REPREDICT_DEBOUNCE_SECONDS),
+    )
+
+
+async def mark_stale_predictions(
+    db: AsyncSession,
+    race: Race,
+    race_changes: Optional[Dict[str, Tuple[Any, Any]]] = None,
+    entry_changes: Iterable[Any] = ()
+) -> List[str]:
+    """
+    Mark predictions invalidated by a sync as stale and queue re-prediction.
+    변경분이 임계값을 넘는 예측만 stale 처리 후 재예측 등록
+
+    Args:
+        db: Database session (committed here)
+        race: Race the changes belong to
+        race_changes: Race field -> (old, new)
+        entry_changes: EntryChange items from a sync
+
+    Returns:
+        Prediction types queued for re-prediction
+    """
+    entry_changes = list(entry_changes)
+    if race.race_status in FROZEN_RACE_STATUSES or not (race_changes or entry_changes):
+        return []
+
+    await lock_race_predictions(db, race.id)
+    stmt = select(Prediction).where(
+        Prediction.race_id == race.id,
+        Prediction.race_date == race.race_date,
+        Prediction.status == "current",
+    )
+    predictions = (await db.execute(stmt)).scalars().all()
+
+    requeued: List[str] = []
+    for prediction in predictions:
+        reasons = significant_changes(prediction.context_snapshot, race_changes, entry_changes)
+        if not reasons:
+            continue
+
+        prediction.status = "stale"
+        prediction.stale_reason = reasons
+        prediction.stale_at = datetime.utcnow()
+        await queue_repredict(db, prediction)
+        requeued.append(prediction.prediction_type)
+
+    # Also ends the transaction holding the lock
+    await db.commit()
+    if requeued:
+        logger.info(f"Race {race.id}: re-predicting {', '.join(requeued)}")
+    return requeued
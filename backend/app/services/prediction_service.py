@@ -0,0 +1,185 @@
+"""
+Prediction generation service.
+예측 생성 및 저장 서비스
+"""
+import logging
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pubsub import race_events
+from app.models.prediction import Prediction
+from app.services.combination_service import (
+    COMBINATION_TYPES, bulk_insert_combinations, combination_rows
+)
+from app.services.prediction_client import prediction_client
+from app.services.prediction_dependency_service import (
+    FROZEN_RACE_STATUSES,
+    capture_dependencies,
+    current_dependencies,
+    lock_race_predictions,
+    queue_repredict,
+    snapshot_changes,
+)
+from app.services.race_context_service import get_race_context, race_context_cache
+
+logger = logging.getLogger(__name__)
+
+PREDICTION_TYPES = ("win", "place", "quinella", "exacta", "trifecta")
+
+
+async def generate_prediction(
+    db: AsyncSession,
+    race_id: int,
+    prediction_type: str,
+    fresh_context: bool = False
+) -> Optional[Prediction]:
+    """
+    Generate a prediction through the prediction service and store it.
+    예측 생성 후 저장
+
+    The new row becomes the ``current`` version for (race, prediction_type);
+    earlier live versions are kept as ``superseded`` with a link to it. The
+    LLM call is slow, so the result is checked against what happened while it
+    ran: if another job stored a newer version meanwhile, the row is stored
+    as ``superseded`` by it; if the values committed by now differ
+    significantly from this context, the row is stored as ``stale`` and a
+    re-predict is queued. Both checks and the version number are taken under
+    the race's prediction lock.
+
+    Args:
+        db: Database session (committed here)
+        race_id: Race ID
+        prediction_type: Type of prediction (win, place, quinella, etc.)
+        fresh_context: Rebuild the race context instead of using the cache
+            (re-predictions after a sync in another process)
+
+    Returns:
+        Stored prediction, or None if the race does not exist
+    """
+    started_at = datetime.utcnow()
+    if fresh_context:
+        race_context_cache.invalidate(race_id)
+    context = await get_race_context(db, race_id)
+    if context is None:
+        logger.warning(f"Race {race_id} not found, skipping {prediction_type} prediction")
+        return None
+
+    response = await prediction_client.predict(context.to_prompt_dict(), prediction_type)
+    result = response["prediction"]
+
+    same_type = (
+        Prediction.race_id == context.race_id,
+        Prediction.race_date == context.race_date,
+        Prediction.prediction_type == prediction_type,
+    )
+    # Held until commit; mark_stale_predictions waits for it, so a sync
+    # committed after the check below still sees this row
+    await lock_race_predictions(db, context.race_id)
+    latest_version = (
+        await db.execute(select(func.max(Prediction.version)).where(*same_type))
+    ).scalar()
+    previous = (
+        await db.execute(
+            select(Prediction)
+            .where(*same_type, Prediction.status.in_(("current", "stale")))
+            .with_for_update()
+        )
+    ).scalars().all()
+
+    snapshot = capture_dependencies(context)
+    newer = [p for p in previous if p.created_at is not None and p.created_at >= started_at]
+    committed = await current_dependencies(db, context.race_id, context.race_date)
+    missed = snapshot_changes(snapshot, committed) if committed is not None else []
+
+    prediction = Prediction(
+        race_id=context.race_id,
+        race_date=context.race_date,
+        prediction_type=prediction_type,
+        model_version=response["model_version"],
+        prediction_data=result,
+        confidence_score=result.get("confidence"),
+        llm_reasoning=result.get("overall_analysis"),
+        version=(latest_version or 0) + 1,
+        status="current",
+        context_snapshot=snapshot,
+    )
+    if newer:
+        prediction.status = "superseded"
+        prediction.superseded_by = max(newer, key=lambda p: p.created_at).id
+    elif missed:
+        prediction.status = "stale"
+        prediction.stale_reason = missed
+        prediction.stale_at = datetime.utcnow()
+    if not newer:
+        # At most one current row per (race, type): retire the old ones first
+        for old in previous:
+            old.status = "superseded"
+        await db.flush()
+    db.add(prediction)
+    await db.flush()
+    if prediction_type in COMBINATION_TYPES:
+        await bulk_insert_combinations(
+            db, prediction, combination_rows(context, prediction_type, result)
+        )
+    if not newer:
+        for old in previous:
+            old.superseded_by = prediction.id
+    if prediction.status == "stale" and context.race_status not in FROZEN_RACE_STATUSES:
+        await queue_repredict(db, prediction)
+    await db.commit()
+
+    if prediction.status != "current":
+        logger.info(
+            f"Stored {prediction_type} prediction {prediction.id} for race {race_id} as "
+            f"{prediction.status}: its context changed while it was generated"
+        )
+        return prediction
+
+    await race_events.publish(
+        race_id,
+        "prediction",
+        {
+            "prediction_id": prediction.id,
+            "prediction_type": prediction_type,
+            "version": prediction.version,
+            "model_version": prediction.model_version,
+            "confidence": result.get("confidence"),
+            "prediction": result,
+        },
+    )
+    logger.info(
+        f"Stored {prediction_type} prediction {prediction.id} (v{prediction.version}) "
+        f"for race {race_id}"
+    )
+    return prediction
+
+
+async def has_stale_prediction(db: AsyncSession, race_id: int, prediction_type: str) -> bool:
+    """
+    Whether a race still has a stale prediction of this type awaiting re-prediction.
+
+    Args:
+        db: Database session
+        race_id: Race ID
+        prediction_type: Type of prediction
+
+    Returns:
+        True if a ``stale`` version exists
+    """
+    stale_id = (
+        await db.execute(
+            select(Prediction.id)
+            .where(
+                Prediction.race_id == race_id,
+                Prediction.prediction_type == prediction_type,
+                Prediction.status == "stale",
+            )
+            .limit(1)
+        )
+    ).scalar_one_or_none()
+    if stale_id is None:
+        logger.info(f"No stale {prediction_type} prediction for race {race_id}, skipping re-predict")
+    return stale_id is not None
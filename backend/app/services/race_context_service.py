@@ -0,0 +1,494 @@
+"""
+Race context assembly service.
+예측용 경주 컨텍스트 조립 서비스
+
+Loads a race, its entries (with horse/jockey/trainer) and recent history in a
+fixed number of queries, independent of the field size:
+
+1. race + track                     (joinedload)
+2. entries + horse/jockey/trainer   (selectinload + joinedload)
+3. recent history for all horses    (single windowed query)
+4. recent form for all jockeys      (single windowed query)
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, asdict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Optional, Dict, List, Set, Tuple, Any, Iterable
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select, func, event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload, joinedload, object_session
+
+from app.core.config import settings
+from app.core.pubsub import INVALIDATE_EVENT, race_events
+from app.db.session import use_primary
+from app.models.race import Race, RaceEntry
+
+logger = logging.getLogger(__name__)
+
+# Number of past races per horse / jockey included in the context
+HISTORY_LIMIT = 5
+
+# Cached contexts expire after this many seconds even without invalidation;
+# contexts of races whose day has not ended yet are kept until the day ends
+# (commits invalidate them, so warmed race-day contexts stay valid all day)
+CONTEXT_CACHE_TTL_SECONDS = 600
+
+
+@dataclass(frozen=True)
+class HistoryRun:
+    """과거 출전 기록 (Past run)"""
+    race_date: date
+    distance: Optional[int]
+    track_condition: Optional[str]
+    finish_position: Optional[int]
+    field_size: int
+    finish_time: Optional[float]
+
+
+@dataclass(frozen=True)
+class EntryContext:
+    """출전마 컨텍스트 (Entry context)"""
+    entry_id: int
+    gate_number: int
+    scratched: bool
+    horse_weight_kg: Optional[float]
+    handicap_weight_kg: Optional[float]
+    morning_odds: Optional[float]
+    final_odds: Optional[float]
+    popularity_rank: Optional[int]
+
+    horse_id: int
+    horse_name: str
+    horse_gender: Optional[str]
+    horse_birth_date: Optional[date]
+    horse_rating: Optional[int]
+    horse_total_races: int
+    horse_total_wins: int
+    horse_total_places: int
+    horse_total_shows: int
+    horse_recent_runs: Tuple[HistoryRun, ...]
+
+    jockey_id: int
+    jockey_name: str
+    jockey_win_rate: Optional[float]
+    jockey_place_rate: Optional[float]
+    jockey_recent_form: Tuple[Optional[int], ...]
+
+    trainer_id: int
+    trainer_name: str
+    trainer_win_rate: Optional[float]
+
+
+@dataclass(frozen=True)
+class RaceContext:
+    """경주 컨텍스트 (Race context)"""
+    race_id: int
+    race_date: date
+    race_number: int
+    track_id: int
+    track_name: str
+    distance: Optional[int]
+    surface_type: Optional[str]
+    weather: Optional[str]
+    track_condition: Optional[str]
+    race_class: Optional[str]
+    race_status: Optional[str]
+    entries: Tuple[EntryContext, ...]
+
+    @property
+    def active_entries(self) -> Tuple[EntryContext, ...]:
+        """Entries that have not been scratched."""
+        return tuple(e for e in self.entries if not e.scratched)
+
+    def to_prompt_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the JSON-serializable dictionary passed to the LLM.
+
+        Returns:
+            Race context dictionary
+        """
+        data = asdict(self)
+        return _jsonable(data)
+
+
+def _jsonable(value: Any) -> Any:
+    """Recursively convert dates/tuples into JSON-friendly values."""
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _to_float(value: Optional[Decimal]) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+class RaceContextCache:
+    """
+    In-process cache of assembled race contexts.
+    경주별 컨텍스트 캐시 (출전/배당 변경 시 무효화)
+    """
+
+    def __init__(self, ttl_seconds: int = CONTEXT_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        # race_id -> (expires_at on the monotonic clock, context)
+        self._items: Dict[int, Tuple[float, RaceContext]] = {}
+        # Values computed from a cached context (dropped along with it)
+        self._derived: Dict[int, Dict[str, Any]] = {}
+        # Bumped on every invalidation; a build that started before an
+        # invalidation must not be cached (it may hold pre-commit data)
+        self._generations: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, race_id: int) -> Optional[RaceContext]:
+        item = self._items.get(race_id)
+        if item is None:
+            return None
+        expires_at, context = item
+        if time.monotonic() > expires_at:
+            self.invalidate(race_id)
+            return None
+        return context
+
+    def _expires_at(self, context: RaceContext, now: float) -> float:
+        """TTL from now, extended to the end of the race day for today's/upcoming races."""
+        day_end = datetime.combine(
+            context.race_date + timedelta(days=1),
+            datetime.min.time(),
+            tzinfo=ZoneInfo(settings.RACE_TIMEZONE),
+        )
+        until_day_end = (day_end - datetime.now(ZoneInfo(settings.RACE_TIMEZONE))).total_seconds()
+        return now + max(self.ttl_seconds, until_day_end)
+
+    def generation(self, race_id: int) -> int:
+        """Current invalidation generation of a race (pass back to ``set``)."""
+        return self._generations.get(race_id, 0)
+
+    def set(self, context: RaceContext, generation: Optional[int] = None) -> None:
+        if generation is not None and generation != self.generation(context.race_id):
+            logger.debug(f"Race {context.race_id} changed during context build, not caching")
+            return
+        now = time.monotonic()
+        expired = [
+            race_id for race_id, (expires_at, _) in self._items.items()
+            if now > expires_at
+        ]
+        for race_id in expired:
+            self.invalidate(race_id)
+        self._items[context.race_id] = (self._expires_at(context, now), context)
+        self._derived.pop(context.race_id, None)
+
+    def get_derived(self, race_id: int, name: str) -> Optional[Any]:
+        """Get a value derived from the race's cached context (e.g. a baseline book)."""
+        if self.get(race_id) is None:
+            return None
+        return self._derived.get(race_id, {}).get(name)
+
+    def set_derived(self, race_id: int, name: str, value: Any) -> None:
+        """Store a value derived from the race's cached context."""
+        if race_id in self._items:
+            self._derived.setdefault(race_id, {})[name] = value
+
+    def invalidate(self, race_id: int) -> None:
+        self._generations[race_id] = self._generations.get(race_id, 0) + 1
+        self._derived.pop(race_id, None)
+        if self._items.pop(race_id, None) is not None:
+            logger.debug(f"Race context cache invalidated: race {race_id}")
+
+    def clear(self) -> None:
+        for race_id in list(self._items):
+            self.invalidate(race_id)
+
+
+# Singleton cache instance
+race_context_cache = RaceContextCache()
+
+
+async def _load_race(db: AsyncSession, race_id: int) -> Optional[Race]:
+    """Load race, track and entries with horse/jockey/trainer (2 queries)."""
+    stmt = (
+        select(Race)
+        .where(Race.id == race_id)
+        .options(
+            joinedload(Race.track),
+            selectinload(Race.entries).options(
+                joinedload(RaceEntry.horse),
+                joinedload(RaceEntry.jockey),
+                joinedload(RaceEntry.trainer),
+            ),
+        )
+    )
+    result = await db.execute(stmt)
+    return result.unique().scalar_one_or_none()
+
+
+async def _load_horse_history(
+    db: AsyncSession,
+    horse_ids: Iterable[int],
+    before: date
+) -> Dict[int, Tuple[HistoryRun, ...]]:
+    """Load the last HISTORY_LIMIT runs for every horse in one query."""
+    horse_ids = list(horse_ids)
+    if not horse_ids:
+        return {}
+
+    field_size = (
+        select(func.count(RaceEntry.id))
+        .where(
+            RaceEntry.race_id == Race.id,
+            RaceEntry.race_date == Race.race_date,
+            RaceEntry.scratched.is_not(True),
+        )
+        .correlate(Race)
+        .scalar_subquery()
+    )
+    ranked = (
+        select(
+            RaceEntry.horse_id.label("horse_id"),
+            Race.race_date.label("race_date"),
+            Race.distance.label("distance"),
+            Race.track_condition.label("track_condition"),
+            RaceEntry.finish_position.label("finish_position"),
+            RaceEntry.finish_time.label("finish_time"),
+            field_size.label("field_size"),
+            func.row_number().over(
+                partition_by=RaceEntry.horse_id,
+                order_by=(Race.race_date.desc(), Race.id.desc()),
+            ).label("rn"),
+        )
+        .join(Race, (Race.id == RaceEntry.race_id) & (Race.race_date == RaceEntry.race_date))
+        .where(RaceEntry.horse_id.in_(horse_ids), RaceEntry.race_date < before)
+        .subquery()
+    )
+    stmt = (
+        select(ranked)
+        .where(ranked.c.rn <= HISTORY_LIMIT)
+        .order_by(ranked.c.horse_id, ranked.c.rn)
+    )
+
+    history: Dict[int, List[HistoryRun]] = {}
+    for row in (await db.execute(stmt)).mappings():
+        history.setdefault(row["horse_id"], []).append(
+            HistoryRun(
+                race_date=row["race_date"],
+                distance=row["distance"],
+                track_condition=row["track_condition"],
+                finish_position=row["finish_position"],
+                field_size=row["field_size"] or 0,
+                finish_time=_to_float(row["finish_time"]),
+            )
+        )
+    return {horse_id: tuple(runs) for horse_id, runs in history.items()}
+
+
+async def _load_jockey_form(
+    db: AsyncSession,
+    jockey_ids: Iterable[int],
+    before: date
+) -> Dict[int, Tuple[Optional[int], ...]]:
+    """Load the last HISTORY_LIMIT finish positions for every jockey in one query."""
+    jockey_ids = list(jockey_ids)
+    if not jockey_ids:
+        return {}
+
+    ranked = (
+        select(
+            RaceEntry.jockey_id.label("jockey_id"),
+            RaceEntry.finish_position.label("finish_position"),
+            func.row_number().over(
+                partition_by=RaceEntry.jockey_id,
+                order_by=(Race.race_date.desc(), Race.id.desc()),
+            ).label("rn"),
+        )
+        .join(Race, (Race.id == RaceEntry.race_id) & (Race.race_date == RaceEntry.race_date))
+        .where(
+            RaceEntry.jockey_id.in_(jockey_ids),
+            RaceEntry.race_date < before,
+            RaceEntry.scratched.is_not(True),
+        )
+        .subquery()
+    )
+    stmt = (
+        select(ranked.c.jockey_id, ranked.c.finish_position)
+        .where(ranked.c.rn <= HISTORY_LIMIT)
+        .order_by(ranked.c.jockey_id, ranked.c.rn)
+    )
+
+    form: Dict[int, List[Optional[int]]] = {}
+    for jockey_id, finish_position in await db.execute(stmt):
+        form.setdefault(jockey_id, []).append(finish_position)
+    return {jockey_id: tuple(positions) for jockey_id, positions in form.items()}
+
+
+async def build_race_context(db: AsyncSession, race_id: int) -> Optional[RaceContext]:
+    """
+    Assemble the prediction context for a race without using the cache.
+
+    Args:
+        db: Database session
+        race_id: Race ID
+
+    Returns:
+        Race context, or None if the race does not exist
+    """
+    race = await _load_race(db, race_id)
+    if race is None:
+        return None
+
+    entries = sorted(race.entries, key=lambda e: e.gate_number)
+    horse_history = await _load_horse_history(
+        db, {e.horse_id for e in entries}, race.race_date
+    )
+    jockey_form = await _load_jockey_form(
+        db, {e.jockey_id for e in entries}, race.race_date
+    )
+
+    entry_contexts = tuple(
+        EntryContext(
+            entry_id=entry.id,
+            gate_number=entry.gate_number,
+            scratched=bool(entry.scratched),
+            horse_weight_kg=_to_float(entry.horse_weight_kg),
+            handicap_weight_kg=_to_float(entry.handicap_weight_kg),
+            morning_odds=_to_float(entry.morning_odds),
+            final_odds=_to_float(entry.final_odds),
+            popularity_rank=entry.popularity_rank,
+            horse_id=entry.horse.id,
+            horse_name=entry.horse.name_ko,
+            horse_gender=entry.horse.gender,
+            horse_birth_date=entry.horse.birth_date,
+            horse_rating=entry.horse.rating,
+            horse_total_races=entry.horse.total_races or 0,
+            horse_total_wins=entry.horse.total_wins or 0,
+            horse_total_places=entry.horse.total_places or 0,
+            horse_total_shows=entry.horse.total_shows or 0,
+            horse_recent_runs=horse_history.get(entry.horse_id, ()),
+            jockey_id=entry.jockey.id,
+            jockey_name=entry.jockey.name_ko,
+            jockey_win_rate=_to_float(entry.jockey.win_rate),
+            jockey_place_rate=_to_float(entry.jockey.place_rate),
+            jockey_recent_form=jockey_form.get(entry.jockey_id, ()),
+            trainer_id=entry.trainer.id,
+            trainer_name=entry.trainer.name_ko,
+            trainer_win_rate=_to_float(entry.trainer.win_rate),
+        )
+        for entry in entries
+    )
+
+    return RaceContext(
+        race_id=race.id,
+        race_date=race.race_date,
+        race_number=race.race_number,
+        track_id=race.race_track_id,
+        track_name=race.track.name_ko,
+        distance=race.distance,
+        surface_type=race.surface_type,
+        weather=race.weather,
+        track_condition=race.track_condition,
+        race_class=race.race_class,
+        race_status=race.race_status,
+        entries=entry_contexts,
+    )
+
+
+async def get_race_context(db: AsyncSession, race_id: int) -> Optional[RaceContext]:
+    """
+    Get the prediction context for a race, using the per-race cache.
+    경주 컨텍스트 조회 (캐시 사용)
+
+    Misses are built on the primary: the cache is only dropped by the next
+    commit, so a context read from a lagging replica would outlive the write
+    that invalidated it.
+
+    Args:
+        db: Database session
+        race_id: Race ID
+
+    Returns:
+        Race context, or None if the race does not exist
+    """
+    context = race_context_cache.get(race_id)
+    if context is not None:
+        return context
+
+    generation = race_context_cache.generation(race_id)
+    use_primary(db)
+    context = await build_race_context(db, race_id)
+    if context is not None:
+        race_context_cache.set(context, generation)
+    return context
+
+
+# Invalidate cached contexts whenever a race or its entries (incl. odds) change.
+# Flushes only record the race; the cache is dropped (here and, via pub/sub, in
+# every other process) once the transaction commits, and not at all on rollback.
+CHANGED_RACES_KEY = "changed_race_ids"
+
+# Keeps fire-and-forget publish tasks referenced until they finish
+_pending_publishes: Set[asyncio.Task] = set()
+
+
+def _record_change(target: Any, race_id: Optional[int]) -> None:
+    session = object_session(target)
+    if session is not None and race_id is not None:
+        session.info.setdefault(CHANGED_RACES_KEY, set()).add(race_id)
+
+
+@event.listens_for(RaceEntry, "after_insert")
+@event.listens_for(RaceEntry, "after_update")
+@event.listens_for(RaceEntry, "after_delete")
+def _invalidate_on_entry_change(mapper, connection, target: RaceEntry) -> None:
+    _record_change(target, target.race_id)
+
+
+@event.listens_for(Race, "after_update")
+@event.listens_for(Race, "after_delete")
+def _invalidate_on_race_change(mapper, connection, target: Race) -> None:
+    _record_change(target, target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    race_ids = session.info.pop(CHANGED_RACES_KEY, None)
+    if not race_ids:
+        return
+    for race_id in race_ids:
+        race_context_cache.invalidate(race_id)
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    for race_id in race_ids:
+        task = loop.create_task(race_events.publish(race_id, INVALIDATE_EVENT, {}))
+        _pending_publishes.add(task)
+        task.add_done_callback(_pending_publishes.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(CHANGED_RACES_KEY, None)
+
+
+# Other processes' commits arrive as race events.
+CONTEXT_EVENTS = ("entries", "race", INVALIDATE_EVENT)
+
+
+def _invalidate_on_race_event(race_id: int, event_name: str, data: Any) -> None:
+    if event_name in CONTEXT_EVENTS:
+        race_context_cache.invalidate(race_id)
+
+
+race_events.add_listener(_invalidate_on_race_event)
+# Invalidations published while the subscription was down are lost
+race_events.add_reconnect_listener(race_context_cache.clear)
@@ -0,0 +1,182 @@
+"""
+Race-day cache warm-up.
+당일 경주 캐시 예열 (컨텍스트 / 기준 확률 / 조합 확률표)
+
+Builds the race context and baseline book (odds-implied win probabilities plus
+quinella/exacta/trifecta books) for every race of the day, a few races at a
+time, so the first users of the morning hit warm caches. Reads go to the
+primary so a lagging replica never seeds the caches. Runs at API startup,
+daily at WARMUP_LOCAL_TIME, and whenever a ``warmup`` job (queued after each
+schedule sync) broadcasts a warm-up event: the caches are per process, so
+every API and worker process subscribed to race events warms its own.
+Warmed contexts are kept until the end of the race day; commits invalidate
+them as races and entries change.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, asdict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.pubsub import WARMUP_EVENT, race_events
+from app.db.session import AsyncSessionLocal
+from app.models.race import Race
+from app.services.baseline_service import get_baseline
+from app.services.job_scheduler import race_today, to_utc
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmupProgress:
+    """예열 진행 상황 (Warm-up progress)"""
+    status: str = "pending"  # pending / running / ready / failed
+    race_date: Optional[date] = None
+    races_total: int = 0
+    races_done: int = 0
+    races_failed: int = 0
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        for key in ("race_date", "started_at", "finished_at"):
+            if data[key] is not None:
+                data[key] = data[key].isoformat()
+        data["progress"] = (
+            round((self.races_done + self.races_failed) / self.races_total, 3)
+            if self.races_total else (1.0 if self.status == "ready" else 0.0)
+        )
+        return data
+
+
+class WarmupService:
+    """당일 경주 캐시 예열 서비스"""
+
+    def __init__(self, concurrency: int = settings.WARMUP_CONCURRENCY):
+        self.concurrency = concurrency
+        self.progress = WarmupProgress()
+        self._warmed_once = not settings.WARMUP_ENABLED
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._requested: Set[asyncio.Task] = set()
+
+    @property
+    def ready(self) -> bool:
+        """True once the first warm-up has finished (later re-warms keep it ready)."""
+        return self._warmed_once
+
+    async def warm(
+        self,
+        race_date: Optional[date] = None,
+        track_id: Optional[int] = None
+    ) -> WarmupProgress:
+        """
+        Warm contexts and baseline books for every race of a day.
+
+        Args:
+            race_date: Race date (defaults to today in the race timezone)
+            track_id: Limit to one track
+
+        Returns:
+            Final progress (races that failed are counted, not raised)
+        """
+        race_date = race_date or race_today()
+        async with self._lock:
+            progress = WarmupProgress(
+                status="running",
+                race_date=race_date,
+                started_at=datetime.utcnow(),
+            )
+            self.progress = progress
+            try:
+                race_ids = await self._load_race_ids(race_date, track_id)
+            except Exception as e:
+                progress.status = "failed"
+                progress.error = f"{type(e).__name__}: {str(e)}"
+                progress.finished_at = datetime.utcnow()
+                logger.error(f"Warm-up for {race_date} failed: {progress.error}")
+                return progress
+
+            progress.races_total = len(race_ids)
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def warm_race(race_id: int) -> None:
+                async with semaphore:
+                    try:
+                        async with AsyncSessionLocal() as db:
+                            await get_baseline(db, race_id)
+                        progress.races_done += 1
+                    except Exception as e:
+                        progress.races_failed += 1
+                        logger.warning(f"Warm-up of race {race_id} failed: {str(e)}")
+
+            await asyncio.gather(*(warm_race(race_id) for race_id in race_ids))
+
+            progress.status = "ready"
+            progress.finished_at = datetime.utcnow()
+            self._warmed_once = True
+            elapsed = (progress.finished_at - progress.started_at).total_seconds()
+            logger.info(
+                f"Warm-up for {race_date}: {progress.races_done}/{progress.races_total} races "
+                f"in {elapsed:.1f}s ({progress.races_failed} failed)"
+            )
+            return progress
+
+    async def _load_race_ids(self, race_date: date, track_id: Optional[int]) -> List[int]:
+        stmt = (
+            select(Race.id)
+            .where(Race.race_date == race_date)
+            .order_by(Race.start_time, Race.race_track_id, Race.race_number)
+        )
+        if track_id is not None:
+            stmt = stmt.where(Race.race_track_id == track_id)
+        async with AsyncSessionLocal() as db:
+            return list((await db.execute(stmt)).scalars())
+
+    def start(self) -> None:
+        """Warm now, then re-warm daily at WARMUP_LOCAL_TIME (background task)."""
+        if settings.WARMUP_ENABLED and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run_daily())
+
+    async def _run_daily(self) -> None:
+        while True:
+            progress = await self.warm()
+            if progress.status == "failed":
+                await asyncio.sleep(settings.WARMUP_RETRY_SECONDS)
+                continue
+
+            today = race_today()
+            next_run = to_utc(today, settings.WARMUP_LOCAL_TIME)
+            if next_run <= datetime.utcnow():
+                next_run = to_utc(today + timedelta(days=1), settings.WARMUP_LOCAL_TIME)
+            await asyncio.sleep((next_run - datetime.utcnow()).total_seconds())
+
+    def on_race_event(self, race_id: int, event_name: str, data: Any) -> None:
+        """Warm this process's caches when a warm-up event is broadcast."""
+        if event_name != WARMUP_EVENT or not settings.WARMUP_ENABLED:
+            return
+        race_date = date.fromisoformat(data["race_date"]) if data.get("race_date") else None
+        task = asyncio.create_task(self.warm(race_date, track_id=data.get("track_code")))
+        self._requested.add(task)
+        task.add_done_callback(self._requested.discard)
+
+    async def close(self) -> None:
+        for task in list(self._requested):
+            task.cancel()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Singleton instance
+warmup_service = WarmupService()
+race_events.add_listener(warmup_service.on_race_event)
@@ -0,0 +1,75 @@
+"""
+Job handlers.
+작업 종류별 처리 함수
+"""
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict
+
+from app.core.pubsub import BROADCAST_RACE_ID, WARMUP_EVENT, race_events
+from app.db.session import AsyncSessionLocal
+from app.services import job_scheduler
+from app.services.kra_sync_service import kra_sync_service
+from app.services.prediction_service import generate_prediction, has_stale_prediction
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+async def handle_schedule_day(payload: Dict[str, Any]) -> None:
+    async with AsyncSessionLocal() as db:
+        await job_scheduler.schedule_day(db, date.fromisoformat(payload["race_date"]))
+
+
+async def handle_sync_schedule(payload: Dict[str, Any]) -> None:
+    race_date = date.fromisoformat(payload["race_date"])
+    track_code = payload["track_code"]
+    await kra_sync_service.sync_race_schedule(race_date, track_code=track_code)
+    async with AsyncSessionLocal() as db:
+        await job_scheduler.schedule_race_jobs(db, race_date, track_id=track_code)
+
+
+async def handle_sync_entries(payload: Dict[str, Any]) -> None:
+    await kra_sync_service.sync_race_entries(
+        date.fromisoformat(payload["race_date"]),
+        payload["track_code"],
+        payload["race_number"],
+    )
+
+
+async def handle_sync_results(payload: Dict[str, Any]) -> None:
+    await kra_sync_service.sync_race_results(
+        date.fromisoformat(payload["race_date"]),
+        track_code=payload["track_code"],
+        race_number=payload.get("race_number"),
+    )
+
+
+async def handle_predict(payload: Dict[str, Any]) -> None:
+    async with AsyncSessionLocal() as db:
+        # A re-predict is moot once a later job already replaced every stale version
+        if "supersedes" in payload and not await has_stale_prediction(
+            db, payload["race_id"], payload["prediction_type"]
+        ):
+            return
+        await generate_prediction(
+            db,
+            payload["race_id"],
+            payload["prediction_type"],
+            fresh_context="supersedes" in payload,
+        )
+
+
+async def handle_warmup(payload: Dict[str, Any]) -> None:
+    # Caches are per process: every subscribed API/worker process warms its own
+    receivers = await race_events.publish(BROADCAST_RACE_ID, WARMUP_EVENT, payload)
+    if not receivers:
+        raise RuntimeError("Warm-up event was not delivered to any process")
+
+
+JOB_HANDLERS: Dict[str, JobHandler] = {
+    "schedule_day": handle_schedule_day,
+    "sync_schedule": handle_sync_schedule,
+    "sync_entries": handle_sync_entries,
+    "sync_results": handle_sync_results,
+    "predict": handle_predict,
+    "warmup": handle_warmup,
+}
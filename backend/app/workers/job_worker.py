@@ -0,0 +1,152 @@
+"""
+Job queue worker.
+작업 큐 워커
+
+Run any number of these; jobs are claimed with FOR UPDATE SKIP LOCKED so each
+one executes on exactly one worker::
+
+    python -m app.workers.job_worker --concurrency 4
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+from typing import Dict, Optional, Set
+
+from app.core.config import settings
+from app.core.pubsub import race_events
+from app.db.session import AsyncSessionLocal
+from app.models.job import Job
+from app.services import job_queue
+from app.services.job_scheduler import race_today
+from app.services.warmup_service import warmup_service
+from app.workers.handlers import JOB_HANDLERS, JobHandler
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorker:
+    """작업 큐 워커 (Job worker)"""
+
+    def __init__(
+        self,
+        handlers: Dict[str, JobHandler] = JOB_HANDLERS,
+        concurrency: int = 4,
+        worker_id: Optional[str] = None
+    ):
+        self.handlers = handlers
+        self.concurrency = concurrency
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks: Set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        """Stop claiming new jobs; running jobs are allowed to finish."""
+        logger.info(f"Worker {self.worker_id} stopping")
+        self._stopping.set()
+
+    async def run(self) -> None:
+        """Claim and execute jobs until stopped."""
+        logger.info(f"Worker {self.worker_id} started (concurrency {self.concurrency})")
+        await self._bootstrap()
+
+        while not self._stopping.is_set():
+            free = self.concurrency - len(self._tasks)
+            jobs = []
+            if free > 0:
+                try:
+                    async with AsyncSessionLocal() as db:
+                        jobs = await job_queue.claim(db, self.worker_id, free)
+                except Exception as e:
+                    logger.error(f"Failed to claim jobs: {str(e)}")
+
+            for job in jobs:
+                task = asyncio.create_task(self._execute(job))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+            if not jobs:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(),
+                        timeout=settings.JOB_POLL_INTERVAL_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        logger.info(f"Worker {self.worker_id} stopped")
+
+    async def _bootstrap(self) -> None:
+        """Queue today's schedule_day job once (across workers and restarts)."""
+        today = race_today()
+        async with AsyncSessionLocal() as db:
+            await job_queue.enqueue(
+                db,
+                "schedule_day",
+                f"schedule_day:{today}",
+                {"race_date": today.isoformat()},
+                once=True,
+            )
+            await db.commit()
+
+    async def _execute(self, job: Job) -> None:
+        handler = self.handlers.get(job.job_type)
+        heartbeat = asyncio.create_task(self._heartbeat(job, asyncio.current_task()))
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown job type: {job.job_type}")
+            logger.info(f"Running job {job.id} ({job.dedupe_key}), attempt {job.attempts}")
+            await handler(job.payload)
+        except Exception as e:
+            async with AsyncSessionLocal() as db:
+                await job_queue.fail(db, job, self.worker_id, f"{type(e).__name__}: {str(e)}")
+        else:
+            async with AsyncSessionLocal() as db:
+                await job_queue.complete(db, job.id, self.worker_id)
+            logger.info(f"Job {job.id} ({job.dedupe_key}) succeeded")
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, job: Job, task: asyncio.Task) -> None:
+        """Renew the lease; cancel the job if another worker has taken it over."""
+        while True:
+            await asyncio.sleep(settings.JOB_HEARTBEAT_SECONDS)
+            try:
+                async with AsyncSessionLocal() as db:
+                    alive = await job_queue.heartbeat(db, job.id, self.worker_id)
+            except Exception as e:
+                logger.warning(f"Heartbeat failed for job {job.id}: {str(e)}")
+                continue
+            if not alive:
+                logger.warning(f"Lease lost for job {job.id}, cancelling")
+                task.cancel()
+                return
+
+
+async def main(concurrency: int) -> None:
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    worker = JobWorker(concurrency=concurrency)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    # Keeps this process's context cache in step with other processes' commits
+    # and receives warm-up broadcasts
+    race_events.start()
+    try:
+        await worker.run()
+    finally:
+        await warmup_service.close()
+        await race_events.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a job queue worker")
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency))
@@ -0,0 +1,107 @@
+"""
+Benchmark regression gate.
+벤치마크 회귀 검사 (이전 커밋과 현재 작업 트리 비교)
+
+    python -m benchmarks.check                        # HEAD~1 vs. working tree
+    python -m benchmarks.check --base main --threshold 0.2
+    python -m benchmarks.check --database-url URL     # + DB benchmarks (scratch DB!)
+
+Checks the base revision out into a temporary git worktree, runs the suite
+there and in the current tree alternately (``--rounds`` times each, keeping
+each benchmark's best round) on the same machine, and exits with status 1
+when any benchmark regressed by more than the threshold. Both merged reports
+are kept in ``benchmarks/results/`` (not tracked).
+"""
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+from benchmarks.compare import DEFAULT_THRESHOLD, find_regressions
+from benchmarks.run import RESULTS_DIR
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def _git(*args: str, cwd: Path = BACKEND_DIR) -> str:
+    return subprocess.check_output(["git", *args], cwd=cwd, text=True).strip()
+
+
+def _run_suite(backend_dir: Path, output: Path, database_url: Optional[str]) -> dict:
+    command: List[str] = [sys.executable, "-m", "benchmarks.run", "--output", str(output)]
+    if database_url:
+        command += ["--database-url", database_url]
+    subprocess.run(command, cwd=backend_dir, check=True)
+    return json.loads(output.read_text())
+
+
+def best_of(reports: List[dict]) -> dict:
+    """Merge repeated runs, keeping each benchmark's fastest round."""
+    merged = dict(reports[0], results={})
+    for report in reports:
+        for name, result in report["results"].items():
+            best = merged["results"].get(name)
+            if best is None or result.get("ops_per_sec", 0) > best.get("ops_per_sec", 0):
+                merged["results"][name] = result
+    return merged
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the base revision and the working tree")
+    parser.add_argument("--base", default="HEAD~1", help="Revision to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--rounds", type=int, default=3, help="Interleaved runs per tree")
+    parser.add_argument("--database-url", help="Scratch database for DB benchmarks (reset!)")
+    args = parser.parse_args()
+
+    base_commit = _git("rev-parse", "--short", args.base)
+    head_commit = _git("rev-parse", "--short", "HEAD")
+    if _git("status", "--porcelain", "--untracked-files=no"):
+        head_commit += "-dirty"
+    base_output = RESULTS_DIR / f"{base_commit}.json"
+    head_output = RESULTS_DIR / f"{head_commit}.json"
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+
+    worktree = Path(tempfile.mkdtemp(prefix="bench-base-"))
+    base_runs: List[dict] = []
+    head_runs: List[dict] = []
+    try:
+        _git("worktree", "add", "--detach", str(worktree), base_commit)
+        base_backend = worktree / BACKEND_DIR.relative_to(_git("rev-parse", "--show-toplevel"))
+        if not (base_backend / "benchmarks" / "run.py").exists():
+            sys.exit(f"{base_commit} has no benchmark suite; pass --base with a later revision")
+        # Settings are read from .env, which is not part of the checkout
+        if (BACKEND_DIR / ".env").exists():
+            shutil.copy(BACKEND_DIR / ".env", base_backend / ".env")
+
+        # Alternate the two trees so machine load drifts hit both alike
+        for round_no in range(1, args.rounds + 1):
+            print(f"Round {round_no}/{args.rounds}: base {base_commit}")
+            base_runs.append(_run_suite(base_backend, base_output, args.database_url))
+            print(f"Round {round_no}/{args.rounds}: working tree ({head_commit})")
+            head_runs.append(_run_suite(BACKEND_DIR, head_output, args.database_url))
+    finally:
+        subprocess.run(
+            ["git", "worktree", "remove", "--force", str(worktree)],
+            cwd=BACKEND_DIR, check=False,
+        )
+        shutil.rmtree(worktree, ignore_errors=True)
+
+    baseline, current = best_of(base_runs), best_of(head_runs)
+    base_output.write_text(json.dumps(baseline, indent=2, ensure_ascii=False))
+    head_output.write_text(json.dumps(current, indent=2, ensure_ascii=False))
+
+    print(f"Comparing {base_commit} -> {head_commit} "
+          f"(best of {args.rounds}, threshold {args.threshold:.0%})")
+    regressions = find_regressions(baseline, current, args.threshold)
+    if regressions:
+        print("Performance regressions:\n  " + "\n  ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
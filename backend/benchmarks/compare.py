@@ -0,0 +1,86 @@
+"""
+Benchmark regression check.
+벤치마크 회귀 검사
+
+    python -m benchmarks.compare                          # HEAD vs. HEAD~1 results
+    python -m benchmarks.compare base.json current.json --threshold 0.15
+
+Exits with status 1 when any benchmark's throughput dropped by more than the
+threshold. Compares existing reports only; ``python -m benchmarks.check``
+produces both and is the gate to run in CI.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.run import RESULTS_DIR
+
+DEFAULT_THRESHOLD = 0.15
+
+
+def _commit_results(rev: str) -> Path:
+    commit = subprocess.check_output(["git", "rev-parse", "--short", rev], text=True).strip()
+    return RESULTS_DIR / f"{commit}.json"
+
+
+def find_regressions(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float
+) -> List[str]:
+    """
+    Compare ops_per_sec of benchmarks present in both reports.
+
+    A benchmark regresses only when its throughput drops AND its p50 latency
+    rises by more than the threshold, so a few outlier samples (which drag
+    the mean-based ops_per_sec of microsecond benchmarks) do not fail the gate.
+
+    Returns:
+        Human-readable regression descriptions
+    """
+    regressions = []
+    for name, base in baseline["results"].items():
+        now = current["results"].get(name)
+        if now is None or "ops_per_sec" not in base or "ops_per_sec" not in now:
+            continue
+        if base["ops_per_sec"] <= 0:
+            continue
+        change = now["ops_per_sec"] / base["ops_per_sec"] - 1
+        p50_change = now["p50_ms"] / base["p50_ms"] - 1 if base.get("p50_ms") else 0.0
+        regressed = change < -threshold and p50_change > threshold
+        status = "REGRESSION" if regressed else ("noisy" if change < -threshold else "ok")
+        print(f"{name:<36} {base['ops_per_sec']:>12.2f} -> {now['ops_per_sec']:>12.2f} ops/s "
+              f"({change:+.1%}, p50 {p50_change:+.1%}) {status}")
+        if regressed:
+            regressions.append(f"{name}: {change:+.1%} ops/s, p50 {p50_change:+.1%}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare benchmark results")
+    parser.add_argument("baseline", nargs="?", type=Path)
+    parser.add_argument("current", nargs="?", type=Path)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    baseline_path = args.baseline or _commit_results("HEAD~1")
+    current_path = args.current or _commit_results("HEAD")
+    for path in (baseline_path, current_path):
+        if not path.exists():
+            sys.exit(f"Missing benchmark results: {path} (run python -m benchmarks.check)")
+
+    baseline = json.loads(baseline_path.read_text())
+    current = json.loads(current_path.read_text())
+    print(f"Comparing {baseline['commit']} -> {current['commit']} (threshold {args.threshold:.0%})")
+
+    regressions = find_regressions(baseline, current, args.threshold)
+    if regressions:
+        print("Performance regressions:\n  " + "\n  ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
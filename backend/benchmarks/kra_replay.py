@@ -0,0 +1,205 @@
+"""
+KRA API replay server for load, retry and pagination testing.
+KRA API 재생 서버 (지연 / 오류 / 호출 제한 / 결과코드 이상 재현)
+
+Serves responses recorded with KRA_API_RECORD_DIR (exact endpoint + params
+match), falling back to the endpoint's recording or fixture, paged by
+``pageNo``/``numOfRows``. Latency, HTTP errors, data.go.kr-style throttling
+and HTTP 200 error bodies are injected from a seeded RNG::
+
+    python -m benchmarks.kra_replay --recordings recordings/kra --port 8085 \\
+        --latency-ms 120 --jitter-ms 40 --error-rate 0.02 --result-error-rate 0.01 \\
+        --throttle-rps 30 --seed 7
+
+    KRA_API_BASE_URL=http://127.0.0.1:8085 python -m app.workers.job_worker
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from aiohttp import web
+
+from app.services.kra_recorder import Recording, load_recordings, recording_key
+from benchmarks.kra_stub import KRAStubServer, load_fixtures
+
+# data.go.kr answers quota / gateway problems with HTTP 200 and this XML body
+GATEWAY_ERROR_XML = (
+    "<OpenAPI_ServiceResponse><cmmMsgHeader><errMsg>SERVICE ERROR</errMsg>"
+    "<returnAuthMsg>{message}</returnAuthMsg>"
+    "<returnReasonCode>{code}</returnReasonCode></cmmMsgHeader></OpenAPI_ServiceResponse>"
+)
+THROTTLED_BODY = GATEWAY_ERROR_XML.format(
+    code="22", message="LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR"
+)
+RESULT_ERROR_BODY = json.dumps(
+    {"response": {"header": {"resultCode": "99", "resultMsg": "UNKNOWN_ERROR"}}}
+)
+
+
+@dataclass
+class ReplayProfile:
+    """Fault injection settings (rates are probabilities per request)."""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    result_error_rate: float = 0.0
+    throttle_rps: Optional[float] = None
+    throttle_mode: str = "gateway"  # gateway: HTTP 200 + XML code 22, http: 429
+    strict: bool = False
+    seed: int = 0
+
+
+def _page(body: bytes, page_no: int, num_of_rows: int) -> bytes:
+    """Slice a KRA envelope's items to one page and fix up the paging fields."""
+    data = json.loads(body)
+    envelope = data.get("response", {}).get("body")
+    items = (envelope or {}).get("items") or {}
+    rows = items.get("item") if isinstance(items, dict) else None
+    if not isinstance(rows, list):
+        return body
+
+    start = (page_no - 1) * num_of_rows
+    items["item"] = rows[start:start + num_of_rows]
+    envelope.update({"pageNo": page_no, "numOfRows": num_of_rows, "totalCount": len(rows)})
+    return json.dumps(data, ensure_ascii=False).encode()
+
+
+class KRAReplayServer(KRAStubServer):
+    """Replays recorded KRA responses with configurable faults."""
+
+    def __init__(
+        self,
+        recordings: Optional[Dict[str, Recording]] = None,
+        profile: Optional[ReplayProfile] = None,
+        fixtures: Optional[Dict[str, bytes]] = None,
+        port: int = 0
+    ):
+        self.recordings = recordings or {}
+        self.profile = profile or ReplayProfile()
+        fallback = dict(load_fixtures() if fixtures is None else fixtures)
+        for recording in self.recordings.values():
+            if recording.status_code == 200:
+                fallback.setdefault(recording.endpoint, recording.body.encode())
+        super().__init__(fixtures=fallback, port=port)
+        self.stats: Counter = Counter()
+        self._rng = random.Random(self.profile.seed)
+        self._tokens = self.profile.throttle_rps or 0.0
+        self._refilled_at = time.monotonic()
+
+    def _throttled(self) -> bool:
+        rate = self.profile.throttle_rps
+        if not rate:
+            return False
+        now = time.monotonic()
+        self._tokens = min(rate, self._tokens + (now - self._refilled_at) * rate)
+        self._refilled_at = now
+        if self._tokens < 1:
+            return True
+        self._tokens -= 1
+        return False
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        profile = self.profile
+        endpoint = request.match_info["endpoint"]
+        self.stats["requests"] += 1
+
+        # Draw every random decision up front so runs with the same seed and
+        # request order inject the same faults regardless of latency.
+        delay = max(profile.latency_ms + self._rng.uniform(-1, 1) * profile.jitter_ms, 0) / 1000
+        fail_http = self._rng.random() < profile.error_rate
+        fail_result = self._rng.random() < profile.result_error_rate
+
+        if self._throttled():
+            self.stats["throttled"] += 1
+            if profile.throttle_mode == "http":
+                return web.Response(status=429, text="Too Many Requests")
+            return web.Response(text=THROTTLED_BODY, content_type="text/xml")
+
+        if delay:
+            await asyncio.sleep(delay)
+        if fail_http:
+            self.stats["http_errors"] += 1
+            return web.Response(status=profile.error_status, text="Service Unavailable")
+        if fail_result:
+            self.stats["result_errors"] += 1
+            return web.Response(text=RESULT_ERROR_BODY, content_type="application/json")
+
+        recording = self.recordings.get(recording_key(endpoint, dict(request.query)))
+        if recording is not None:
+            self.stats["replayed"] += 1
+            return web.Response(
+                status=recording.status_code,
+                body=recording.body.encode(),
+                headers={"Content-Type": recording.content_type},
+            )
+
+        body = self.fixtures.get(endpoint)
+        if body is None or profile.strict:
+            self.stats["missing"] += 1
+            return web.Response(status=404, text="No recording for request")
+
+        self.stats["fallback"] += 1
+        if "pageNo" in request.query or "numOfRows" in request.query:
+            body = _page(
+                body,
+                int(request.query.get("pageNo", 1)),
+                int(request.query.get("numOfRows", 10)),
+            )
+        return web.Response(body=body, content_type="application/json")
+
+
+async def serve(recordings_dir: Optional[Path], profile: ReplayProfile, port: int) -> None:
+    recordings = load_recordings(recordings_dir) if recordings_dir else {}
+    server = KRAReplayServer(recordings, profile, port=port)
+    async with server:
+        print(f"KRA replay server on {server.base_url} ({len(recordings)} recordings)")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            print(", ".join(f"{k}={v}" for k, v in sorted(server.stats.items())))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay recorded KRA API responses")
+    parser.add_argument("--recordings", type=Path, help="KRA_API_RECORD_DIR of a recording run")
+    parser.add_argument("--port", type=int, default=8085)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 5xx probability")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument(
+        "--result-error-rate", type=float, default=0.0,
+        help="Probability of HTTP 200 with an error resultCode",
+    )
+    parser.add_argument("--throttle-rps", type=float, help="Requests/s before quota errors")
+    parser.add_argument("--throttle-mode", choices=("gateway", "http"), default="gateway")
+    parser.add_argument("--strict", action="store_true", help="404 unless params were recorded")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    profile = ReplayProfile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        result_error_rate=args.result_error_rate,
+        throttle_rps=args.throttle_rps,
+        throttle_mode=args.throttle_mode,
+        strict=args.strict,
+        seed=args.seed,
+    )
+    try:
+        asyncio.run(serve(args.recordings, profile, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Local HTTP stand-in for the KRA API serving recorded fixture payloads.
+KRA API 로컬 대역 서버 (녹화된 응답 제공)
+
+Fixtures live in ``benchmarks/fixtures/kra`` named after the endpoint path with
+``/`` replaced by ``__`` (``API187/raceSchedule`` -> ``API187__raceSchedule.json``).
+"""
+from pathlib import Path
+from typing import Dict, Optional
+
+from aiohttp import web
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "kra"
+
+
+def load_fixtures(fixture_dir: Path = FIXTURE_DIR) -> Dict[str, bytes]:
+    """Map endpoint path -> raw response body."""
+    return {
+        path.stem.replace("__", "/"): path.read_bytes()
+        for path in fixture_dir.glob("*.json")
+    }
+
+
+class KRAStubServer:
+    """Serves fixture payloads on 127.0.0.1 (random port by default)."""
+
+    def __init__(self, fixtures: Optional[Dict[str, bytes]] = None, port: int = 0):
+        self.fixtures = fixtures if fixtures is not None else load_fixtures()
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        body = self.fixtures.get(request.match_info["endpoint"])
+        if body is None:
+            return web.Response(status=404, text="Unknown endpoint")
+        return web.Response(body=body, content_type="application/json")
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/{endpoint:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "KRAStubServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
@@ -0,0 +1,364 @@
+"""
+Hot-path benchmark suite.
+핵심 경로 벤치마크 (KRA 수집, DB 적재, 프롬프트, 예측 파싱, 컨텍스트, 조합)
+
+    python -m benchmarks.run                         # CPU + KRA stand-in benchmarks
+    python -m benchmarks.run --database-url URL      # + DB benchmarks (scratch DB!)
+    python -m benchmarks.check                       # previous commit vs. working tree
+
+Results are written to ``benchmarks/results/<commit>.json`` (not tracked).
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from benchmarks.kra_stub import KRAStubServer, load_fixtures
+from app.services.combination_service import (
+    CombinationRow, bulk_insert_combinations, enumerate_combinations
+)
+from app.services.race_context_service import (
+    EntryContext, HistoryRun, RaceContext, build_race_context
+)
+
+RESULTS_DIR = Path(__file__).parent / "results"
+PREDICTION_SERVICE_DIR = Path(__file__).resolve().parents[2] / "prediction-service"
+
+FIELD_SIZES = (8, 12, 16)
+KRA_REQUESTS = 200
+KRA_CONCURRENCY = 20
+ENTRIES_ENDPOINT = "API/raceEntries"
+
+
+def _summarize(samples: List[float], ops_per_sample: int = 1) -> Dict[str, float]:
+    """Summarize per-sample durations (seconds)."""
+    samples = sorted(samples)
+    total = sum(samples)
+    return {
+        "n": len(samples),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 4),
+        "p50_ms": round(statistics.median(samples) * 1000, 4),
+        "p95_ms": round(samples[max(int(len(samples) * 0.95) - 1, 0)] * 1000, 4),
+        "ops_per_sec": round(len(samples) * ops_per_sample / total, 2) if total else 0.0,
+    }
+
+
+def _time_sync(fn: Callable[[], Any], repeat: int, warmup: int = 5) -> List[float]:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def _time_async(fn: Callable[[], Awaitable[Any]], repeat: int, warmup: int = 2) -> List[float]:
+    for _ in range(warmup):
+        await fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+# ============================================
+# Synthetic inputs (from recorded KRA fixtures)
+# ============================================
+
+def _fixture_items(endpoint: str) -> List[Dict[str, Any]]:
+    payload = json.loads(load_fixtures()[endpoint])
+    return payload["response"]["body"]["items"]["item"]
+
+
+def synthetic_context(runners: int) -> RaceContext:
+    """Race context with ``runners`` entries built from the entries fixture."""
+    items = _fixture_items("API/raceEntries")[:runners]
+    race_date = date(2026, 1, 3)
+    history = tuple(
+        HistoryRun(
+            race_date=race_date - timedelta(days=14 * (i + 1)),
+            distance=1200,
+            track_condition="양호",
+            finish_position=(i % 8) + 1,
+            field_size=12,
+            finish_time=75.2 + i,
+        )
+        for i in range(5)
+    )
+    entries = tuple(
+        EntryContext(
+            entry_id=1000 + gate,
+            gate_number=gate,
+            scratched=False,
+            horse_weight_kg=float(item["wgHr"].split("(")[0]),
+            handicap_weight_kg=float(item["wgBudam"]),
+            morning_odds=item["winOdds"],
+            final_odds=None,
+            popularity_rank=None,
+            horse_id=gate,
+            horse_name=item["hrName"],
+            horse_gender=item["sex"],
+            horse_birth_date=date(2026 - item["age"], 3, 1),
+            horse_rating=item["rating"],
+            horse_total_races=18,
+            horse_total_wins=3,
+            horse_total_places=2,
+            horse_total_shows=4,
+            horse_recent_runs=history,
+            jockey_id=gate,
+            jockey_name=item["jkName"],
+            jockey_win_rate=0.12,
+            jockey_place_rate=0.25,
+            jockey_recent_form=(1, 4, 2, 7, 3),
+            trainer_id=gate,
+            trainer_name=item["trName"],
+            trainer_win_rate=0.1,
+        )
+        for gate, item in enumerate(items, start=1)
+    )
+    return RaceContext(
+        race_id=1,
+        race_date=race_date,
+        race_number=1,
+        track_id=1,
+        track_name="서울",
+        distance=1200,
+        surface_type="모래",
+        weather="맑음",
+        track_condition="양호",
+        race_class="국5등급",
+        race_status="scheduled",
+        entries=entries,
+    )
+
+
+def synthetic_response(runners: int) -> str:
+    """LLM-style win prediction wrapped in a markdown code block."""
+    body = {
+        "predictions": [
+            {"horse_id": i, "win_probability": round(1 / runners, 4), "reasoning": "최근 폼 양호, 거리 적합"}
+            for i in range(1, runners + 1)
+        ],
+        "confidence": 0.72,
+        "overall_analysis": "선행마가 많아 추입마에게 유리한 전개 예상",
+    }
+    return "분석 결과입니다.\n```json\n" + json.dumps(body, ensure_ascii=False, indent=2) + "\n```"
+
+
+# ============================================
+# Benchmarks
+# ============================================
+
+async def bench_kra_client(results: Dict[str, Any]) -> None:
+    from app.services.kra_sync_service import KRAAPIClient
+
+    async with KRAStubServer() as stub:
+        client = KRAAPIClient()
+        client.base_url = stub.base_url
+        semaphore = asyncio.Semaphore(KRA_CONCURRENCY)
+        latencies: List[float] = []
+
+        async def one() -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                await client.get_race_entries(date(2026, 1, 3), 1, 1)
+                latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(one() for _ in range(KRA_CONCURRENCY)))
+        latencies.clear()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(KRA_REQUESTS)))
+        elapsed = time.perf_counter() - started
+
+    summary = _summarize(latencies)
+    summary["ops_per_sec"] = round(KRA_REQUESTS / elapsed, 2)
+    results["kra_client_throughput"] = summary
+
+
+def bench_prompt_and_parse(results: Dict[str, Any]) -> None:
+    os.environ.setdefault("GEMINI_API_KEY", "benchmark")
+    sys.path.insert(0, str(PREDICTION_SERVICE_DIR))
+    try:
+        from src.llm.gemini_client import GeminiClient
+    except ImportError as e:
+        results["gemini_prompt"] = {"skipped": f"prediction-service deps missing: {e}"}
+        return
+
+    client = GeminiClient.__new__(GeminiClient)
+    for runners in FIELD_SIZES:
+        context = synthetic_context(runners).to_prompt_dict()
+        results[f"gemini_build_prompt_{runners}"] = _summarize(
+            _time_sync(lambda: client._build_prompt(context, "trifecta"), repeat=500)
+        )
+        response = synthetic_response(runners)
+        results[f"gemini_parse_response_{runners}"] = _summarize(
+            _time_sync(lambda: client._parse_response(response), repeat=500)
+        )
+
+
+def bench_context_and_combinations(results: Dict[str, Any]) -> None:
+    for runners in FIELD_SIZES:
+        context = synthetic_context(runners)
+        results[f"race_context_to_prompt_{runners}"] = _summarize(
+            _time_sync(context.to_prompt_dict, repeat=500)
+        )
+        entry_ids = [e.entry_id for e in context.entries]
+        results[f"combinations_trifecta_{runners}"] = _summarize(
+            _time_sync(lambda: enumerate_combinations(entry_ids, "trifecta"), repeat=200)
+        )
+
+
+async def bench_database(results: Dict[str, Any], database_url: str) -> None:
+    from sqlalchemy import insert
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from app.models import Prediction, Race, RaceEntry
+    from app.services.kra_sync_service import KRASyncService, _entry_row, _items
+    from benchmarks.today_card import RUNNERS_PER_RACE, _reset_schema, _seed_days
+
+    db_engine = create_async_engine(database_url)
+    session_maker = async_sessionmaker(db_engine, expire_on_commit=False)
+    today = date.today()
+    try:
+        await _reset_schema(db_engine, plain=True)
+        history_days = [today - timedelta(days=3 * (i + 1)) for i in range(100)]
+        next_race_id = await _seed_days(db_engine, [today] + history_days, 1)
+
+        # Race context assembly against a race with 100 days of history
+        async def assemble() -> None:
+            async with session_maker() as db:
+                await build_race_context(db, 1)
+
+        results["race_context_build_db"] = _summarize(await _time_async(assemble, repeat=50))
+
+        # Entry sync: KRA stand-in -> parse -> KRASyncService.apply_entry_updates
+        # (diff, commit, cache invalidation, event publish, stale check) for a
+        # 16-runner card whose odds move on every sync
+        race_day = today + timedelta(days=1)
+        sync_race_id = await _seed_days(db_engine, [race_day], next_race_id) - 1
+        async with session_maker() as db:
+            race = await db.get(Race, sync_race_id)
+            race.race_status = "scheduled"
+            now = datetime.utcnow()
+            await db.execute(insert(RaceEntry), [
+                {
+                    "race_id": sync_race_id, "race_date": race_day, "gate_number": gate,
+                    "horse_id": gate, "jockey_id": gate, "trainer_id": gate,
+                    "scratched": False, "created_at": now, "updated_at": now,
+                }
+                for gate in range(RUNNERS_PER_RACE + 1, 17)
+            ])
+            await db.commit()
+            track_id, race_number = race.race_track_id, race.race_number
+
+        fixtures = load_fixtures()
+        recorded = json.loads(fixtures[ENTRIES_ENDPOINT])
+        for item in _items(recorded):
+            item["winOdds"] = round(item["winOdds"] * 1.5, 1)
+        odds_moves = [fixtures[ENTRIES_ENDPOINT], json.dumps(recorded).encode()]
+        # Redis (cache, events) is used when reachable; its warnings are noise here
+        logging.getLogger("app").setLevel(logging.ERROR)
+        sync_service = KRASyncService()
+        syncs = 0
+
+        async with KRAStubServer(fixtures) as stub:
+            sync_service.client.base_url = stub.base_url
+
+            async def sync_entries() -> None:
+                nonlocal syncs
+                stub.fixtures[ENTRIES_ENDPOINT] = odds_moves[syncs % 2]
+                syncs += 1
+                data = await sync_service.client.get_race_entries(race_day, track_id, race_number)
+                rows = [_entry_row(item) for item in _items(data)]
+                async with session_maker() as db:
+                    race = (await sync_service._load_races(db, race_day, track_id))[race_number]
+                    await sync_service.apply_entry_updates(db, race, rows)
+
+            summary = _summarize(await _time_async(sync_entries, repeat=100), ops_per_sample=16)
+        results["db_sync_entries_rows"] = summary
+
+        # Combination book persistence (COPY)
+        entry_ids = list(range(1, 17))
+        book = [
+            CombinationRow(entries=combo, probability=0.0003, confidence_level="low")
+            for combo in enumerate_combinations(entry_ids, "trifecta")
+        ]
+
+        async def persist_book() -> None:
+            async with session_maker() as db:
+                prediction = Prediction(
+                    race_id=1, race_date=today, prediction_type="trifecta",
+                    model_version="benchmark", prediction_data={},
+                )
+                db.add(prediction)
+                await db.flush()
+                await bulk_insert_combinations(db, prediction, book)
+                await db.commit()
+
+        results["db_ingest_trifecta_book_rows"] = _summarize(
+            await _time_async(persist_book, repeat=20), ops_per_sample=len(book)
+        )
+    finally:
+        await db_engine.dispose()
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def run(database_url: Optional[str]) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    bench_context_and_combinations(results)
+    bench_prompt_and_parse(results)
+    await bench_kra_client(results)
+    if database_url:
+        await bench_database(results, database_url)
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the hot-path benchmark suite")
+    parser.add_argument("--database-url", help="Scratch database for DB benchmarks (reset!)")
+    parser.add_argument("--output", type=Path, help="Result file (default: results/<commit>.json)")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.database_url))
+    output = args.output or RESULTS_DIR / f"{report['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+
+    for name, result in report["results"].items():
+        if "skipped" in result:
+            print(f"{name:<36} skipped: {result['skipped']}")
+        else:
+            print(f"{name:<36} {result['ops_per_sec']:>12.2f} ops/s  p50 {result['p50_ms']:.4f} ms")
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+SSE fan-out load test.
+경주 이벤트 SSE 동시 구독 부하 테스트
+
+Opens thousands of concurrent SSE subscriptions to one race on a running API
+worker, publishes events straight to Redis and measures delivery and latency::
+
+    uvicorn app.main:app --workers 1 &
+    python -m benchmarks.sse_fanout --base-url http://localhost:8000 \\
+        --race-id 1 --subscribers 5000 --events 20
+
+Raise the open-file limit first (``ulimit -n 65536``) for large runs.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import List
+
+import httpx
+import orjson
+import redis.asyncio as aioredis
+
+from app.core.pubsub import publish_race_event
+
+CONNECT_TIMEOUT_SECONDS = 60
+
+
+async def _subscriber(
+    client: httpx.AsyncClient,
+    url: str,
+    expected: int,
+    connected: asyncio.Event,
+    counter: List[int],
+    total: int,
+    latencies: List[float]
+) -> int:
+    received = 0
+    async with client.stream("GET", url) as response:
+        counter[0] += 1
+        if counter[0] == total:
+            connected.set()
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            data = orjson.loads(line[6:])
+            latencies.append((time.time() - data["sent_at"]) * 1000)
+            received += 1
+            if received == expected:
+                break
+    return received
+
+
+async def run(base_url: str, redis_url: str, race_id: int, subscribers: int, events: int) -> dict:
+    url = f"{base_url}/api/v1/races/{race_id}/events"
+    limits = httpx.Limits(max_connections=subscribers, max_keepalive_connections=0)
+    timeout = httpx.Timeout(None, connect=CONNECT_TIMEOUT_SECONDS)
+    connected = asyncio.Event()
+    counter = [0]
+    latencies: List[float] = []
+
+    async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+        started = time.perf_counter()
+        tasks = [
+            asyncio.create_task(
+                _subscriber(client, url, events, connected, counter, subscribers, latencies)
+            )
+            for _ in range(subscribers)
+        ]
+        await asyncio.wait_for(connected.wait(), timeout=CONNECT_TIMEOUT_SECONDS * 2)
+        connect_seconds = time.perf_counter() - started
+        # Give the server a moment to register the last subscriptions
+        await asyncio.sleep(1.0)
+
+        redis = aioredis.from_url(redis_url)
+        try:
+            for seq in range(events):
+                await publish_race_event(redis, race_id, "odds", {"seq": seq, "sent_at": time.time()})
+                await asyncio.sleep(0.05)
+        finally:
+            await redis.aclose()
+
+        received = await asyncio.gather(*tasks, return_exceptions=True)
+
+    delivered = sum(r for r in received if isinstance(r, int))
+    latencies.sort()
+    result = {
+        "subscribers": subscribers,
+        "events": events,
+        "delivered": delivered,
+        "expected": subscribers * events,
+        "connect_seconds": round(connect_seconds, 2),
+        "latency_p50_ms": round(statistics.median(latencies), 2) if latencies else None,
+        "latency_p99_ms": round(latencies[int(len(latencies) * 0.99) - 1], 2) if latencies else None,
+        "errors": sum(1 for r in received if isinstance(r, Exception)),
+    }
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SSE fan-out load test")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/0")
+    parser.add_argument("--race-id", type=int, default=1)
+    parser.add_argument("--subscribers", type=int, default=2000)
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--output", help="Write results as JSON")
+    args = parser.parse_args()
+
+    result = asyncio.run(
+        run(args.base_url, args.redis_url, args.race_id, args.subscribers, args.events)
+    )
+    print(json.dumps(result, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Today's-card latency vs. history size benchmark.
+누적 이력 증가에 따른 당일 경주 조회 지연 시간 측정
+
+Seeds synthetic seasons into a scratch database and times the queries behind
+the race-day card (races by date + entries of each race) after each step.
+With race_entries as a hypertable the timings should stay flat as history grows.
+
+    python -m benchmarks.today_card --database-url postgresql+asyncpg://.../bench_db \\
+        --seasons 1 3 5 10 [--plain]
+
+WARNING: drops and recreates all tables in the target database.
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
+
+from app.db.session import Base
+from app.db.timescale import setup_hypertables
+from app.models import Race, RaceEntry
+
+RACE_DAYS_PER_SEASON = 100
+RACES_PER_DAY = 12
+RUNNERS_PER_RACE = 12
+TRACK_IDS = (1, 2, 3)
+POOL_SIZE = 2000
+QUERY_REPEATS = 50
+
+
+async def _reset_schema(db_engine: AsyncEngine, plain: bool) -> None:
+    async with db_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    if not plain:
+        await setup_hypertables(db_engine)
+
+    now = datetime.utcnow()
+    async with db_engine.begin() as conn:
+        raw = (await conn.get_raw_connection()).driver_connection
+        await raw.copy_records_to_table(
+            "race_tracks",
+            records=[(i, f"track-{i}", now, now) for i in TRACK_IDS],
+            columns=("id", "name_ko", "created_at", "updated_at"),
+        )
+        for table, number_column in (
+            ("horses", "registration_number"),
+            ("jockeys", "license_number"),
+            ("trainers", "license_number"),
+        ):
+            await raw.copy_records_to_table(
+                table,
+                records=[(i, f"{table}-{i}", f"{table}-{i}", now, now) for i in range(1, POOL_SIZE + 1)],
+                columns=("id", number_column, "name_ko", "created_at", "updated_at"),
+            )
+
+
+async def _seed_days(db_engine: AsyncEngine, days: List[date], first_race_id: int) -> int:
+    """Insert races and entries for the given days, returning the next race id."""
+    rng = random.Random(first_race_id)
+    now = datetime.utcnow()
+    race_id = first_race_id
+    races, entries = [], []
+    for race_day in days:
+        for track_id in TRACK_IDS:
+            for race_number in range(1, RACES_PER_DAY + 1):
+                races.append((race_id, track_id, race_day, race_number, "completed", now, now))
+                for gate in range(1, RUNNERS_PER_RACE + 1):
+                    entries.append((
+                        race_id, race_day, gate,
+                        rng.randint(1, POOL_SIZE), rng.randint(1, POOL_SIZE), rng.randint(1, POOL_SIZE),
+                        gate, False, now, now,
+                    ))
+                race_id += 1
+
+    async with db_engine.begin() as conn:
+        raw = (await conn.get_raw_connection()).driver_connection
+        await raw.copy_records_to_table(
+            "races",
+            records=races,
+            columns=("id", "race_track_id", "race_date", "race_number", "race_status",
+                     "created_at", "updated_at"),
+        )
+        await raw.copy_records_to_table(
+            "race_entries",
+            records=entries,
+            columns=("race_id", "race_date", "gate_number", "horse_id", "jockey_id",
+                     "trainer_id", "finish_position", "scratched", "created_at", "updated_at"),
+        )
+        await conn.exec_driver_sql("ANALYZE races")
+        await conn.exec_driver_sql("ANALYZE race_entries")
+    return race_id
+
+
+async def _time_today_card(db_engine: AsyncEngine, today: date) -> dict:
+    samples = []
+    async with db_engine.connect() as conn:
+        for _ in range(QUERY_REPEATS):
+            started = time.perf_counter()
+            races = (await conn.execute(
+                select(Race.id, Race.race_date)
+                .where(Race.race_date == today)
+                .order_by(Race.race_track_id, Race.race_number)
+            )).all()
+            for race in races:
+                await conn.execute(
+                    select(RaceEntry.id, RaceEntry.gate_number, RaceEntry.horse_id)
+                    .where(RaceEntry.race_id == race.id, RaceEntry.race_date == race.race_date)
+                    .order_by(RaceEntry.gate_number)
+                )
+            samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "p50_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 3),
+    }
+
+
+async def run(database_url: str, seasons: List[int], plain: bool) -> List[dict]:
+    db_engine = create_async_engine(database_url)
+    today = date.today()
+    results = []
+    try:
+        await _reset_schema(db_engine, plain)
+        next_race_id = await _seed_days(db_engine, [today], 1)
+        seeded_seasons = 0
+        for target in sorted(seasons):
+            days = [
+                today - timedelta(days=3 + i * 3)
+                for i in range(seeded_seasons * RACE_DAYS_PER_SEASON, target * RACE_DAYS_PER_SEASON)
+            ]
+            next_race_id = await _seed_days(db_engine, days, next_race_id)
+            seeded_seasons = target
+            timing = await _time_today_card(db_engine, today)
+            results.append({"seasons": target, "races": next_race_id - 1, **timing})
+            print(f"seasons={target:>3} races={next_race_id - 1:>8} "
+                  f"p50={timing['p50_ms']:.2f}ms p95={timing['p95_ms']:.2f}ms")
+    finally:
+        await db_engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--database-url", required=True, help="Scratch database URL")
+    parser.add_argument("--seasons", type=int, nargs="+", default=[1, 3, 5, 10])
+    parser.add_argument("--plain", action="store_true", help="Skip hypertable conversion")
+    parser.add_argument("--output", help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.database_url, args.seasons, args.plain))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"plain": args.plain, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Tests for re-prediction significance rules.
+"""
+from decimal import Decimal
+
+import pytest
+
+from app.services.kra_sync_service import EntryChange
+from app.services.prediction_dependency_service import (
+    ENTRY_FIELD_RULES,
+    FieldRule,
+    RACE_FIELD_RULES,
+    significant_changes,
+    snapshot_changes,
+)
+
+HORSE_WEIGHT_KG = ENTRY_FIELD_RULES["horse_weight_kg"].absolute
+
+
+def snapshot(**entry):
+    used = {
+        "scratched": False,
+        "morning_odds": 4.0,
+        "final_odds": None,
+        "horse_weight_kg": 480.0,
+        "handicap_weight_kg": 54.0,
+    }
+    used.update(entry)
+    return {
+        "race": {
+            "track_condition": "양호",
+            "weather": "맑음",
+            "distance": 1200,
+            "surface_type": "모래",
+        },
+        "entries": {"1": used},
+    }
+
+
+def change(**fields):
+    return EntryChange(entry_id=1, gate_number=3, changes=fields)
+
+
+class TestFieldRule:
+    def test_unchanged_value_is_not_significant(self):
+        assert not FieldRule().is_significant("양호", "양호")
+        assert not FieldRule(absolute=1.0).is_significant(54.0, Decimal("54.0"))
+
+    def test_categorical_rule_flags_any_change(self):
+        assert FieldRule().is_significant("양호", "불량")
+        assert FieldRule().is_significant(False, True)
+
+    @pytest.mark.parametrize("used, current", [(None, 4.0), (4.0, None), (None, "불량")])
+    def test_none_on_either_side_is_significant(self, used, current):
+        assert FieldRule(relative=0.25).is_significant(used, current)
+
+    def test_absolute_threshold_edges(self):
+        rule = FieldRule(absolute=6.0)
+        assert not rule.is_significant(480, 485.9)
+        assert rule.is_significant(480, 486)
+        assert rule.is_significant(480, 474)
+
+    def test_relative_threshold_edges(self):
+        rule = FieldRule(relative=0.25)
+        assert not rule.is_significant(4.0, 4.99)
+        assert rule.is_significant(4.0, 5.0)
+        assert rule.is_significant(4.0, 3.0)
+
+    def test_relative_threshold_ignores_zero_baseline(self):
+        assert not FieldRule(relative=0.25).is_significant(0, 5.0)
+
+
+class TestSignificantChanges:
+    def test_no_changes(self):
+        assert significant_changes(snapshot()) == []
+
+    def test_categorical_race_field(self):
+        reasons = significant_changes(snapshot(), race_changes={"track_condition": ("양호", "불량")})
+        assert reasons == [{"field": "track_condition", "used": "양호", "now": "불량"}]
+
+    def test_untracked_race_field_is_ignored(self):
+        assert significant_changes(snapshot(), race_changes={"start_time": (None, "10:30")}) == []
+        assert "start_time" not in RACE_FIELD_RULES
+
+    def test_race_change_back_to_used_value(self):
+        assert significant_changes(snapshot(), race_changes={"weather": ("흐림", "맑음")}) == []
+
+    def test_final_odds_appearing_near_morning_odds(self):
+        reasons = significant_changes(snapshot(), entry_changes=[change(final_odds=(None, Decimal("4.5")))])
+        assert reasons == []
+
+    def test_final_odds_appearing_far_from_morning_odds(self):
+        reasons = significant_changes(snapshot(), entry_changes=[change(final_odds=(None, Decimal("6.0")))])
+        assert reasons == [{
+            "field": "odds", "entry_id": 1, "gate_number": 3, "used": 4.0, "now": 6.0,
+        }]
+
+    def test_final_odds_compared_with_used_final_odds(self):
+        used = snapshot(final_odds=8.0)
+        assert significant_changes(used, entry_changes=[change(final_odds=(7.5, 9.0))]) == []
+        assert significant_changes(used, entry_changes=[change(final_odds=(7.5, 10.0))])
+
+    def test_morning_odds_ignored_once_final_odds_used(self):
+        used = snapshot(final_odds=8.0)
+        assert significant_changes(used, entry_changes=[change(morning_odds=(4.0, 20.0))]) == []
+
+    def test_first_odds_for_unpriced_runner(self):
+        used = snapshot(morning_odds=None)
+        reasons = significant_changes(used, entry_changes=[change(final_odds=(None, 3.0))])
+        assert [r["field"] for r in reasons] == ["odds"]
+
+    def test_cumulative_drift_is_measured_from_snapshot(self):
+        # Each sync moved the price a little; the total move since the prediction counts
+        reasons = significant_changes(snapshot(), entry_changes=[change(morning_odds=(4.8, 5.1))])
+        assert [r["field"] for r in reasons] == ["odds"]
+
+    def test_horse_weight_threshold(self):
+        small = change(horse_weight_kg=(480, Decimal("485")))
+        large = change(horse_weight_kg=(480, Decimal("486")))
+        assert significant_changes(snapshot(), entry_changes=[small]) == []
+        reasons = significant_changes(snapshot(), entry_changes=[large])
+        assert reasons[0]["used"] == 480.0
+        assert reasons[0]["now"] == 480.0 + HORSE_WEIGHT_KG
+
+    def test_scratch_is_significant(self):
+        reasons = significant_changes(snapshot(), entry_changes=[change(scratched=(False, True))])
+        assert reasons[0]["field"] == "scratched"
+
+    def test_untracked_entry_field_is_ignored(self):
+        assert significant_changes(snapshot(), entry_changes=[change(finish_position=(None, 1))]) == []
+
+    def test_entry_missing_from_snapshot(self):
+        reasons = significant_changes(
+            snapshot(),
+            entry_changes=[EntryChange(entry_id=2, gate_number=4, changes={"final_odds": (None, 4.0)})],
+        )
+        assert [r["field"] for r in reasons] == ["final_odds"]
+
+    def test_legacy_prediction_without_snapshot(self):
+        reasons = significant_changes(
+            None,
+            race_changes={"weather": ("맑음", "비")},
+            entry_changes=[change(handicap_weight_kg=(54, 54.5))],
+        )
+        assert [r["field"] for r in reasons] == ["weather", "handicap_weight_kg"]
+
+
+def committed(**entry):
+    values = snapshot(**entry)
+    values["entries"]["1"]["gate_number"] = 3
+    return values
+
+
+class TestSnapshotChanges:
+    def test_nothing_committed_since(self):
+        assert snapshot_changes(snapshot(), committed()) == []
+
+    def test_sync_committed_while_predicting(self):
+        now = committed(final_odds=6.0)
+        now["race"]["track_condition"] = "불량"
+        reasons = snapshot_changes(snapshot(), now)
+        assert reasons == [
+            {"field": "track_condition", "used": "양호", "now": "불량"},
+            {"field": "odds", "entry_id": 1, "gate_number": 3, "used": 4.0, "now": 6.0},
+        ]
+
+    def test_small_moves_are_ignored(self):
+        now = committed(final_odds=Decimal("4.4"), horse_weight_kg=Decimal("482"))
+        assert snapshot_changes(snapshot(), now) == []
+
+    def test_scratch_committed_while_predicting(self):
+        reasons = snapshot_changes(snapshot(), committed(scratched=True))
+        assert [(r["field"], r["gate_number"]) for r in reasons] == [("scratched", 3)]
+
+    def test_entry_added_while_predicting(self):
+        now = committed()
+        now["entries"]["2"] = dict(now["entries"]["1"], gate_number=4)
+        reasons = snapshot_changes(snapshot(), now)
+        assert {r["entry_id"] for r in reasons} == {2}
+        assert {r["gate_number"] for r in reasons} == {4}
+
+    def test_entry_removed_since_is_ignored(self):
+        now = committed()
+        now["entries"] = {}
+        assert snapshot_changes(snapshot(), now) == []
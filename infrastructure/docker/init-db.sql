@@ -3,3 +3,7 @@ CREATE EXTENSION IF NOT EXISTS timescaledb;
 
 -- Create initial schema (detailed schema will be managed by Alembic)
 -- This is just for initial setup
+
+-- race_entries / predictions are converted to hypertables (partitioned by
+-- race_date, compressed after HISTORY_COMPRESS_AFTER_DAYS) once the tables exist:
+--   cd backend && python -m app.db.timescale
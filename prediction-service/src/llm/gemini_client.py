@@ -10,6 +10,8 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 import os
 from dotenv import load_dotenv
 
+from src.tracing import tracer
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -67,18 +69,28 @@ class GeminiClient:
 
             # Generate response
             logger.info(f"Generating {prediction_type} prediction with Gemini")
-            response = await self.model.generate_content_async(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,  # Lower temperature for more deterministic predictions
-                    top_p=0.95,
-                    top_k=40,
-                    max_output_tokens=2048,
+            with tracer.start_as_current_span(
+                "gemini.generate_content",
+                attributes={
+                    "llm.model": self.model_name,
+                    "prediction.type": prediction_type,
+                    "llm.prompt_chars": len(prompt),
+                },
+            ) as span:
+                response = await self.model.generate_content_async(
+                    prompt,
+                    generation_config=genai.types.GenerationConfig(
+                        temperature=0.3,  # Lower temperature for more deterministic predictions
+                        top_p=0.95,
+                        top_k=40,
+                        max_output_tokens=2048,
+                    )
                 )
-            )
+                span.set_attribute("llm.response_chars", len(response.text))
 
             # Parse response
-            prediction = self._parse_response(response.text)
+            with tracer.start_as_current_span("gemini.parse_response"):
+                prediction = self._parse_response(response.text)
 
             logger.info(f"Successfully generated {prediction_type} prediction")
             return prediction
@@ -0,0 +1,56 @@
+"""
+Prediction service API.
+LLM 예측 서비스 API
+"""
+import logging
+from typing import Dict, Any, Optional
+
+from fastapi import FastAPI
+from pydantic import BaseModel, ConfigDict
+
+from src.llm.gemini_client import gemini_client
+from src.tracing import setup_tracing, trace_requests
+
+logger = logging.getLogger(__name__)
+
+setup_tracing()
+
+app = FastAPI(title="Horserace Prediction Service")
+app.middleware("http")(trace_requests)
+
+
+class PredictRequest(BaseModel):
+    """예측 요청"""
+    race_context: Dict[str, Any]
+    prediction_type: str
+    system_prompt: Optional[str] = None
+
+
+class PredictResponse(BaseModel):
+    """예측 응답"""
+    model_config = ConfigDict(protected_namespaces=())
+
+    model_version: str
+    prediction: Dict[str, Any]
+
+
+@app.post("/predict", response_model=PredictResponse)
+async def predict(request: PredictRequest) -> PredictResponse:
+    """Generate a prediction for a race context."""
+    prediction = await gemini_client.generate_prediction(
+        request.race_context,
+        request.prediction_type,
+        request.system_prompt
+    )
+    return PredictResponse(model_version=gemini_client.model_name, prediction=prediction)
+
+
+@app.get("/health")
+async def health_check():
+    """Health check endpoint."""
+    return {"status": "healthy"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run("src.main:app", host="0.0.0.0", port=8001)
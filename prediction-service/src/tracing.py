@@ -0,0 +1,56 @@
+"""
+Request tracing for the prediction service (OpenTelemetry).
+예측 서비스 요청 추적
+
+Continues the backend's trace from the incoming ``traceparent`` header so the
+Gemini call shows up under the backend request. Spans go to the OTLP collector
+in OTEL_EXPORTER_OTLP_ENDPOINT, or to TRACE_EXPORT_FILE as JSON lines.
+"""
+import logging
+import os
+
+from opentelemetry import propagate, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+logger = logging.getLogger(__name__)
+
+tracer = trace.get_tracer("horserace.prediction_service")
+
+
+def setup_tracing(service_name: str = "horserace-prediction-service"):
+    """Configure the global tracer provider (disabled with TRACING_ENABLED=false)."""
+    if os.getenv("TRACING_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+
+    provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+    endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+    if endpoint:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        exporter = OTLPSpanExporter(endpoint=f"{endpoint}/v1/traces")
+    else:
+        exporter = ConsoleSpanExporter(
+            out=open(os.getenv("TRACE_EXPORT_FILE", "traces.jsonl"), "a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + "\n",
+        )
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    logger.info(f"Tracing enabled for {service_name}")
+    return provider
+
+
+async def trace_requests(request, call_next):
+    """HTTP middleware: server span continuing the caller's trace context."""
+    with tracer.start_as_current_span(
+        f"{request.method} {request.url.path}",
+        context=propagate.extract(request.headers),
+        kind=SpanKind.SERVER,
+        attributes={"http.method": request.method, "http.target": request.url.path},
+    ) as span:
+        response = await call_next(request)
+        span.set_attribute("http.status_code", response.status_code)
+        if response.status_code >= 500:
+            span.set_status(Status(StatusCode.ERROR))
+        return response